@@ -1,17 +1,27 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-import sympy as sp
-from PIL import Image
+
+from nucleo.ativos import imagem
+from nucleo.forcada import blocos_alinhados, modelo_pista, pista_eixos, resposta_forcada_decimada
+from nucleo.frf import pico_transmissibilidade_lote
+from nucleo.grafo import grafo_da_sessao, grafo_mdof
+from nucleo.graficos import grafico_mapa_frequencias, grafico_resposta
+from nucleo.mdof import (GDL, PARAMETROS, distancia_entre_eixos, frequencias_naturais_lote,
+                         grade_parametros)
+from nucleo.perfil import etapa, painel_perfil, perfil_da_pagina
 
 # Configuração inicial
 st.set_page_config(layout="wide")
 st.title("Simulador de Vibração Veicular MDOF")
 st.markdown("Modelo com carga na caçamba, chassi, motorista e eixos com molas.")
+perfil = perfil_da_pagina("mdof")
 
 # Mostra imagem
-image = Image.open("modelo.png")
-st.image(image, caption="Esquema do modelo físico", use_column_width=True)
+image = imagem("modelo.png")
+if image is not None:
+    st.image(image, caption="Esquema do modelo físico", use_column_width=True)
+else:
+    st.info("Imagem do modelo (modelo.png) não encontrada no diretório.")
 
 # Entradas
 st.sidebar.header("Parâmetros do Sistema")
@@ -32,95 +42,138 @@ k7 = st.sidebar.number_input("Rigidez k7 (pneus traseiros)", 100.0, 10000.0, 100
 
 a = st.sidebar.number_input("Distância a", 0.01, 1.0, 0.1)
 b = st.sidebar.number_input("Distância b", 0.01, 1.0, 0.1)
-c = st.sidebar.number_input("Distância c", 0.01, 1.0, 0.1)
+c = st.sidebar.number_input("Distância c", 0.01, 1.0, 0.3)
 d = st.sidebar.number_input("Distância d", 0.01, 1.0, 0.1)
 e = st.sidebar.number_input("Distância e", 0.01, 1.0, 0.1)
 f = st.sidebar.number_input("Distância f", 0.01, 1.0, 0.1)
 g = st.sidebar.number_input("Distância g", 0.01, 1.0, 0.1)
 
+t_final = st.sidebar.number_input("Duração da simulação (s)", 0.1, 36_000.0, 5.0)
+n_amostras = st.sidebar.number_input("Número de amostras", 100, 1_000_000_000, 5000)
+
+# Resposta em frequência
+st.sidebar.header("Resposta em Frequência")
+PISTA = "Pista (pneus x4/x5)"
+entrada_frf = st.sidebar.selectbox("Entrada", [PISTA, *(f"Força em {n}" for n in GDL)])
+saidas_frf = st.sidebar.multiselect("Saídas", GDL, default=["x3"])
+zeta_frf = st.sidebar.number_input("Amortecimento modal ζ", 0.0, 1.0, 0.05)
+f_max_frf = st.sidebar.number_input("Frequência máxima (Hz)", 0.1, 10_000.0, 50.0)
+n_freq = st.sidebar.number_input("Pontos de frequência", 100, 10_000_000, 100_000)
+base = dict(zip(PARAMETROS, (a, b, c, d, e, f, g, k1, k2, k3, k4, k5, k6, k7,
+                             m1, m2, m3, m4, m5)))
+
+# Cálculos em etapas memorizadas (matrizes → modos → resposta → gráfico): um
+# widget alterado só refaz as etapas que dependem dele
+grafo = grafo_da_sessao("mdof", grafo_mdof)
+grafo.definir(parametros=base, t_final=t_final, n_amostras=int(n_amostras),
+              f_max_frf=f_max_frf, n_freq=int(n_freq),
+              entrada=None if entrada_frf == PISTA else entrada_frf.removeprefix("Força em "),
+              saidas_frf=tuple(saidas_frf), zeta_frf=zeta_frf)
+
+etapa("cabeçalho e entradas")
+
+# Estudo paramétrico
+st.sidebar.header("Estudo Paramétrico")
+varridos = st.sidebar.multiselect("Parâmetros a varrer", PARAMETROS)
+faixas = {}
+for p in varridos:
+    col_min, col_max, col_n = st.sidebar.columns(3)
+    valor = float(base[p])
+    p_min = col_min.number_input(f"{p} mín", value=0.5 * valor, format="%g")
+    p_max = col_max.number_input(f"{p} máx", value=1.5 * valor, format="%g")
+    p_n = col_n.number_input(f"{p} pontos", 2, 1000, 20)
+    faixas[p] = np.linspace(p_min, p_max, int(p_n))
+
+if varridos and st.sidebar.button("Varrer Parâmetros"):
+
+    grade = grade_parametros(base, faixas)
+    fn_mapa = frequencias_naturais_lote(**grade)
+
+    st.subheader(f"Mapa de Frequências Naturais ({fn_mapa.shape[0]:,} configurações)")
+    st.image(grafico_mapa_frequencias(grade[varridos[0]], fn_mapa, varridos[0]))
+
+    if saidas_frf:
+        picos, f_picos = pico_transmissibilidade_lote(grafo["frequencias"], GDL.index(saidas_frf[0]),
+                                                      zeta_frf, **grade)
+        melhores = np.argsort(picos)[:10]
+        st.subheader(f"Menor Pico de Transmissibilidade Pista → {saidas_frf[0]}")
+        st.table({**{p: grade[p][melhores] for p in varridos},
+                  "|T| máx": picos[melhores], "f do pico (Hz)": f_picos[melhores]})
+    etapa("estudo paramétrico")
+
 if st.sidebar.button("Calcular e Simular"):
 
-    # Variáveis simbólicas
-    symbs = sp.symbols('a b c d e f g k1 k2 k3 k4 k5 k6 k7 m1 m2 m3 m4 m5 I1 I2')
-    vals = [a, b, c, d, e, f, g, k1, k2, k3, k4, k5, k6, k7, m1, m2, m3, m4, m5,
-            (1/3)*m1*a**2, (1/3)*m2*b**2]
-    subs = dict(zip(symbs, vals))
-
-    # Importa as equações do modelo simbólico (usa teu código que gera M e K)
-    from sympy import symbols, zeros, expand, collect
-    xg2, tet2, xg1, tet1, x3, x4, x5 = symbols('xg2 tet2 xg1 tet1 x3 x4 x5')
-    ag2, ate2, ag1, ate1, a3, a4, a5 = symbols('ag2 ate2 ag1 ate1 a3 a4 a5')
-    xf = xg2 - a * tet2
-    xh = xg2 + b * tet2
-    xa = xg1 + c * tet1
-    xb = xg1 + d * tet1
-    xc = xg1 + e * tet1
-    xd = xg1 + f * tet1
-    xe = xg1 - g * tet1
-    FM1 = k1 * (xf - xc)
-    FM2 = k2 * (xh - xd)
-    FM3 = k3 * xe
-    FM4 = k4 * (xb - x4)
-    FM5 = k5 * x4
-    FM6 = k6 * (xa - x5)
-    FM7 = k7 * x5
-    eq1 = -FM6 + FM1 + FM2 + FM3 - FM4 - m2 * ag2
-    eq2 = -FM6*c + FM1*a + FM2*b - FM3*g - (1/3)*m2*b**2 * ate2
-    eq3 = -FM1 - FM2 - m1 * ag1
-    eq4 = -FM1*a + FM2*b - (1/3)*m1*a**2 * ate1
-    eq5 = -FM3 - m3 * a3
-    eq6 = FM4 - FM5 - m4 * a4
-    eq7 = FM6 - FM7 - m5 * a5
-
-    VAR_D = [xg2, tet2, xg1, tet1, x3, x4, x5]
-    VAR_A = [ag2, ate2, ag1, ate1, a3, a4, a5]
-
-    EQ = [eq1, eq2, eq3, eq4, eq5, eq6, eq7]
-    EQ = [-expand(eq) for eq in EQ]
-    for i in range(7):
-        for j in range(7):
-            EQ[i] = collect(EQ[i], VAR_D[j])
-
-    Mmat = zeros(7)
-    Kmat = zeros(7)
-    for i in range(7):
-        Mmat[i, i] = EQ[i].coeff(VAR_A[i], 1)
-        for j in range(7):
-            Kmat[i, j] = EQ[i].coeff(VAR_D[j], 1)
-
-    Mnum = np.array(Mmat.subs(subs).evalf().tolist(), dtype=float)
-    Knum = np.array(Kmat.subs(subs).evalf().tolist(), dtype=float)
-
-    A = np.linalg.pinv(Mnum) @ Knum
-    VAL, VET = np.linalg.eig(A)
-    wn = np.sqrt(np.abs(VAL))
+    # Matrizes e modos
+    wn, VET = grafo["modos"]
     fn = wn / (2 * np.pi)
-    valid = wn > 1e-5
-    wn, fn = wn[valid], fn[valid]
-    VET = VET[:, valid]
 
     st.subheader("Frequências Naturais (Hz)")
     st.write(fn)
+    etapa("análise modal")
 
-    # Resposta em vibração livre
-    t = np.linspace(0, 5, 5000)
-    X0 = np.linspace(0.01, 0.05, VET.shape[0]).reshape(-1, 1)
-    V0 = np.linspace(1, 5, VET.shape[0]).reshape(-1, 1)
-    freq_inv = np.diag(np.where(wn != 0, 1 / wn, 0))
-    Mdiag = VET.T @ Mnum @ VET
-    VETn = VET / np.sqrt(np.diag(Mdiag))[np.newaxis, :]
-    MAT1 = VETn.T @ Mnum @ X0
-    MAT2 = freq_inv @ VETn.T @ Mnum @ V0
-    Cs = np.cos(np.outer(wn, t))
-    Sn = np.sin(np.outer(wn, t))
-    response = VETn @ (Cs * MAT1 + Sn * MAT2)
-
+    # Resposta em vibração livre (avaliada em blocos e decimada para o gráfico)
     st.subheader("Resposta em Vibração Livre")
-    fig, ax = plt.subplots(figsize=(10, 4))
-    for i in range(response.shape[0]):
-        ax.plot(t, response[i], label=f'x{i+1}')
-    ax.set_xlabel("Tempo (s)")
-    ax.set_ylabel("Deslocamento (m)")
-    ax.legend()
-    ax.grid()
-    st.pyplot(fig)
+    st.image(grafo["grafico_livre"])
+    etapa("resposta livre")
+
+    # FRFs por superposição modal: a grade inteira numa só operação
+    if saidas_frf:
+        st.subheader(f"Funções de Resposta em Frequência — {entrada_frf}")
+        st.image(grafo["grafico_frf"])
+        etapa("FRF")
+
+# Resposta forçada pelo perfil da pista (pneus k5/k7, eixo traseiro atrasado)
+with st.expander("🛣️ Resposta Forçada ao Perfil da Pista"):
+    st.caption("Perfil sob o eixo dianteiro (m), uma amostra por linha (.csv/.txt) ou vetor .npy. "
+               "Sem arquivo, usa uma lombada senoidal de 5 cm.")
+    arquivo_pista = st.file_uploader("Perfil da pista", type=["csv", "txt", "npy"])
+    col1, col2, col3 = st.columns(3)
+    dt_pista = col1.number_input("Intervalo entre amostras (s)", 1e-5, 1.0, 1e-3, format="%g")
+    velocidade = col2.number_input("Velocidade (m/s)", 0.1, 100.0, 10.0)
+    # k4 e k6 ficam no mesmo corpo, a d e c do centro: o padrão é |d − c|
+    try:
+        entre_eixos_modelo = distancia_entre_eixos(c, d)
+    except ValueError as erro:
+        entre_eixos_modelo = None
+        st.warning(f"⚠️ Geometria degenerada: {erro}. Informe o entre-eixos.")
+    entre_eixos = col3.number_input("Entre-eixos (m)", 0.01, 20.0, entre_eixos_modelo)
+    tipo_amortecimento = st.radio("Amortecimento", ["Modal (ζ)", "Por mola (c1..c7)"], horizontal=True)
+    if tipo_amortecimento == "Modal (ζ)":
+        zeta = st.number_input("Razão de amortecimento ζ", 0.0, 1.0, 0.05)
+        amortecedores = None
+    else:
+        colunas = st.columns(7)
+        amortecedores = [col.number_input(f"c{i + 1} (N·s/m)", 0.0, 1e5, 50.0)
+                         for i, col in enumerate(colunas)]
+        zeta = None
+
+    simular_pista = st.button("Simular Pista")
+    if simular_pista and entre_eixos is None:
+        st.error("❌ Informe o entre-eixos para simular a pista.")
+    elif simular_pista:
+        if arquivo_pista is None:
+            t_pista = np.arange(0.0, t_final, dt_pista)
+            largura_lombada = 0.5 / velocidade
+            pista = np.where(t_pista < largura_lombada,
+                             0.05 * np.sin(np.pi * t_pista / largura_lombada), 0.0)
+        elif arquivo_pista.name.lower().endswith(".npy"):
+            pista = np.load(arquivo_pista).ravel()
+        else:
+            pista = np.genfromtxt(arquivo_pista, delimiter=",", usecols=0)
+            pista = pista[~np.isnan(pista)]
+
+        modelo_forcado = modelo_pista(base, dt_pista, zeta, amortecedores)
+        if modelo_forcado.instavel:
+            st.warning("⚠️ Com estes parâmetros o modelo tem modos instáveis: a resposta cresce sem limite.")
+        n_pista = pista.size
+        forcada = resposta_forcada_decimada(
+            modelo_forcado,
+            pista_eixos(blocos_alinhados(pista, n_pista), entre_eixos / velocidade / dt_pista),
+            n_pista)
+
+        st.image(grafico_resposta(forcada.t, forcada.resposta))
+        st.table({"GDL": [f"x{i + 1}" for i in range(forcada.rms.size)],
+                  "RMS (m)": forcada.rms, "Pico (m)": forcada.pico})
+        etapa("resposta forçada")
+
+painel_perfil(perfil)
@@ -1,6 +1,13 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+
+from nucleo.confiabilidade import Normal, probabilidade_falha
+from nucleo.goodman import CRITERIOS, avaliar_espectro, tensao_flexao
+from nucleo.graficos import grafico_espectro, grafico_goodman
+from nucleo.perfil import etapa, painel_perfil, perfil_da_pagina
+from nucleo.resultados import verificar_goodman
+
+perfil = perfil_da_pagina("tubo-redondo")
 
 st.title("🔧 Fadiga — Tubo Redondo (Ø20×0.9mm)")
 
@@ -13,29 +20,77 @@ n = st.number_input("Fator de Segurança", value=1.0)
 # Geometria
 D = 20.0
 esp = 0.9
-Di = D - 2*esp
-I = (np.pi / 64) * (D**4 - Di**4)
-c = D / 2
 
 # Cálculos
-sigma_n = M * c / I
-sigma_adm = (Se * Sut) / (n * (Sut - Se))
+sigma_n, sigma_adm, aprovado = verificar_goodman(M, "Redondo", D, esp, Sut, Se, n)
 
 st.subheader("📊 Resultados – Tubo Redondo")
 st.write(f"Tensão normal: **{sigma_n:.2f} MPa**")
 st.write(f"Tensão admissível (Goodman): **{sigma_adm:.2f} MPa**")
-if sigma_n <= sigma_adm:
+if aprovado:
     st.success("✅ Projeto aprovado")
 else:
     st.error("❌ Projeto reprovado")
 
+etapa("resultados")
+
 # Gráfico de Goodman
-sigma_a = np.linspace(0, Sut, 100)
-sigma_m = Se * (1 - sigma_a / Sut)
-plt.figure()
-plt.plot(sigma_a, sigma_m, label='Envelope Goodman')
-plt.axhline(sigma_n, color='r', linestyle='--', label='Tensão Normal')
-plt.xlabel("Tensão Alternada (MPa)")
-plt.ylabel("Tensão Média (MPa)")
-plt.legend()
-st.pyplot(plt)
+st.image(grafico_goodman(Se, Sut, float(sigma_n)))
+
+etapa("gráfico de Goodman")
+
+# Espectro de carga
+with st.expander("📈 Espectro de carga (Goodman, Gerber, ASME, Soderberg)"):
+    st.caption("CSV com duas colunas por ciclo: momento alternado e momento médio (N·mm).")
+    Sy = st.number_input("Sy (MPa)", value=0.65 * Sut)
+    arquivo = st.file_uploader("Arquivo de cargas", type=["csv", "txt"])
+    if arquivo is not None:
+        # Linhas com menos de duas colunas são puladas; um arquivo que nem
+        # assim dá uma tabela de duas colunas fica sem ciclos válidos
+        try:
+            cargas = np.genfromtxt(arquivo, delimiter=",", usecols=(0, 1),
+                                   invalid_raise=False).reshape(-1, 2)
+        except ValueError:
+            cargas = np.empty((0, 2))
+        cargas = cargas[~np.isnan(cargas).any(axis=1)]
+        if not cargas.size:
+            st.warning("⚠️ O arquivo não tem nenhum ciclo válido: use duas colunas numéricas "
+                       "(momento alternado, momento médio) por linha.")
+        else:
+            fator = float(tensao_flexao(1.0, "Redondo", D, esp))
+            sigma_a_esp, sigma_m_esp = cargas[:, 0] * fator, cargas[:, 1] * fator
+            espectro = avaliar_espectro(sigma_a_esp, sigma_m_esp, Se, Sut, Sy)
+
+            st.write(f"{sigma_a_esp.size:,} ciclos — critério governante: **{espectro.criterio}** "
+                     f"(n mínimo = {espectro.n_min.min():.2f})")
+            st.table({"Critério": list(CRITERIOS), "n mínimo": espectro.n_min.round(3)})
+            st.write("Pontos mais críticos:")
+            st.table({"σa (MPa)": sigma_a_esp[espectro.piores].round(2),
+                      "σm (MPa)": sigma_m_esp[espectro.piores].round(2),
+                      "n": espectro.n.min(axis=0)[espectro.piores].round(3)})
+            st.image(grafico_espectro(Se, Sut, Sy, sigma_m_esp, sigma_a_esp))
+
+etapa("espectro de carga")
+
+# Modo probabilístico
+with st.expander("🎲 Modo probabilístico (Monte Carlo)"):
+    st.caption("Entradas sorteadas de distribuições normais com os coeficientes de variação abaixo.")
+    col1, col2 = st.columns(2)
+    cov_M = col1.number_input("CV do momento (%)", 0.0, 100.0, 10.0) / 100
+    cov_esp = col2.number_input("CV da espessura (%)", 0.0, 100.0, 5.0) / 100
+    cov_Sut = col1.number_input("CV de Sut (%)", 0.0, 100.0, 5.0) / 100
+    cov_Se = col2.number_input("CV de Se (%)", 0.0, 100.0, 8.0) / 100
+    amostras_max = st.number_input("Máximo de amostras", 10_000, 1_000_000_000, 10_000_000, step=1_000_000)
+    if st.button("Estimar probabilidade de falha"):
+        r = probabilidade_falha("goodman", dict(
+            tipo_tubo="Redondo", dimensao=D, esp=Normal(esp, cov_esp * esp),
+            M=Normal(M, cov_M * abs(M), -np.inf), Sut=Normal(Sut, cov_Sut * Sut),
+            Se=Normal(Se, cov_Se * Se), n=n), amostras_max=int(amostras_max))
+        st.write(f"Probabilidade de falha: **{r.pf:.3e}** "
+                 f"(IC 95 %: {r.intervalo[0]:.2e} – {r.intervalo[1]:.2e})")
+        st.write(f"{r.amostras:,} amostras, {r.falhas:,} falhas, CV do estimador {r.cov:.1%}")
+        if not r.convergiu:
+            st.warning("⚠️ O limite de amostras foi atingido antes da convergência.")
+
+etapa("modo probabilístico")
+painel_perfil(perfil)
@@ -1,7 +1,17 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from PIL import Image
+
+from nucleo.ativos import imagem
+from nucleo.confiabilidade import Normal, probabilidade_falha
+from nucleo.grafo import grafo_da_sessao, grafo_iso7173
+from nucleo.iso7173 import ESPESSURAS_LISTA, ICONES, N_LISTA, SE, SUT, SY
+from nucleo.perfil import etapa, painel_perfil, perfil_da_pagina
+from nucleo.sequencia import (
+    CICLOS_PADRAO, ENSAIOS, F_PERNA_FRENTE, F_PERNA_LADO, FATOR_QUEDA, JUNTAS, PERNAS,
+    momentos_cadeira, relatorio_sequencia, simular_sequencia,
+)
+
+perfil = perfil_da_pagina("iso7173")
 
 # ========================
 # Título e descrição
@@ -20,12 +30,14 @@ Felipe Veiga - 01 de julho de 2025
 # ========================
 # Imagem
 # ========================
-try:
-    diagramas = Image.open("A_pair_of_technical_engineering_diagrams_in_black_.png")
+diagramas = imagem("A_pair_of_technical_engineering_diagrams_in_black_.png")
+if diagramas is not None:
     st.image(diagramas)
-except:
+else:
     st.info("Imagem de diagramas não encontrada no diretório. Coloque a imagem no mesmo repositório para visualização.")
 
+etapa("cabeçalho e imagem")
+
 # ========================
 # Entradas
 # ========================
@@ -34,65 +46,34 @@ tipo_tubo = st.selectbox("Tipo de tubo", ["Quadrado", "Redondo"])
 largura = st.number_input(
     "Largura (quadrado) ou diâmetro externo (redondo) do tubo horizontal (mm)",    value = 20)
 
-espessuras_lista = [0.60, 0.75, 0.90, 1.06, 1.20, 1.50, 1.90]
+espessuras_lista = list(ESPESSURAS_LISTA)
 espessura = st.selectbox(    "Espessura da parede do tubo vertical (mm):",    espessuras_lista,    index = 2)
 
-N_lista = [5_000, 12_500, 25_000, 50_000, 100_000, 200_000]
+N_lista = list(N_LISTA)
 N_desejado = st.selectbox(    "Número de Ciclos:",    N_lista,    index = 2)
 
 # ========================
 # Constantes materiais e do ensaio
 # ========================
-Sut = 310                     # MPa
-Sy = 0.65 * Sut               # MPa
-Se = 0.5 * Sut                # MPa
-a_ciclo = 1e6
-b_ciclo = 5
-
-# ========================
-# Cargas do ensaio ISO 7173
-# ========================
-F_vertical_per_foot = 237.5   # N
-F_horizontal = 165            # N
-
-# ========================
-# Momento gerado pelo tubo horizontal fixo
-# ========================
-q = 950                       # N/m
-L = 0.5                       # m
-
-M_fixo_horizontal = (q * L ** 2) / 12
-M_fixo_horizontal_Nmm = M_fixo_horizontal * 1_000
+Sut = SUT                     # MPa
+Sy = SY                       # MPa
 
 # ========================
-# Momento gerado pela força horizontal do encosto
+# Cálculos em etapas memorizadas: só o que depende do widget alterado é refeito
+# (cargas → seção → tensão → admissível → veredito → gráfico)
 # ========================
-altura_encosto = 750          # mm
-altura_assento = 450          # mm
+grafo = grafo_da_sessao("iso7173", grafo_iso7173)
+grafo.definir(tipo_tubo=tipo_tubo, largura=float(largura), espessura=espessura,
+              N=N_desejado, espessuras=tuple(espessuras_lista))
 
-braço_momento_encosto = (altura_encosto - altura_assento) / 1_000
-M_encosto = F_horizontal * braço_momento_encosto
-M_encosto_Nmm = M_encosto * 1_000
+# Momentos do ensaio ISO 7173 (tubo horizontal fixo + força do encosto)
+M_fixo_horizontal, M_encosto, M_total = grafo["cargas"]
 
-# ========================
-# Momento total na junta
-# ========================
-M_total = M_fixo_horizontal_Nmm + M_encosto_Nmm
-
-# ========================
-# Tensão na garganta da solda
-# ========================
-if tipo_tubo == 'Quadrado':
-    I_quadrado = largura * (largura ** 2) / 2
-    sigma_total = (M_total * largura / 2) / (0.707 * espessura * I_quadrado)
-else:
-    I_redondo = np.pi * (largura / 2) ** 3
-    sigma_total = (M_total * largura / 2) / (0.707 * espessura * I_redondo)
-
-# ========================
-# Cálculo da tensão de fadiga
-# ========================
-sigma_fadiga_admissivel = Se * (a_ciclo / N_desejado) ** (1 / b_ciclo)
+# Tensão na garganta da solda e tensão de fadiga admissível
+I_solda = float(grafo["secao"].I_solda)
+resultado = grafo["veredito"]
+sigma_total = resultado.sigma_total
+sigma_fadiga_admissivel = resultado.sigma_adm
 
 # ========================
 # Resultados
@@ -102,34 +83,17 @@ st.subheader("Resultados do Ensaio ISO 7173")
 st.write(f"Momento do tubo horizontal: {M_fixo_horizontal:.2f} Nm")
 st.write(f"Momento da força do encosto: {M_encosto:.2f} Nm")
 st.write(f"Tensão na garganta da solda: {sigma_total:.2f} MPa")
-st.write(f"Inercia Tubo Redondo: {I_redondo:.2f} MPa")
+st.write(f"Inércia da linha de solda: {I_solda:.2f} mm³")
 st.write(f"**Ciclos desejados:** {N_desejado:,}")
 st.write(f"Tensão de fadiga admissível para os ciclos: {sigma_fadiga_admissivel:.2f} MPa")
 
 # ========================
 # Análises
 # ========================
-if sigma_total < Sy:
-    st.success("✅ **APROVADO**: Não ocorre deformação permanente (Sy).")
-elif Sy <= sigma_total < Sut:
-    st.warning("⚠️ **ATENÇÃO**: Pode ocorrer deformação permanente, mas não ruptura imediata (entre Sy e Sut).")
-else:
-    st.error("❌ **FALHA**: Pode ocorrer ruptura sob carga estática (acima de Sut).")
-
-if sigma_fadiga_admissivel > Sut:
-    if sigma_total < Sut:
-        st.success(f"✅ A tensão de fadiga admissível calculada ({sigma_fadiga_admissivel:.2f} MPa) excede o limite de ruptura ({Sut} MPa), "
-            f"mas como a tensão aplicada ({sigma_total:.2f} MPa) está abaixo de {Sut} MPa, o componente **NÃO ROMPE e RESISTE** "
-            f"ao ensaio de {N_desejado:,} ciclos.")
-    else:
-        st.error(f"❌ A tensão de fadiga admissível calculada ({sigma_fadiga_admissivel:.2f} MPa) excede o limite de ruptura ({Sut} MPa), "
-            f"e a tensão aplicada ({sigma_total:.2f} MPa) também excede, indicando ROMPIMENTO sob carga estática antes de {N_desejado:,} ciclos.")
+for nivel, mensagem in grafo["mensagens"]:
+    getattr(st, nivel)(f"{ICONES[nivel]} {mensagem}")
 
-elif sigma_total < sigma_fadiga_admissivel:
-    st.success(f"✅ Resiste ao ensaio de fadiga de {N_desejado:,} ciclos.")
-
-else:
-    st.error(f"❌ Pode falhar antes de {N_desejado:,} ciclos no ensaio de fadiga.")
+etapa("resultados e análises")
 
 # ========================
 # Comparação por espessura
@@ -137,39 +101,81 @@ else:
 
 st.subheader("📊 Comparação por Espessura no Ensaio ISO 7173")
 
-sigma_totais = []
-
-for esp in espessuras_lista:
-    if tipo_tubo == 'Quadrado':
-        I_quadrado = largura * (largura ** 2) / 2
-        sigma_total_esp = (M_total * largura / 2) / (0.707 * esp * I_quadrado)
-    else:
-        I_redondo = np.pi * (largura / 2) ** 3
-        sigma_total_esp = (M_total * largura / 2) / (0.707 * esp * I_redondo)
-    sigma_totais.append(sigma_total_esp)
+st.image(grafo["grafico"])
 
-cores = [    'skyblue' if esp != espessura else 'orange'
-    for esp in espessuras_lista]
+etapa("comparação por espessura")
 
-fig, ax = plt.subplots(figsize = (8, 5))
-
-bars = ax.bar([str(e) for e in espessuras_lista],    sigma_totais,    color = cores)
-
-ax.axhline(Sut, color = 'red', linestyle = '--', label = f'Sut = {Sut} MPa (Ruptura)')
-ax.axhline(Sy, color = 'orange', linestyle = '--', label = f'Sy = {Sy:.0f} MPa (Deformação)')
-ax.axhline(sigma_fadiga_admissivel, color = 'green', linestyle = '--', label = f'Se ({N_desejado:,} ciclos) = {sigma_fadiga_admissivel:.0f} MPa (Fadiga)')
-
-for bar, sigma in zip(bars, sigma_totais):
-    height = bar.get_height()
-    ax.annotate(f"{sigma:.0f}", xy = (bar.get_x() + bar.get_width() / 2, height), xytext = (0, 5), textcoords = "offset points", ha = 'center', va = 'bottom')
+# ========================
+# Otimização: tubo mais leve aprovado
+# ========================
+st.subheader("🔎 Tubo Mais Leve que Passa no Ensaio")
 
-ax.set_xlabel("Espessura da Parede do Tubo (mm)")
-ax.set_ylabel("Tensão Total (MPa)")
-ax.set_title("Tensão Total x Espessura - Ensaio ISO 7173")
-ax.grid(True, axis = 'y')
-ax.legend(loc = 'upper center', bbox_to_anchor = (0.5, -0.15), ncol = 2)
+otimo = grafo["otimo"]
+if np.isnan(otimo.area):
+    st.error(f"❌ Nenhum tubo {tipo_tubo.lower()} do catálogo passa no ensaio de {N_desejado:,} ciclos.")
+else:
+    st.success(f"✅ Tubo {tipo_tubo.lower()} {float(otimo.largura):g} mm × {float(otimo.espessura):.2f} mm "
+        f"(área da parede {float(otimo.area):.1f} mm²): tensão {float(otimo.sigma_total):.2f} MPa "
+        f"abaixo do limite de {float(otimo.sigma_limite):.2f} MPa.")
+
+etapa("otimização")
+
+# ========================
+# Modo probabilístico
+# ========================
+with st.expander("🎲 Modo probabilístico (Monte Carlo)"):
+    st.caption("Entradas sorteadas de distribuições normais com os coeficientes de variação abaixo.")
+    col1, col2 = st.columns(2)
+    cov_M = col1.number_input("CV do momento (%)", 0.0, 100.0, 10.0) / 100
+    cov_esp = col2.number_input("CV da espessura (%)", 0.0, 100.0, 5.0) / 100
+    cov_Sut = col1.number_input("CV de Sut (%)", 0.0, 100.0, 5.0) / 100
+    cov_Se = col2.number_input("CV de Se (%)", 0.0, 100.0, 8.0) / 100
+    amostras_max = st.number_input("Máximo de amostras", 10_000, 1_000_000_000, 10_000_000, step=1_000_000)
+    if st.button("Estimar probabilidade de falha"):
+        r = probabilidade_falha("iso7173", dict(
+            tipo_tubo=tipo_tubo, largura=float(largura), espessura=Normal(espessura, cov_esp * espessura),
+            M=Normal(M_total, cov_M * abs(M_total), -np.inf), Sut=Normal(Sut, cov_Sut * Sut),
+            Se=Normal(SE, cov_Se * SE), N=N_desejado), amostras_max=int(amostras_max))
+        st.write(f"Probabilidade de falha: **{r.pf:.3e}** "
+                 f"(IC 95 %: {r.intervalo[0]:.2e} – {r.intervalo[1]:.2e})")
+        st.write(f"{r.amostras:,} amostras, {r.falhas:,} falhas, CV do estimador {r.cov:.1%}")
+        if not r.convergiu:
+            st.warning("⚠️ O limite de amostras foi atingido antes da convergência.")
+
+etapa("modo probabilístico")
+
+# ========================
+# Sequência completa de ensaios, todas as juntas
+# ========================
+with st.expander("🧪 Sequência completa de ensaios (todas as juntas)"):
+    st.caption("Assento, encosto, pernas e queda em sequência; o dano de Miner de cada junta "
+               "soldada é somado de um ensaio para o outro.")
+    colunas = st.columns(len(ENSAIOS))
+    ciclos_seq = [col.number_input(f"Ciclos — {nome}", 1, 10_000_000, padrao)
+                  for col, nome, padrao in zip(colunas, ENSAIOS, CICLOS_PADRAO)]
+    col1, col2, col3 = st.columns(3)
+    F_frente = col1.number_input("Força perna para frente (N)", 0.0, 10_000.0, F_PERNA_FRENTE)
+    F_lado = col2.number_input("Força perna para o lado (N)", 0.0, 10_000.0, F_PERNA_LADO)
+    fator_queda = col3.number_input("Fator de impacto da queda", 1.0, 10.0, FATOR_QUEDA)
+    col1, col2 = st.columns(2)
+    largura_encosto = col1.number_input("Largura do tubo do encosto (mm)", 5.0, 200.0, float(largura))
+    espessura_encosto = col2.selectbox("Espessura do tubo do encosto (mm)", espessuras_lista,
+                                       index=espessuras_lista.index(espessura))
+
+    sequencia = simular_sequencia(
+        momentos_cadeira(F_perna_frente=F_frente, F_perna_lado=F_lado, fator_queda=fator_queda),
+        tipo_tubo, np.where(PERNAS, largura, largura_encosto),
+        np.where(PERNAS, espessura, espessura_encosto), ciclos=ciclos_seq, Sut=Sut, Sy=Sy)
+    relatorio = relatorio_sequencia(sequencia, ciclos_seq)
+    if sequencia.aprovado:
+        st.success(relatorio)
+    else:
+        st.error(relatorio)
+    st.table({"Junta": list(JUNTAS),
+              **{f"Dano — {nome}": sequencia.dano[i].round(4) for i, nome in enumerate(ENSAIOS)},
+              "Dano total": sequencia.dano_total.round(4)})
 
-st.pyplot(fig)
+etapa("sequência de ensaios")
 
 # ========================
 # Comentário interpretativo
@@ -182,3 +188,6 @@ st.info(f"""
 - Se entre **Sy e Sut (linha vermelha)**, pode ocorrer deformação permanente.
 - Se **acima de Sut**, pode ocorrer ruptura sob carga estática.
 - Se abaixo da linha verde (Se para {N_desejado:,} ciclos), resiste ao ensaio de fadiga.""")
+
+etapa("comentário")
+painel_perfil(perfil)
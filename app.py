@@ -0,0 +1,21 @@
+import streamlit as st
+
+# ========================
+# App único com todas as páginas
+# ========================
+# Cada página só roda (e só importa seus módulos pesados) quando é aberta;
+# o scipy, por exemplo, é carregado apenas pelo simulador MDOF.
+st.set_page_config(page_title="Fadiga e Vibração — Felipe Veiga", layout="wide")
+
+paginas = st.navigation({
+    "Fadiga": [
+        st.Page("Veiga-FatigueCheck.py", title="Cadeiras — ISO 7173", icon="🪑",
+                url_path="iso7173", default=True),
+        st.Page("Tubo_Quadrado.py", title="Tubo Quadrado", icon="🔧", url_path="tubo-quadrado"),
+        st.Page("Tubo_Redondo.py", title="Tubo Redondo", icon="🔧", url_path="tubo-redondo"),
+    ],
+    "Vibração": [
+        st.Page("Trabalho_Vibrações_Veiga.py", title="Simulador MDOF", icon="🚗", url_path="mdof"),
+    ],
+})
+paginas.run()
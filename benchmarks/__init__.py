@@ -0,0 +1 @@
+"""Benchmarks e testes de regressão de desempenho dos apps."""
@@ -0,0 +1,373 @@
+"""Mede tempo, pico de memória e alocações de cada caminho de cálculo.
+
+Roda offline, sem navegador: os cálculos são chamados direto do
+``nucleo`` e as páginas são reexecutadas pelo ``streamlit.testing``
+(quando o Streamlit está instalado). Cada caso roda num processo novo,
+então memória e alocações não dependem do que os casos anteriores
+deixaram no processo. Os tempos são medidos em unidades de uma carga de
+calibração rodada no mesmo processo do caso, para que a linha de base
+gravada em ``linha_base.json`` valha em outras máquinas. O processo sai
+com código 1 se algum caso regredir::
+
+    python -m benchmarks.executar              # compara com a linha de base
+    python -m benchmarks.executar --gravar     # regrava a linha de base
+    python -m benchmarks.executar -k varredura # só os casos com "varredura"
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Os benchmarks medem o cálculo, não o armazém persistente
+os.environ["VEIGA_RESULTADOS_DB"] = ""
+
+import numpy as np  # noqa: E402
+
+RAIZ = Path(__file__).resolve().parent.parent
+LINHA_BASE = Path(__file__).resolve().parent / "linha_base.json"
+
+CASOS = {}
+
+
+def caso(nome):
+    """Registra ``preparar() -> executar`` como caso de benchmark."""
+    def registrar(preparar):
+        CASOS[nome] = preparar
+        return preparar
+    return registrar
+
+
+# ========================
+# Casos: núcleo de cálculo
+# ========================
+@caso("iso7173_ponto")
+def _():
+    from nucleo.iso7173 import checar_iso7173
+    return lambda: checar_iso7173("Quadrado", 20, 0.9, 25_000)
+
+
+@caso("iso7173_varredura_168k")
+def _():
+    from nucleo.iso7173 import varrer_iso7173
+    larguras = np.linspace(10, 60, 2_000)
+    return lambda: varrer_iso7173(larguras)
+
+
+@caso("sequencia_10k_cadeiras")
+def _():
+    from nucleo.sequencia import momentos_cadeira, simular_sequencia
+    larguras = np.linspace(15, 40, 2_500)[:, None, None]
+    espessuras = np.array([0.9, 1.2, 1.5, 2.0])[:, None]
+    M = momentos_cadeira()
+    return lambda: simular_sequencia(M, "Redondo", larguras, espessuras)
+
+
+@caso("secoes_fora_catalogo_1M")
+def _():
+    from nucleo.secoes import propriedades
+    rng = np.random.default_rng(0)
+    b, t = rng.uniform(10, 60, 1_000_000), rng.uniform(0.5, 2, 1_000_000)
+    return lambda: propriedades("Quadrado", b, t)
+
+
+@caso("otimizador_10k_modelos")
+def _():
+    from nucleo.otimizador import otimizar_tubo
+    rng = np.random.default_rng(0)
+    tipos = rng.choice(["Quadrado", "Redondo", "Retangular"], 10_000)
+    F = rng.uniform(50, 1_500, 10_000)
+    return lambda: otimizar_tubo(tipos, 25_000, F_horizontal=F)
+
+
+@caso("goodman_espectro_1M")
+def _():
+    from nucleo.goodman import avaliar_espectro
+    rng = np.random.default_rng(0)
+    sigma_a, sigma_m = rng.uniform(0, 150, 1_000_000), rng.normal(50, 40, 1_000_000)
+    return lambda: avaliar_espectro(sigma_a, sigma_m, 155, 310, 201.5)
+
+
+@caso("rainflow_miner_1M")
+def _():
+    from nucleo.dano import dano_acumulado
+    serie = np.random.default_rng(0).normal(size=1_000_000)
+    return lambda: dano_acumulado((serie[i:i + 65_536] for i in range(0, serie.size, 65_536)), 100.0)
+
+
+@caso("monte_carlo_1M")
+def _():
+    from nucleo.confiabilidade import Normal, probabilidade_falha
+    entradas = dict(tipo_tubo="Quadrado", dimensao=20.0, esp=Normal(0.9, 0.05),
+                    M=Normal(5_000, 500), Sut=Normal(310, 15), Se=Normal(155, 10), n=1.0)
+    return lambda: probabilidade_falha("goodman", entradas, amostras_max=1_000_000,
+                                       cov_alvo=0.0, semente=0)
+
+
+@caso("mdof_modal_ponto")
+def _():
+    from nucleo.mdof import PARAMETROS, analise_modal
+    base = dict(zip(PARAMETROS, [0.1] * 7 + [1000.0] * 7 + [25.0, 50.0, 10.0, 10.0, 10.0]))
+    analise_modal(**base)     # importações e caches fora da medição
+    return lambda: analise_modal(**base)
+
+
+@caso("mdof_frequencias_10k")
+def _():
+    from nucleo.mdof import PARAMETROS, frequencias_naturais_lote, grade_parametros
+    base = dict(zip(PARAMETROS, [0.1] * 7 + [1000.0] * 7 + [25.0, 50.0, 10.0, 10.0, 10.0]))
+    grade = grade_parametros(base, {"k1": np.linspace(100, 1e4, 100), "m1": np.linspace(10, 100, 100)})
+    frequencias_naturais_lote(**base)
+    return lambda: frequencias_naturais_lote(**grade)
+
+
+@caso("resposta_livre_1M_amostras")
+def _():
+    from nucleo.mdof import PARAMETROS, analise_modal
+    from nucleo.resposta import coeficientes_modais, resposta_livre_decimada
+    base = dict(zip(PARAMETROS, [0.1] * 7 + [1000.0] * 7 + [25.0, 50.0, 10.0, 10.0, 10.0]))
+    Mnum, _, wn, VET = analise_modal(**base)
+    X0 = np.linspace(0.01, 0.05, 7).reshape(-1, 1)
+    V0 = np.linspace(1, 5, 7).reshape(-1, 1)
+    VETn, MAT1, MAT2 = coeficientes_modais(Mnum, VET, wn, X0, V0)
+    return lambda: resposta_livre_decimada(VETn, wn, MAT1, MAT2, 100.0, 1_000_000)
+
+
+@caso("frf_50_configuracoes_100k")
+def _():
+    from nucleo.frf import pico_transmissibilidade_lote
+    from nucleo.mdof import PARAMETROS, grade_parametros
+    base = dict(zip(PARAMETROS, [0.1] * 7 + [1000.0] * 7 + [25.0, 50.0, 10.0, 10.0, 10.0]))
+    grade = grade_parametros(base, {"k3": np.linspace(500, 2000, 50)})
+    freqs = np.linspace(0.0, 50.0, 100_000)
+    return lambda: pico_transmissibilidade_lote(freqs, 4, 0.05, **grade)
+
+
+@caso("montagem_esparsa_600gdl")
+def _():
+    from nucleo.montagem import CorpoRigido, Mola, modos_montagem, montar
+    elementos = []
+    for i in range(300):
+        elementos += [CorpoRigido(f"z{i}", f"t{i}", 10.0, 2.0),
+                      Mola((f"z{i}", -0.5), None, 1e4, entrada=0),
+                      Mola((f"z{i}", 0.5), None, 1e4, entrada=1)]
+        if i:
+            elementos.append(Mola((f"z{i - 1}", 0.5), (f"z{i}", -0.5), 5e3))
+
+    def executar():
+        modelo = montar(elementos)
+        return modos_montagem(modelo.M, modelo.K, n_modos=10)
+    return executar
+
+
+@caso("grafo_mdof_troca_duracao")
+def _():
+    from itertools import count
+
+    from nucleo.grafo import grafo_mdof
+    from nucleo.mdof import PARAMETROS
+    base = dict(zip(PARAMETROS, [0.1] * 7 + [1000.0] * 7 + [25.0, 50.0, 10.0, 10.0, 10.0]))
+    grafo = grafo_mdof()
+    grafo.definir(parametros=base, t_final=5.0, n_amostras=5_000, f_max_frf=50.0,
+                  n_freq=100_000, entrada=None, saidas_frf=("x3",), zeta_frf=0.05)
+    grafo["grafico_frf"]
+    duracoes = count(6)
+
+    def executar():
+        # Só a resposta livre e seu gráfico são refeitos; modos e FRF vêm da memória
+        grafo.definir(t_final=float(next(duracoes)))
+        return grafo["grafico_livre"], grafo["grafico_frf"]
+    return executar
+
+
+@caso("relatorios_pdf_100_projetos")
+def _():
+    import tempfile
+
+    from nucleo.relatorios import gerar_relatorios
+    tabela = {"tipo_tubo": ["Quadrado", "Redondo"] * 50,
+              "largura": np.repeat(np.linspace(15, 40, 50), 2).tolist(),
+              "espessura": [0.9, 1.2, 1.5, 1.9] * 25,
+              "N": [25_000] * 100}
+    pasta = tempfile.mkdtemp(prefix="veiga-relatorios-")
+    return lambda: gerar_relatorios(tabela, pasta, "pdf", processos=1)
+
+
+# ========================
+# Casos: reexecução das páginas
+# ========================
+def _pagina(arquivo, clicar=None):
+    def preparar():
+        from nucleo.graficos import CACHE
+        from streamlit.testing.v1 import AppTest
+
+        def executar():
+            CACHE.limpar()
+            app = AppTest.from_file(str(RAIZ / arquivo), default_timeout=120).run()
+            if clicar:
+                next(b for b in app.button if b.label == clicar).click().run()
+            if app.exception:
+                raise RuntimeError(f"{arquivo}: {app.exception[0].message}")
+        return executar
+    return preparar
+
+
+try:
+    import streamlit  # noqa: F401
+except ImportError:
+    pass
+else:
+    caso("pagina_iso7173")(_pagina("Veiga-FatigueCheck.py"))
+    caso("pagina_tubo_quadrado")(_pagina("Tubo_Quadrado.py"))
+    caso("pagina_tubo_redondo")(_pagina("Tubo_Redondo.py"))
+    caso("pagina_mdof_simular")(_pagina("Trabalho_Vibrações_Veiga.py", clicar="Calcular e Simular"))
+
+
+# ========================
+# Medição
+# ========================
+def _carga_calibracao():
+    """Trabalho fixo, metade interpretador e metade NumPy, como os casos."""
+    total = 0.0
+    for i in range(100_000):
+        total += i * 0.5
+    x = np.random.default_rng(0).random(200_000)
+    for _ in range(5):
+        x = np.sort(np.sin(x) * 1.1)
+    return total + x[0]
+
+
+def calibrar(repeticoes=7):
+    """Mediana (s) da carga de calibração nesta máquina e neste processo.
+
+    Os tempos são gravados e comparados em unidades dessa carga, então a
+    linha de base vale em máquinas mais rápidas ou mais lentas.
+    """
+    _carga_calibracao()
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        _carga_calibracao()
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+def medir(executar, repeticoes, calibracao):
+    """Tempo (mediana, s e relativo à calibração), pico de memória e alocações.
+
+    O Python não conta alocações acumuladas; ``alocacoes`` são os blocos do
+    tracemalloc criados pela chamada e ainda vivos quando ela retorna
+    (resultado, caches, temporários retidos), e ``blocos_retidos`` os que
+    sobram depois de descartar o resultado (vazamentos, caches crescendo).
+    """
+    executar()                # aquecimento: imports, caches de processo
+    tempos = []
+    for _ in range(repeticoes):
+        gc.collect()
+        inicio = time.perf_counter()
+        executar()
+        tempos.append(time.perf_counter() - inicio)
+
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    resultado = executar()
+    _, pico = tracemalloc.get_traced_memory()
+    retorno = tracemalloc.take_snapshot()
+    del resultado
+    gc.collect()
+    depois = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    tempo = statistics.median(tempos)
+    return {
+        "tempo_s": tempo,
+        "tempo_rel": tempo / calibracao,
+        "pico_mib": pico / 2 ** 20,
+        "alocacoes": sum(max(s.count_diff, 0) for s in retorno.compare_to(antes, "traceback")),
+        "blocos_retidos": sum(s.count_diff for s in depois.compare_to(antes, "filename")),
+    }
+
+
+def medir_isolado(nome, repeticoes):
+    """Mede o caso ``nome`` num processo Python novo; devolve o dict de ``medir``."""
+    saida = subprocess.run(
+        [sys.executable, "-m", "benchmarks.executar", "--caso", nome,
+         "--repeticoes", str(repeticoes)],
+        cwd=RAIZ, capture_output=True, text=True)
+    if saida.returncode:
+        erro = (saida.stderr.strip().splitlines() or ["sem saída"])[-1]
+        raise RuntimeError(f"{nome}: {erro}")
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def comparar(nome, atual, base, tol_tempo, tol_memoria, tol_alocacoes, calibracao):
+    """Lista de regressões do caso em relação à linha de base."""
+    falhas = []
+    if "tempo_rel" not in base:
+        return [f"{nome}: linha de base sem tempo relativo, regrave com --gravar"]
+    folga = 1e-3 / calibracao  # 1 ms nesta máquina
+    if atual["tempo_rel"] > base["tempo_rel"] * (1 + tol_tempo) + folga:
+        falhas.append(f"tempo {atual['tempo_rel']:.3f} > {base['tempo_rel']:.3f} "
+                      f"(em unidades de calibração; {atual['tempo_s'] * 1e3:.1f} ms)")
+    if atual["pico_mib"] > base["pico_mib"] * (1 + tol_memoria) + 1.0:
+        falhas.append(f"memória {atual['pico_mib']:.1f} MiB > {base['pico_mib']:.1f} MiB")
+    for campo in ("alocacoes", "blocos_retidos"):
+        if atual[campo] > base.get(campo, 0) * (1 + tol_alocacoes) + 100:
+            falhas.append(f"{campo} {atual[campo]} > {base.get(campo, 0)}")
+    return [f"{nome}: {f}" for f in falhas]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de desempenho dos apps.")
+    parser.add_argument("--gravar", action="store_true", help="regrava a linha de base")
+    parser.add_argument("-k", dest="filtro", default="", help="só casos cujo nome contém o texto")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--tolerancia-tempo", type=float, default=0.5,
+                        help="fração de aumento de tempo aceita (padrão 0.5 = +50 %%)")
+    parser.add_argument("--tolerancia-memoria", type=float, default=0.25)
+    parser.add_argument("--tolerancia-alocacoes", type=float, default=0.5)
+    parser.add_argument("--linha-base", type=Path, default=LINHA_BASE)
+    parser.add_argument("--caso", help=argparse.SUPPRESS)   # processo filho de medir_isolado
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(RAIZ))
+    if args.caso:
+        calibracao = calibrar()
+        r = medir(CASOS[args.caso](), args.repeticoes, calibracao)
+        print(json.dumps({**r, "calibracao_s": calibracao}))
+        return 0
+
+    base = json.loads(args.linha_base.read_text()) if args.linha_base.exists() else {}
+    resultados, regressoes = {}, []
+    for nome in CASOS:
+        if args.filtro not in nome:
+            continue
+        r = medir_isolado(nome, args.repeticoes)
+        calibracao = r.pop("calibracao_s")
+        resultados[nome] = r
+        print(f"{nome:32s} {r['tempo_s'] * 1e3:10.2f} ms {r['tempo_rel']:8.3f} rel "
+              f"{r['pico_mib']:9.1f} MiB {r['alocacoes']:8d} aloc. {r['blocos_retidos']:6d} retidos "
+              f"(calibração {calibracao * 1e3:.1f} ms)")
+        if not args.gravar and nome in base:
+            regressoes += comparar(nome, r, base[nome], args.tolerancia_tempo,
+                                   args.tolerancia_memoria, args.tolerancia_alocacoes,
+                                   calibracao)
+
+    if args.gravar:
+        base.update(resultados)
+        args.linha_base.write_text(json.dumps(base, indent=2, sort_keys=True) + "\n")
+        print(f"Linha de base gravada em {args.linha_base}")
+        return 0
+    for r in regressoes:
+        print(f"REGRESSÃO {r}")
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
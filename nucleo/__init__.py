@@ -0,0 +1 @@
+"""Núcleo de cálculo dos apps de fadiga e vibração (sem Streamlit)."""
@@ -0,0 +1,19 @@
+"""Arquivos estáticos dos apps, decodificados uma única vez por processo."""
+
+from functools import lru_cache
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=None)
+def imagem(nome):
+    """Imagem ``nome`` da raiz do repositório já decodificada, ou None se ausente."""
+    from PIL import Image
+
+    try:
+        with Image.open(RAIZ / nome) as arquivo:
+            arquivo.load()
+            return arquivo.copy()
+    except OSError:
+        return None
@@ -0,0 +1,26 @@
+"""Chaves hashable e estáveis de valores, para caches e memórias de etapas.
+
+Arrays viram um digest dos bytes; floats entram pela representação
+textual, então NaN é igual a NaN e um resultado com NaN (nenhum tubo
+aprovado, modo de corpo rígido) não parece "mudado" a cada comparação.
+"""
+
+import hashlib
+
+import numpy as np
+
+
+def chave_valor(valor):
+    """Forma hashable de ``valor``; valores iguais (NaN inclusive) dão chaves iguais."""
+    if isinstance(valor, np.ndarray):
+        return ("ndarray", valor.shape, valor.dtype.str,
+                hashlib.blake2b(np.ascontiguousarray(valor).tobytes(), digest_size=16).digest())
+    if isinstance(valor, (list, tuple)):
+        return tuple(chave_valor(v) for v in valor)
+    if isinstance(valor, dict):
+        return tuple(sorted((k, chave_valor(v)) for k, v in valor.items()))
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, float):
+        return ("float", repr(valor))
+    return valor
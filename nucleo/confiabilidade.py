@@ -0,0 +1,164 @@
+"""Confiabilidade por Monte Carlo dos vereditos de fadiga.
+
+Sorteia as entradas incertas (Sut, Se, espessura, momento...) e avalia as
+mesmas fórmulas dos apps em blocos NumPy de tamanho fixo, opcionalmente
+num pool de processos. A amostragem para assim que a estimativa da
+probabilidade de falha atinge o coeficiente de variação pedido, e a
+memória não depende do número total de amostras.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+from nucleo import iso7173
+from nucleo.goodman import verificar_goodman
+from nucleo.perfil import medir_fase
+
+BLOCO = 250_000
+P_TRUNCADA_MIN = 1e-12        # massa mínima acima do corte de uma Normal truncada
+
+
+# ========================
+# Distribuições
+# ========================
+class Normal(NamedTuple):
+    """Normal truncada em ``minimo`` (amostrada pela inversa da CDF).
+
+    Espessura, Sut e Se não podem ser negativos; sem o corte, a cauda da
+    normal viraria falhas espúrias. Grandezas com sinal, como o momento,
+    usam ``minimo=-np.inf`` (a normal completa).
+    """
+    media: float
+    desvio: float
+    minimo: float = 0.0
+
+    def amostrar(self, rng, n):
+        if self.minimo == -np.inf:
+            return rng.normal(self.media, self.desvio, n)
+        if self.desvio <= 0:
+            if self.media < self.minimo:
+                raise ValueError(f"Normal({self.media}, 0) fica toda abaixo de minimo={self.minimo}")
+            return np.full(n, float(self.media))
+        # P(X >= minimo); sorteia u em (0, p] e inverte pela cauda superior,
+        # o que mantém a precisão mesmo quando o corte está longe da média
+        p = ndtr((self.media - self.minimo) / self.desvio)
+        if p < P_TRUNCADA_MIN:
+            raise ValueError(f"Normal({self.media}, {self.desvio}) tem probabilidade {p:.1e} "
+                             f"acima de minimo={self.minimo}; use minimo=-np.inf para "
+                             f"grandezas com sinal")
+        return self.media - self.desvio * ndtri(p * (1.0 - rng.random(n)))
+
+
+class Lognormal(NamedTuple):
+    """Lognormal parametrizada pela média e desvio da própria variável."""
+    media: float
+    desvio: float
+
+    def amostrar(self, rng, n):
+        s2 = np.log1p((self.desvio / self.media) ** 2)
+        return rng.lognormal(np.log(self.media) - s2 / 2, np.sqrt(s2), n)
+
+
+class Uniforme(NamedTuple):
+    minimo: float
+    maximo: float
+
+    def amostrar(self, rng, n):
+        return rng.uniform(self.minimo, self.maximo, n)
+
+
+# ========================
+# Modelos de falha
+# ========================
+def falha_iso7173(tipo_tubo, largura, espessura, M, Sut, Se, N,
+                  a_ciclo=iso7173.A_CICLO, b_ciclo=iso7173.B_CICLO, razao_sy=0.65):
+    """Falha na ISO 7173: escoamento (>= Sy) ou fadiga antes de N ciclos."""
+    r = iso7173.checar_iso7173(tipo_tubo, largura, espessura, N, M, Sut,
+                               razao_sy * np.asarray(Sut), Se, a_ciclo, b_ciclo)
+    return (r.estatico != iso7173.APROVADO) | ~r.fadiga
+
+
+def falha_goodman(tipo_tubo, dimensao, esp, M, Sut, Se, n=1.0):
+    """Falha por Goodman: tensão de flexão acima da admissível."""
+    return ~verificar_goodman(M, tipo_tubo, dimensao, esp, Sut, Se, n).aprovado
+
+
+MODELOS = {
+    "iso7173": falha_iso7173,
+    "goodman": falha_goodman,
+}
+
+
+class ResultadoConfiabilidade(NamedTuple):
+    pf: float                     # probabilidade de falha estimada
+    amostras: int
+    falhas: int
+    cov: float                    # coeficiente de variação do estimador
+    intervalo: tuple              # IC de 95 % (Wilson)
+    convergiu: bool
+
+
+def _contar_falhas(modelo, entradas, n, semente):
+    """Sorteia ``n`` amostras e conta as falhas (roda em qualquer processo)."""
+    rng = np.random.default_rng(semente)
+    argumentos = {nome: v.amostrar(rng, n) if hasattr(v, "amostrar") else v
+                  for nome, v in entradas.items()}
+    return int(np.count_nonzero(MODELOS[modelo](**argumentos)))
+
+
+def _resultado(falhas, amostras, cov_alvo, falhas_min):
+    pf = falhas / amostras
+    cov = np.sqrt((1 - pf) / (amostras * pf)) if falhas else np.inf
+    z = 1.96
+    centro = (pf + z ** 2 / (2 * amostras)) / (1 + z ** 2 / amostras)
+    meia = z * np.sqrt(pf * (1 - pf) / amostras + z ** 2 / (4 * amostras ** 2)) / (1 + z ** 2 / amostras)
+    return ResultadoConfiabilidade(pf, amostras, falhas, float(cov),
+                                   (max(0.0, float(centro - meia)), min(1.0, float(centro + meia))),
+                                   bool(falhas >= falhas_min and cov <= cov_alvo))
+
+
+@medir_fase("monte carlo")
+def probabilidade_falha(modelo, entradas, amostras_max=10_000_000, bloco=BLOCO,
+                        cov_alvo=0.05, falhas_min=10, processos=1, semente=None):
+    """Estima a probabilidade de falha de ``modelo`` por Monte Carlo.
+
+    ``entradas`` mapeia cada argumento do modelo a um valor fixo ou a uma
+    distribuição (``Normal``, ``Lognormal``, ``Uniforme``). Os blocos são
+    sorteados com sementes independentes; com ``processos`` > 1 cada rodada
+    distribui um bloco por processo. Para ao atingir ``cov_alvo`` (com ao
+    menos ``falhas_min`` falhas) ou ``amostras_max``.
+    """
+    if modelo not in MODELOS:
+        raise ValueError(f"Modelo desconhecido: {modelo!r}")
+    if amostras_max < 1 or bloco < 1:
+        raise ValueError(f"amostras_max e bloco devem ser >= 1 (recebidos {amostras_max} e {bloco})")
+    processos = processos or os.cpu_count()
+    sementes = np.random.SeedSequence(semente)
+    falhas = amostras = 0
+    pool = ProcessPoolExecutor(processos) if processos > 1 else None
+    try:
+        while amostras < amostras_max:
+            tamanhos = []
+            for _ in range(processos):
+                n = min(bloco, amostras_max - amostras - sum(tamanhos))
+                if n > 0:
+                    tamanhos.append(n)
+            filhas = sementes.spawn(len(tamanhos))
+            if pool is None:
+                contagens = [_contar_falhas(modelo, entradas, n, s) for n, s in zip(tamanhos, filhas)]
+            else:
+                contagens = list(pool.map(_contar_falhas, [modelo] * len(tamanhos),
+                                          [entradas] * len(tamanhos), tamanhos, filhas))
+            falhas += sum(contagens)
+            amostras += sum(tamanhos)
+            resultado = _resultado(falhas, amostras, cov_alvo, falhas_min)
+            if resultado.convergiu:
+                return resultado
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return resultado
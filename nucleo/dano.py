@@ -0,0 +1,198 @@
+"""Dano acumulado (Palmgren–Miner) a partir de históricos de carga medidos.
+
+Lê séries longas em blocos (memmap para ``.npy``/binário, lotes de
+linhas para texto), conta ciclos por rainflow de forma incremental e soma
+o dano na curva S-N de Basquin do app ISO 7173.
+
+Uso pela linha de comando::
+
+    python -m nucleo.dano ensaio.npy --tipo Quadrado --largura 20 --espessura 0.9
+"""
+
+import argparse
+from itertools import islice
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from nucleo.iso7173 import A_CICLO, B_CICLO, SE, tensao_garganta
+from nucleo.secoes import TIPOS_SECAO
+
+BLOCO = 1 << 20
+
+
+class ResultadoDano(NamedTuple):
+    dano: float                   # soma de Miner (falha em 1)
+    ciclos: float                 # ciclos contados (meios ciclos valem 0,5)
+    faixa_max: float              # maior faixa de tensão (MPa)
+
+
+# ========================
+# Leitura em blocos
+# ========================
+def ler_serie_blocos(caminho, coluna=0, bloco=BLOCO, dtype="<f8", n_colunas=1,
+                     cabecalho=0, delimitador=","):
+    """Gera a série de uma coluna do arquivo em blocos de ``bloco`` amostras.
+
+    ``.npy`` é aberto com memmap; ``.csv``/``.txt`` é lido por lotes de
+    linhas; qualquer outra extensão é tratada como binário cru de
+    ``dtype`` com ``n_colunas`` intercaladas.
+    """
+    caminho = Path(caminho)
+    sufixo = caminho.suffix.lower()
+
+    if sufixo in (".csv", ".txt"):
+        with open(caminho) as arquivo:
+            for _ in range(cabecalho):
+                next(arquivo)
+            while True:
+                linhas = list(islice(arquivo, bloco))
+                if not linhas:
+                    return
+                yield np.loadtxt(linhas, delimiter=delimitador, usecols=coluna,
+                                 ndmin=1, dtype=float)
+
+    if sufixo == ".npy":
+        dados = np.load(caminho, mmap_mode="r")
+    else:
+        dados = np.memmap(caminho, dtype=dtype, mode="r")
+        dados = dados[:dados.size // n_colunas * n_colunas].reshape(-1, n_colunas)
+    if dados.ndim == 2:
+        dados = dados[:, coluna]
+    for inicio in range(0, dados.shape[0], bloco):
+        yield np.array(dados[inicio:inicio + bloco], dtype=float)
+
+
+# ========================
+# Rainflow incremental
+# ========================
+def _pontos_reversao(x):
+    """Picos e vales de ``x``, mantendo o primeiro e o último ponto."""
+    x = x[np.concatenate(([True], np.diff(x) != 0))]
+    if x.size < 3:
+        return x
+    sinal = np.sign(np.diff(x))
+    return x[np.concatenate(([True], sinal[1:] != sinal[:-1], [True]))]
+
+
+def _extrai_ciclos(pontos):
+    """Método dos quatro pontos: remove os ciclos fechados da sequência.
+
+    Passadas vetorizadas removem de uma vez todos os pares internos
+    disjuntos; quando elas passam a render pouco, uma pilha termina o
+    trabalho. Devolve (picos, vales) dos ciclos e o resíduo.
+    """
+    inicio, fim = [], []
+    while pontos.size >= 4:
+        faixa = np.abs(np.diff(pontos))
+        interno = (faixa[1:-1] <= faixa[:-2]) & (faixa[1:-1] <= faixa[2:])
+        # Pares vizinhos compartilham um ponto: fica só o primeiro de cada sequência
+        interno[1:] &= ~interno[:-1]
+        i = np.flatnonzero(interno) + 1
+        if i.size * 64 < pontos.size:
+            break
+        inicio.append(pontos[i])
+        fim.append(pontos[i + 1])
+        manter = np.ones(pontos.size, dtype=bool)
+        manter[i] = manter[i + 1] = False
+        pontos = pontos[manter]
+
+    pilha = []
+    resto_inicio, resto_fim = [], []
+    for p in pontos.tolist():
+        pilha.append(p)
+        while len(pilha) >= 4:
+            r1 = abs(pilha[-3] - pilha[-4])
+            r2 = abs(pilha[-2] - pilha[-3])
+            r3 = abs(pilha[-1] - pilha[-2])
+            if r2 <= r1 and r2 <= r3:
+                resto_inicio.append(pilha[-3])
+                resto_fim.append(pilha[-2])
+                del pilha[-3:-1]
+            else:
+                break
+    inicio.append(np.array(resto_inicio))
+    fim.append(np.array(resto_fim))
+    return np.concatenate(inicio), np.concatenate(fim), np.array(pilha)
+
+
+def contar_ciclos_blocos(blocos):
+    """Rainflow incremental sobre uma sequência de blocos da série.
+
+    Gera, por bloco, ``(faixas, medias, contagens)`` dos ciclos fechados;
+    no fim, o resíduo é contado como meios ciclos (ASTM E1049).
+    """
+    residuo = np.empty(0)
+    for bloco in blocos:
+        pontos = _pontos_reversao(np.concatenate([residuo, np.asarray(bloco, dtype=float)]))
+        p1, p2, residuo = _extrai_ciclos(pontos)
+        if p1.size:
+            yield np.abs(p2 - p1), (p1 + p2) / 2, np.ones(p1.size)
+    if residuo.size >= 2:
+        yield (np.abs(np.diff(residuo)), (residuo[1:] + residuo[:-1]) / 2,
+               np.full(residuo.size - 1, 0.5))
+
+
+# ========================
+# Dano de Miner
+# ========================
+def ciclos_admissiveis(faixa_tensao, Se=SE, a_ciclo=A_CICLO, b_ciclo=B_CICLO):
+    """Inverso de Basquin: ciclos até a falha para cada faixa de tensão."""
+    with np.errstate(divide="ignore"):
+        return a_ciclo * (Se / np.asarray(faixa_tensao, dtype=float)) ** b_ciclo
+
+
+def dano_acumulado(blocos, fator_tensao, Se=SE, a_ciclo=A_CICLO, b_ciclo=B_CICLO):
+    """Dano de Miner de uma série de carga lida em blocos.
+
+    ``fator_tensao`` converte a carga em tensão (MPa por unidade). A faixa
+    Δσ do ciclo entra direto na curva S-N, como no ensaio ISO 7173, em que
+    a carga vai de zero ao pico.
+    """
+    dano = ciclos = faixa_max = 0.0
+    for faixas, _, contagens in contar_ciclos_blocos(blocos):
+        faixa_tensao = faixas * fator_tensao
+        dano += float(np.sum(contagens / ciclos_admissiveis(faixa_tensao, Se, a_ciclo, b_ciclo)))
+        ciclos += float(contagens.sum())
+        faixa_max = max(faixa_max, float(faixa_tensao.max()))
+    return ResultadoDano(dano, ciclos, faixa_max)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Dano de Miner na garganta da solda a partir de um histórico de carga.")
+    parser.add_argument("arquivo")
+    parser.add_argument("--tipo", choices=TIPOS_SECAO, default="Quadrado")
+    parser.add_argument("--largura", type=float, default=20.0, help="mm")
+    parser.add_argument("--espessura", type=float, default=0.9, help="mm")
+    parser.add_argument("--altura", type=float, help="mm; só para tubo retangular")
+    parser.add_argument("--braco", type=float, default=1.0,
+                        help="mm; converte força (N) em momento (N·mm)")
+    parser.add_argument("--fator", type=float,
+                        help="MPa por unidade de carga; substitui a seção da solda")
+    parser.add_argument("--coluna", type=int, default=0)
+    parser.add_argument("--cabecalho", type=int, default=0)
+    parser.add_argument("--dtype", default="<f8")
+    parser.add_argument("--n-colunas", type=int, default=1)
+    parser.add_argument("--bloco", type=int, default=BLOCO)
+    args = parser.parse_args(argv)
+
+    fator = args.fator
+    if fator is None:
+        fator = args.braco * float(tensao_garganta(1.0, args.largura, args.espessura,
+                                                   args.tipo, args.altura))
+    blocos = ler_serie_blocos(args.arquivo, args.coluna, args.bloco, args.dtype,
+                              args.n_colunas, args.cabecalho)
+    resultado = dano_acumulado(blocos, fator)
+    print(f"Ciclos contados: {resultado.ciclos:,.1f}")
+    print(f"Maior faixa de tensão: {resultado.faixa_max:.2f} MPa")
+    print(f"Dano de Miner: {resultado.dano:.4g}")
+    if resultado.dano >= 1:
+        print("❌ Dano acumulado >= 1: falha prevista.")
+    else:
+        print(f"✅ Vida restante estimada: {1 / resultado.dano if resultado.dano else float('inf'):.3g} repetições do histórico.")
+
+
+if __name__ == "__main__":
+    main()
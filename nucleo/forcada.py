@@ -0,0 +1,273 @@
+"""Resposta forçada amortecida do modelo MDOF excitado pelo perfil da pista.
+
+Os pneus (k5 em x4, k7 em x5) são excitados pelo perfil medido; o eixo
+traseiro vê o mesmo perfil com o atraso do entre-eixos. A integração é a
+exponencial de matriz do espaço de estados com entrada linear entre
+amostras (exata para o perfil amostrado). Na forma de Schur a recorrência
+vira filtros de primeira ordem (``scipy.signal.lfilter``), avaliados bloco a
+bloco: a memória fica limitada ao bloco, qualquer que seja a duração.
+
+Uso pela linha de comando::
+
+    python -m nucleo.forcada pista.npy --dt 0.001 --velocidade 15 --entre-eixos 2.5
+"""
+
+import argparse
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from nucleo.dano import ler_serie_blocos
+from nucleo.mdof import GDL_PNEUS, N_GDL, PARAMETROS, distancia_entre_eixos, matrizes_mk
+from nucleo.perfil import medir_fase
+from nucleo.resposta import BLOCO, _minmax_baldes
+
+TAMANHO_BALDE = 1024          # amostras por balde min/máx quando o total é desconhecido
+
+# Valores iniciais da barra lateral de Trabalho_Vibrações_Veiga.py
+PARAMETROS_PADRAO = dict(zip(PARAMETROS, (0.1, 0.1, 0.3, 0.1, 0.1, 0.1, 0.1) + (1000.0,) * 7
+                             + (25.0, 50.0, 10.0, 10.0, 10.0)))
+
+
+class ModeloDiscreto(NamedTuple):
+    T: np.ndarray                 # forma de Schur (triangular) da transição Φ
+    H0: np.ndarray                # entrada da amostra anterior, nas coordenadas de Schur
+    H1: np.ndarray                # entrada da amostra atual
+    saida: np.ndarray             # deslocamentos a partir das coordenadas de Schur
+    dt: float
+
+    @property
+    def instavel(self):
+        """True se algum modo cresce sem limite (|λ| > 1)."""
+        return bool(np.abs(np.diagonal(self.T)).max() > 1 + 1e-9)
+
+
+class ResultadoForcado(NamedTuple):
+    t: np.ndarray                 # (GDL, pontos) instantes dos min/máx
+    resposta: np.ndarray          # (GDL, pontos) deslocamentos decimados
+    rms: np.ndarray               # (GDL,) valor eficaz do histórico completo
+    pico: np.ndarray              # (GDL,) maior |deslocamento|
+    amostras: int
+
+
+# ========================
+# Amortecimento e entrada
+# ========================
+def amortecimento_modal(Mnum, Knum, zeta):
+    """C = M Φ diag(2 ζ ω) Φ⁻¹: razão ``zeta`` (escalar ou por modo) em cada modo."""
+    VAL, VET = np.linalg.eig(np.linalg.solve(Mnum, Knum))
+    ordem = np.argsort(np.abs(VAL))
+    VAL, VET = VAL[ordem], VET[:, ordem]
+    wn = np.sqrt(VAL.astype(complex))
+    C = Mnum @ VET @ np.diag(2 * np.asarray(zeta) * wn) @ np.linalg.inv(VET)
+    return np.real(C)
+
+
+def amortecimento_molas(amortecedores, a, b, c, d, e, f, g):
+    """C com um amortecedor viscoso em paralelo a cada mola k1..k7 (N·s/m).
+
+    K é linear nas rigidezes, então C sai da mesma matriz com c1..c7 no
+    lugar de k1..k7.
+    """
+    _, C = matrizes_mk(a, b, c, d, e, f, g, *amortecedores, 1.0, 1.0, 1.0, 1.0, 1.0)
+    return C
+
+
+def entrada_pneus(k5, k7, c5=0.0, c7=0.0, n_gdl=N_GDL):
+    """Matrizes de entrada do perfil (dianteiro, traseiro): F = Kr·u + Cr·u̇."""
+    Kr = np.zeros((n_gdl, 2))
+    Cr = np.zeros((n_gdl, 2))
+    Kr[GDL_PNEUS, (0, 1)] = k5, k7
+    Cr[GDL_PNEUS, (0, 1)] = c5, c7
+    return Kr, Cr
+
+
+# ========================
+# Discretização
+# ========================
+@medir_fase("resposta forçada: discretização")
+def discretizar(Mnum, Cnum, Knum, Kr, Cr, dt):
+    """Transição exata em ``dt`` com entrada linear entre amostras.
+
+    z[k+1] = Φ z[k] + G0 u[k] + G1 u[k+1], z = (x, ẋ). Φ e as integrais
+    Γ0 = ∫ e^{As} ds e Γ1 = ∫ e^{A(dt-s)} s/dt ds saem de uma única
+    exponencial da matriz aumentada; Φ é então levada à forma de Schur.
+    """
+    from scipy.linalg import expm, schur
+
+    n = Mnum.shape[0]
+    N = 2 * n
+    A = np.zeros((N, N))
+    A[:n, n:] = np.eye(n)
+    A[n:, :n] = -np.linalg.solve(Mnum, Knum)
+    A[n:, n:] = -np.linalg.solve(Mnum, Cnum)
+    B = np.vstack([np.zeros_like(Kr), np.linalg.solve(Mnum, Kr)])
+    E = np.vstack([np.zeros_like(Cr), np.linalg.solve(Mnum, Cr)])
+
+    aumentada = np.zeros((3 * N, 3 * N))
+    aumentada[:N, :N] = A * dt
+    aumentada[:N, N:2 * N] = np.eye(N) * dt
+    aumentada[N:2 * N, 2 * N:] = np.eye(N)
+    exp_aum = expm(aumentada)
+    Phi, Gama0, Gama1 = exp_aum[:N, :N], exp_aum[:N, N:2 * N], exp_aum[:N, 2 * N:]
+
+    G0 = Gama0 @ B - Gama1 @ B - Gama0 @ E / dt
+    G1 = Gama1 @ B + Gama0 @ E / dt
+    T, Z = schur(Phi, output="complex")
+    Zh = Z.conj().T
+    return ModeloDiscreto(T, Zh @ G0, Zh @ G1, Z[:n], float(dt))
+
+
+# ========================
+# Perfil da pista e integração em blocos
+# ========================
+def pista_eixos(blocos, atraso):
+    """Gera blocos (2, n) com o perfil sob o eixo dianteiro e o traseiro.
+
+    O traseiro repete o dianteiro ``atraso`` amostras depois (fração
+    interpolada linearmente); antes do início da gravação a pista é plana.
+    """
+    n_hist = int(np.ceil(atraso)) + 1
+    historico = np.zeros(n_hist)
+    for bloco in blocos:
+        bloco = np.asarray(bloco, dtype=float)
+        ext = np.concatenate([historico, bloco])
+        posicao = np.arange(n_hist, ext.size) - atraso
+        traseiro = np.interp(posicao, np.arange(ext.size), ext)
+        historico = ext[-n_hist:]
+        yield np.stack([bloco, traseiro])
+
+
+def resposta_forcada_blocos(modelo, blocos_entrada):
+    """Gera ``(t, deslocamentos)`` por bloco de entrada, partindo do repouso.
+
+    Cada bloco de entrada tem forma (2, amostras); os deslocamentos, (GDL,
+    amostras). Entre blocos só o estado e a última amostra são guardados.
+    """
+    from scipy.signal import lfilter
+
+    T, H0, H1, saida, dt = modelo
+    N = T.shape[0]
+    diag = np.diagonal(T)
+    w_ant = np.zeros(N, dtype=complex)
+    u_ant = np.zeros(H0.shape[1])
+    k0 = 0
+    for u in blocos_entrada:
+        L = u.shape[1]
+        if L == 0:
+            continue
+        h = H0 @ np.column_stack([u_ant, u[:, :-1]]) + H1 @ u
+        # w[:, 0] é o estado anterior; a linha i só depende das linhas abaixo
+        w = np.empty((N, L + 1), dtype=complex)
+        w[:, 0] = w_ant
+        for i in range(N - 1, -1, -1):
+            x = h[i]
+            if i < N - 1:
+                x = x + T[i, i + 1:] @ w[i + 1:, :-1]
+            w[i, 1:] = lfilter([1.0], [1.0, -diag[i]], x, zi=[diag[i] * w_ant[i]])[0]
+        w_ant = w[:, -1].copy()
+        u_ant = u[:, -1]
+        yield (k0 + np.arange(L)) * dt, np.real(saida @ w[:, 1:])
+        k0 += L
+
+
+@medir_fase("resposta forçada")
+def resposta_forcada_decimada(modelo, blocos_entrada, n_amostras=None, pontos=4_000):
+    """Integra o histórico inteiro e o reduz a ~``pontos`` pontos por GDL.
+
+    Com ``n_amostras`` desconhecido (leitura em fluxo), usa baldes de
+    ``TAMANHO_BALDE`` amostras. RMS e pico são do histórico completo.
+    """
+    tamanho = max(1, -(-2 * n_amostras // pontos)) if n_amostras else TAMANHO_BALDE
+    partes = []
+    soma_quad = pico = 0.0
+    amostras = 0
+    for t, x in resposta_forcada_blocos(modelo, blocos_entrada):
+        partes.append(_minmax_baldes(t, x, tamanho))
+        soma_quad = soma_quad + np.einsum("ij,ij->i", x, x)
+        pico = np.maximum(pico, np.abs(x).max(axis=1))
+        amostras += t.size
+    if not partes:
+        raise ValueError("perfil da pista vazio")
+    return ResultadoForcado(np.concatenate([p[0] for p in partes], axis=1),
+                            np.concatenate([p[1] for p in partes], axis=1),
+                            np.sqrt(soma_quad / amostras), pico, amostras)
+
+
+def blocos_alinhados(perfil, n_amostras, pontos=4_000, bloco=BLOCO):
+    """Fatia um perfil em memória em blocos múltiplos do balde de decimação."""
+    tamanho = max(1, -(-2 * n_amostras // pontos))
+    bloco = max(tamanho, bloco // tamanho * tamanho)
+    return (perfil[i:i + bloco] for i in range(0, n_amostras, bloco))
+
+
+def modelo_pista(params, dt, zeta=None, amortecedores=None):
+    """Monta e discretiza o modelo: amortecimento modal (``zeta``) ou por mola."""
+    Mnum, Knum = matrizes_mk(**params)
+    if amortecedores is not None:
+        Cnum = amortecimento_molas(amortecedores, *(params[p] for p in "abcdefg"))
+        Kr, Cr = entrada_pneus(params["k5"], params["k7"], amortecedores[4],
+                               amortecedores[6])
+    else:
+        Cnum = amortecimento_modal(Mnum, Knum, 0.0 if zeta is None else zeta)
+        Kr, Cr = entrada_pneus(params["k5"], params["k7"])
+    return discretizar(Mnum, Cnum, Knum, Kr, Cr, dt)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Resposta forçada do modelo MDOF a um perfil de pista medido.")
+    parser.add_argument("arquivo", help="perfil sob o eixo dianteiro (m)")
+    amostragem = parser.add_mutually_exclusive_group(required=True)
+    amostragem.add_argument("--dt", type=float, help="s entre amostras")
+    amostragem.add_argument("--dx", type=float, help="m entre amostras (exige --velocidade)")
+    parser.add_argument("--velocidade", type=float, default=15.0, help="m/s")
+    parser.add_argument("--entre-eixos", type=float, default=None,
+                        help="m (padrão: |d − c| do modelo)")
+    parser.add_argument("--zeta", type=float, default=0.05, help="amortecimento modal")
+    parser.add_argument("--amortecedores", type=float, nargs=7, metavar="C",
+                        help="c1..c7 (N·s/m); substitui --zeta")
+    parser.add_argument("--parametro", action="append", default=[], metavar="NOME=VALOR",
+                        help=f"substitui um de {', '.join(PARAMETROS)}")
+    parser.add_argument("--coluna", type=int, default=0)
+    parser.add_argument("--cabecalho", type=int, default=0)
+    parser.add_argument("--dtype", default="<f8")
+    parser.add_argument("--n-colunas", type=int, default=1)
+    parser.add_argument("--bloco", type=int, default=BLOCO)
+    args = parser.parse_args(argv)
+
+    params = dict(PARAMETROS_PADRAO)
+    for item in args.parametro:
+        nome, _, valor = item.partition("=")
+        if nome not in params:
+            parser.error(f"parâmetro desconhecido: {nome}")
+        params[nome] = float(valor)
+    dt = args.dt if args.dt is not None else args.dx / args.velocidade
+
+    inicio = time.perf_counter()
+    modelo = modelo_pista(params, dt, args.zeta, args.amortecedores)
+    if modelo.instavel:
+        print("⚠️ O modelo tem modos instáveis: a resposta cresce sem limite.")
+    blocos = ler_serie_blocos(args.arquivo, args.coluna, args.bloco, args.dtype,
+                              args.n_colunas, args.cabecalho)
+    if args.entre_eixos is not None:
+        distancia = args.entre_eixos
+    else:
+        try:
+            distancia = distancia_entre_eixos(params["c"], params["d"])
+        except ValueError as erro:
+            parser.error(f"{erro}; informe --entre-eixos")
+    atraso = distancia / args.velocidade / dt
+    resultado = resposta_forcada_decimada(modelo, pista_eixos(blocos, atraso))
+    decorrido = time.perf_counter() - inicio
+
+    duracao = resultado.amostras * dt
+    print(f"{resultado.amostras:,} amostras ({duracao:,.1f} s de pista) em {decorrido:.2f} s "
+          f"— {duracao / decorrido:,.0f}× o tempo real")
+    for i, (rms, pico) in enumerate(zip(resultado.rms, resultado.pico)):
+        print(f"x{i + 1}: RMS {rms:.4g} m, pico {pico:.4g} m")
+
+
+if __name__ == "__main__":
+    main()
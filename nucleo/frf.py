@@ -0,0 +1,145 @@
+"""Funções de resposta em frequência (FRF) por superposição modal.
+
+H(ω) = Σ_r φ_r ψ_r / (ω_r² − ω² + 2 i ζ ω_r ω), com os modos normalizados
+pela massa (``VETn``). A grade de frequências inteira (e o lote de
+configurações) é avaliada em multiplicações matriciais com broadcasting,
+em fatias de até ``ELEMENTOS_MAX`` elementos; só os pares entrada/saída
+pedidos são formados.
+"""
+
+import numpy as np
+
+from nucleo.mdof import GDL_PNEUS, matrizes_mk_lote, modos_lote
+from nucleo.perfil import medir_fase
+
+ELEMENTOS_MAX = 1 << 19       # configurações × frequências avaliadas de uma vez
+
+
+def normalizar_modos(M, VET):
+    """Modos com φᵀ M φ = 1 (aceita lotes)."""
+    massa_modal = np.einsum("...ir,...ij,...jr->...r", VET, M, VET)
+    return VET / np.sqrt(massa_modal)[..., np.newaxis, :]
+
+
+def participacao(M, K, VETn):
+    """Linhas ψ_r que projetam forças nas coordenadas modais.
+
+    Com K simétrica é ``VETnᵀ``; no modelo não simétrico usa-se a
+    pseudo-inversa de M·VETn (exata quando todos os modos estão presentes).
+    """
+    if np.allclose(K, np.swapaxes(K, -1, -2)):
+        return np.swapaxes(VETn, -1, -2)
+    return np.linalg.pinv(M @ VETn)
+
+
+def frf_modal(VETn, wn, psi, freqs, entradas, saidas, zeta=0.02):
+    """Receptância (m/N) de forma (..., frequências, saídas, entradas).
+
+    ``wn`` NaN (modos de corpo rígido de ``modos_lote``) entra como ω = 0.
+    """
+    w = 2 * np.pi * np.asarray(freqs, dtype=float)[:, np.newaxis]
+    wn = np.nan_to_num(np.asarray(wn))[..., np.newaxis, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverso = 1 / (wn ** 2 - w ** 2 + 2j * zeta * wn * w)          # (..., F, R)
+
+    phi = np.swapaxes(VETn[..., list(saidas), :], -1, -2)             # (..., R, O)
+    psi = psi[..., :, list(entradas)]                                  # (..., R, I)
+    numerador = phi[..., :, :, np.newaxis] * psi[..., :, np.newaxis, :]
+    forma = numerador.shape
+    H = inverso @ numerador.reshape(*forma[:-2], -1)
+    return H.reshape(*H.shape[:-1], forma[-2], forma[-1])
+
+
+def transmissibilidade_pista(H_pneus, freqs, k5, k7, c5=0.0, c7=0.0, atraso=0.0):
+    """Deslocamento da saída por deslocamento da pista, forma (..., F, saídas).
+
+    ``H_pneus`` é a receptância com entradas nos dois pneus
+    (``GDL_PNEUS``); o eixo traseiro recebe o perfil ``atraso`` s depois.
+    """
+    w = 2 * np.pi * np.asarray(freqs, dtype=float)[:, np.newaxis]
+    k5, k7, c5, c7 = (np.asarray(v, dtype=float)[..., np.newaxis, np.newaxis]
+                      for v in (k5, k7, c5, c7))
+    return (H_pneus[..., 0] * (k5 + 1j * w * c5)
+            + H_pneus[..., 1] * (k7 + 1j * w * c7) * np.exp(-1j * w * atraso))
+
+
+@medir_fase("FRF (lote)")
+def pico_transmissibilidade_lote(freqs, saida, zeta=0.02, atraso=0.0, **params):
+    """Maior |T| pista → ``saida`` e sua frequência para cada configuração.
+
+    Os parâmetros seguem ``matrizes_mk_lote``; as configurações são
+    avaliadas em fatias de até ``ELEMENTOS_MAX`` pares configuração × frequência.
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    M, K = matrizes_mk_lote(**params)
+    k5, k7 = (np.broadcast_to(params[k], M.shape[:1]) for k in ("k5", "k7"))
+    fatia = max(1, ELEMENTOS_MAX // freqs.size)
+    picos = np.empty(M.shape[0])
+    f_picos = np.empty(M.shape[0])
+    for i in range(0, M.shape[0], fatia):
+        s = slice(i, i + fatia)
+        wn, VET = modos_lote(M[s], K[s])
+        VETn = normalizar_modos(M[s], VET)
+        H = frf_modal(VETn, wn, participacao(M[s], K[s], VETn), freqs,
+                      GDL_PNEUS, (saida,), zeta)
+        T = np.abs(transmissibilidade_pista(H, freqs, k5[s], k7[s], atraso=atraso)[..., 0])
+        maximo = np.nanargmax(T, axis=-1)
+        picos[s] = np.take_along_axis(T, maximo[:, np.newaxis], -1)[:, 0]
+        f_picos[s] = freqs[maximo]
+    return picos, f_picos
+
+
+def _baldes_log(f, pontos):
+    """Início (índice em ``f``) e centro geométrico dos baldes log-espaçados."""
+    bordas = np.geomspace(f[0], f[-1], pontos // 2 + 1)[:-1]
+    inicios = np.unique(np.searchsorted(f, bordas))
+    inicios = inicios[inicios < f.size]
+    fins = np.append(inicios[1:], f.size) - 1
+    return inicios, np.sqrt(f[inicios] * f[fins])
+
+
+def decimar_log(freqs, y, pontos=2_000):
+    """Reduz ``y`` (..., F) a ~``pontos`` pontos em baldes log-espaçados.
+
+    Cada balde contribui com seu mínimo e seu máximo no centro geométrico,
+    preservando ressonâncias e antirressonâncias; frequências <= 0 saem.
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    positivas = freqs > 0
+    f, y = freqs[positivas], y[..., positivas]
+    if f.size <= pontos:
+        return f, y
+    inicios, centros = _baldes_log(f, pontos)
+    par = np.stack([np.minimum.reduceat(y, inicios, axis=-1),
+                    np.maximum.reduceat(y, inicios, axis=-1)], axis=-1)
+    return np.repeat(centros, 2), par.reshape(*y.shape[:-1], -1)
+
+
+def decimar_log_fatias(freqs, calcular, pontos=2_000, fatia=ELEMENTOS_MAX):
+    """``decimar_log(freqs, calcular(freqs))`` sem formar ``y`` inteiro.
+
+    ``calcular(f)`` devolve (..., len(f)) para um trecho da grade, que é
+    percorrida em fatias de ``fatia`` frequências; mínimo e máximo de cada
+    balde são acumulados entre fatias. A memória fica limitada à fatia.
+    """
+    freqs = np.asarray(freqs, dtype=float)
+    f = freqs[np.searchsorted(freqs, 0.0, "right"):]      # grade crescente: vista, sem cópia
+    if f.size <= pontos:
+        return f, calcular(f)
+    inicios, centros = _baldes_log(f, pontos)
+    minimos = maximos = None
+    for i0 in range(0, f.size, fatia):
+        i1 = min(i0 + fatia, f.size)
+        y = calcular(f[i0:i1])
+        if minimos is None:
+            minimos = np.full((*y.shape[:-1], inicios.size), np.inf, dtype=y.dtype)
+            maximos = np.full_like(minimos, -np.inf)
+        b0 = np.searchsorted(inicios, i0, "right") - 1
+        b1 = np.searchsorted(inicios, i1 - 1, "right")
+        locais = np.maximum(inicios[b0:b1], i0) - i0
+        np.minimum(minimos[..., b0:b1], np.minimum.reduceat(y, locais, axis=-1),
+                   out=minimos[..., b0:b1])
+        np.maximum(maximos[..., b0:b1], np.maximum.reduceat(y, locais, axis=-1),
+                   out=maximos[..., b0:b1])
+    par = np.stack([minimos, maximos], axis=-1)
+    return np.repeat(centros, 2), par.reshape(*minimos.shape[:-1], -1)
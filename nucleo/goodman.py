@@ -0,0 +1,104 @@
+"""Verificação de fadiga por Goodman dos apps ``Tubo_Quadrado.py`` e ``Tubo_Redondo.py``.
+
+Inclui a avaliação de espectros de carga (pares σa, σm) pelos critérios
+de tensão média de Goodman, Gerber, ASME-elíptico e Soderberg.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from nucleo.perfil import medir_fase
+from nucleo.secoes import propriedades
+
+
+class ResultadoGoodman(NamedTuple):
+    sigma_n: np.ndarray           # tensão normal de flexão (MPa)
+    sigma_adm: np.ndarray         # tensão admissível de Goodman (MPa)
+    aprovado: np.ndarray          # sigma_n <= sigma_adm
+
+
+def tensao_flexao(M, tipo_tubo, dimensao, esp, altura=None):
+    """Tensão normal M·c/I (MPa) com c na face externa do tubo."""
+    secao = propriedades(tipo_tubo, dimensao, esp, altura)
+    return np.asarray(M, dtype=float) * secao.c / secao.I
+
+
+def tensao_admissivel_goodman(Se, Sut, n=1.0):
+    """Tensão admissível de Goodman para o fator de segurança ``n`` (MPa)."""
+    Se = np.asarray(Se, dtype=float)
+    return (Se * Sut) / (n * (Sut - Se))
+
+
+def envelope_goodman(Se, Sut, pontos=100):
+    """Pontos (σa, σm) do envelope de Goodman usado no gráfico."""
+    sigma_a = np.linspace(0, Sut, pontos)
+    return sigma_a, Se * (1 - sigma_a / Sut)
+
+
+@medir_fase("goodman: checagem")
+def verificar_goodman(M, tipo_tubo, dimensao, esp, Sut, Se, n=1.0, altura=None):
+    """Tensão de flexão, admissível de Goodman e veredito (aceita arrays)."""
+    sigma_n = tensao_flexao(M, tipo_tubo, dimensao, esp, altura)
+    sigma_adm = tensao_admissivel_goodman(Se, Sut, n)
+    return ResultadoGoodman(sigma_n, sigma_adm, sigma_n <= sigma_adm)
+
+
+# ========================
+# Espectros de carga: critérios de tensão média
+# ========================
+CRITERIOS = ("Goodman", "Gerber", "ASME", "Soderberg")
+
+
+class ResultadoEspectro(NamedTuple):
+    n: np.ndarray                 # (critério, ponto) fatores de segurança
+    n_min: np.ndarray             # (critério,) pior fator de cada critério
+    criterio: str                 # critério governante (menor fator)
+    piores: np.ndarray            # índices dos pontos mais críticos, do pior ao melhor
+
+
+def fatores_seguranca(sigma_a, sigma_m, Se, Sut, Sy):
+    """Fatores de segurança (4, pontos) na ordem de ``CRITERIOS``.
+
+    Linha de carga pela origem (Shigley, cap. 6). Tensão média
+    compressiva não alivia: entra como zero, e o fator vira Se/σa.
+    """
+    sigma_a = np.abs(np.asarray(sigma_a, dtype=float))
+    sigma_m = np.maximum(np.asarray(sigma_m, dtype=float), 0.0)
+    ra = sigma_a / Se
+    n = np.empty((len(CRITERIOS),) + np.broadcast_shapes(ra.shape, sigma_m.shape))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n[0] = 1 / (ra + sigma_m / Sut)
+        # Raiz da parábola de Gerber na forma sem cancelamento numérico
+        rm = sigma_m / Sut
+        n[1] = 2 / (ra + np.sqrt(ra ** 2 + 4 * rm ** 2))
+        n[2] = 1 / np.sqrt(ra ** 2 + (sigma_m / Sy) ** 2)
+        n[3] = 1 / (ra + sigma_m / Sy)
+    return n
+
+
+@medir_fase("goodman: espectro")
+def avaliar_espectro(sigma_a, sigma_m, Se, Sut, Sy, piores=10):
+    """Fatores de todos os critérios num só passe, com critério governante e piores pontos."""
+    if np.size(sigma_a) == 0 or np.size(sigma_m) == 0:
+        raise ValueError("Espectro vazio: nenhum ciclo (σa, σm) para avaliar")
+    n = fatores_seguranca(sigma_a, sigma_m, Se, Sut, Sy)
+    n_plano = n.reshape(len(CRITERIOS), -1)
+    n_min = n_plano.min(axis=1)
+    governante = n_plano.min(axis=0)
+    k = min(piores, governante.size)
+    candidatos = np.argpartition(governante, k - 1)[:k] if k else np.empty(0, dtype=np.intp)
+    return ResultadoEspectro(n, n_min, CRITERIOS[int(np.argmin(n_min))],
+                             candidatos[np.argsort(governante[candidatos])])
+
+
+def envelopes_tensao_media(Se, Sut, Sy, pontos=100):
+    """Curvas (σm, σa) de falha de cada critério, para o gráfico."""
+    m_ut = np.linspace(0, Sut, pontos)
+    m_y = np.linspace(0, Sy, pontos)
+    return {
+        "Goodman": (m_ut, Se * (1 - m_ut / Sut)),
+        "Gerber": (m_ut, Se * (1 - (m_ut / Sut) ** 2)),
+        "ASME": (m_y, Se * np.sqrt(1 - (m_y / Sy) ** 2)),
+        "Soderberg": (m_y, Se * (1 - m_y / Sy)),
+    }
@@ -0,0 +1,195 @@
+"""Gráficos dos apps renderizados para PNG, com cache LRU por entradas.
+
+As figuras são criadas com ``matplotlib.figure.Figure`` (fora do estado
+global do pyplot), renderizadas pelo backend Agg e descartadas logo em
+seguida; views repetidas reaproveitam os bytes já renderizados. O
+matplotlib só é importado quando algum gráfico precisa ser renderizado.
+"""
+
+import io
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
+
+from nucleo.chaves import chave_valor
+from nucleo.perfil import medir_fase
+
+TAMANHO_CACHE = 128
+
+
+class CacheFiguras:
+    """LRU de PNGs limitado em número de entradas, seguro entre threads."""
+
+    def __init__(self, tamanho=TAMANHO_CACHE):
+        self.tamanho = tamanho
+        self._itens = OrderedDict()
+        self._trava = threading.Lock()
+        self.acertos = self.falhas = 0
+
+    def obter(self, chave, renderizar):
+        with self._trava:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return self._itens[chave]
+            self.falhas += 1
+        png = renderizar()
+        with self._trava:
+            self._itens[chave] = png
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.tamanho:
+                self._itens.popitem(last=False)
+        return png
+
+    def limpar(self):
+        with self._trava:
+            self._itens.clear()
+
+    def __len__(self):
+        return len(self._itens)
+
+
+CACHE = CacheFiguras()
+
+
+@medir_fase("matplotlib: renderização")
+def renderizar_png(fig, dpi=100):
+    """Renderiza a figura em PNG e libera seus artistas."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    FigureCanvasAgg(fig)
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    finally:
+        fig.clear()
+    return buffer.getvalue()
+
+
+def figura_em_cache(construtor):
+    """Decora um construtor ``(...) -> Figure`` para devolver PNG em cache."""
+    @wraps(construtor)
+    def wrapper(*args, **kwargs):
+        chave = (construtor.__qualname__, chave_valor(args), chave_valor(kwargs))
+        return CACHE.obter(chave, lambda: renderizar_png(construtor(*args, **kwargs)))
+    return wrapper
+
+
+# ========================
+# Gráficos dos apps
+# ========================
+@figura_em_cache
+def grafico_goodman(Se, Sut, sigma_n):
+    """Envelope de Goodman com a tensão normal aplicada."""
+    from matplotlib.figure import Figure
+
+    from nucleo.goodman import envelope_goodman
+
+    sigma_a, sigma_m = envelope_goodman(Se, Sut)
+    fig = Figure()
+    ax = fig.subplots()
+    ax.plot(sigma_a, sigma_m, label='Envelope Goodman')
+    ax.axhline(sigma_n, color='r', linestyle='--', label='Tensão Normal')
+    ax.set_xlabel("Tensão Alternada (MPa)")
+    ax.set_ylabel("Tensão Média (MPa)")
+    ax.legend()
+    return fig
+
+
+@figura_em_cache
+def grafico_espessuras(espessuras, sigmas, espessura, Sut, Sy, sigma_adm, N):
+    """Barras de tensão total por espessura no ensaio ISO 7173."""
+    from matplotlib.figure import Figure
+
+    cores = ['skyblue' if esp != espessura else 'orange' for esp in espessuras]
+
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    bars = ax.bar([str(e) for e in espessuras], sigmas, color=cores)
+
+    ax.axhline(Sut, color='red', linestyle='--', label=f'Sut = {Sut} MPa (Ruptura)')
+    ax.axhline(Sy, color='orange', linestyle='--', label=f'Sy = {Sy:.0f} MPa (Deformação)')
+    ax.axhline(sigma_adm, color='green', linestyle='--', label=f'Se ({N:,} ciclos) = {sigma_adm:.0f} MPa (Fadiga)')
+
+    for bar, sigma in zip(bars, sigmas):
+        height = bar.get_height()
+        ax.annotate(f"{sigma:.0f}", xy=(bar.get_x() + bar.get_width() / 2, height), xytext=(0, 5),
+                    textcoords="offset points", ha='center', va='bottom')
+
+    ax.set_xlabel("Espessura da Parede do Tubo (mm)")
+    ax.set_ylabel("Tensão Total (MPa)")
+    ax.set_title("Tensão Total x Espessura - Ensaio ISO 7173")
+    ax.grid(True, axis='y')
+    ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=2)
+    return fig
+
+
+@figura_em_cache
+def grafico_resposta(t, response):
+    """Deslocamento de cada GDL no tempo (``t`` por GDL ou comum)."""
+    from matplotlib.figure import Figure
+
+    t = np.broadcast_to(t, response.shape)
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    for i in range(response.shape[0]):
+        ax.plot(t[i], response[i], label=f'x{i+1}')
+    ax.set_xlabel("Tempo (s)")
+    ax.set_ylabel("Deslocamento (m)")
+    ax.legend()
+    ax.grid()
+    return fig
+
+
+@figura_em_cache
+def grafico_mapa_frequencias(x, fn, parametro):
+    """Frequências naturais de cada configuração contra um parâmetro varrido."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    for modo in range(fn.shape[1]):
+        ax.scatter(x, fn[:, modo], s=4, alpha=0.4, label=f'Modo {modo+1}')
+    ax.set_xlabel(f"Parâmetro {parametro}")
+    ax.set_ylabel("Frequência Natural (Hz)")
+    ax.legend(markerscale=3, ncol=4)
+    ax.grid()
+    return fig
+
+
+@figura_em_cache
+def grafico_frf(f, magnitudes, rotulos, unidade):
+    """|FRF| em escala log-log; ``magnitudes`` (curvas, pontos) já decimadas."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    for y, rotulo in zip(magnitudes, rotulos):
+        ax.loglog(f, y, label=rotulo)
+    ax.set_xlabel("Frequência (Hz)")
+    ax.set_ylabel(f"|H| ({unidade})")
+    ax.legend()
+    ax.grid(which="both", alpha=0.4)
+    return fig
+
+
+@figura_em_cache
+def grafico_espectro(Se, Sut, Sy, sigma_m, sigma_a):
+    """Espectro (σm, σa) como densidade hexbin sobre os envelopes de falha."""
+    from matplotlib.figure import Figure
+
+    from nucleo.goodman import envelopes_tensao_media
+
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    hb = ax.hexbin(sigma_m, sigma_a, gridsize=80, bins='log', mincnt=1, cmap='Blues')
+    fig.colorbar(hb, ax=ax, label='Ciclos por célula')
+    for (nome, (m, a)), cor in zip(envelopes_tensao_media(Se, Sut, Sy).items(),
+                                   ('green', 'purple', 'orange', 'red')):
+        ax.plot(m, a, color=cor, label=f'Envelope {nome}')
+    ax.set_xlabel("Tensão Média (MPa)")
+    ax.set_ylabel("Tensão Alternada (MPa)")
+    ax.legend()
+    return fig
@@ -0,0 +1,231 @@
+"""Recálculo incremental: grafo de etapas nomeadas com saídas memorizadas.
+
+Cada etapa é uma função cujos parâmetros são os nomes das etapas ou
+entradas de que ela depende. ``definir`` troca entradas; pedir uma etapa
+(``grafo["veredito"]``) recalcula só o que está a jusante de algo que
+mudou. Uma etapa recalculada que devolve o mesmo valor de antes não
+invalida as seguintes (corte antecipado).
+
+Nas páginas, o grafo fica no ``st.session_state`` (``grafo_da_sessao``), então
+um rerun do Streamlit custa só as etapas afetadas pelo widget alterado.
+Cada recálculo aparece como fase ``etapa: <nome>`` no perfil.
+"""
+
+import inspect
+import threading
+
+import numpy as np
+
+from nucleo.chaves import chave_valor
+from nucleo.perfil import fase
+
+
+class Grafo:
+    """Etapas memorizadas, invalidadas só a jusante das entradas alteradas."""
+
+    def __init__(self):
+        self._funcoes = {}        # etapa -> função
+        self._dependencias = {}   # etapa -> nomes dos parâmetros
+        self._valores = {}        # entrada ou etapa -> valor atual
+        self._chaves = {}         # entrada ou etapa -> chave do valor
+        self._versoes = {}        # entrada ou etapa -> versão do valor
+        self._lidas = {}          # etapa -> versões das dependências no último cálculo
+        self._relogio = 0
+        self._trava = threading.RLock()
+        self.recalculadas = []    # etapas recalculadas desde o último ``definir``
+
+    def etapa(self, funcao):
+        """Registra ``funcao`` como etapa com o nome dela (decorador)."""
+        nome = funcao.__name__
+        self._funcoes[nome] = funcao
+        self._dependencias[nome] = tuple(inspect.signature(funcao).parameters)
+        return funcao
+
+    def _guardar(self, nome, valor):
+        """Guarda o valor; a versão só avança se ele de fato mudou (NaN igual a NaN)."""
+        chave = chave_valor(valor)
+        try:
+            igual = nome in self._versoes and bool(self._chaves[nome] == chave)
+        except (TypeError, ValueError):
+            igual = False
+        if not igual:
+            self._relogio += 1
+            self._valores[nome], self._chaves[nome] = valor, chave
+            self._versoes[nome] = self._relogio
+
+    def definir(self, **entradas):
+        """Atualiza entradas; as que não mudaram não invalidam nada."""
+        with self._trava:
+            self.recalculadas = []
+            for nome, valor in entradas.items():
+                if nome in self._funcoes:
+                    raise ValueError(f"{nome} é uma etapa, não uma entrada")
+                self._guardar(nome, valor)
+
+    def __getitem__(self, nome):
+        with self._trava:
+            if nome not in self._funcoes:
+                if nome not in self._valores:
+                    raise KeyError(f"entrada não definida: {nome}")
+                return self._valores[nome]
+            dependencias = self._dependencias[nome]
+            argumentos = [self[d] for d in dependencias]
+            lidas = tuple(self._versoes[d] for d in dependencias)
+            if self._lidas.get(nome) != lidas:
+                with fase(f"etapa: {nome}"):
+                    valor = self._funcoes[nome](*argumentos)
+                self._guardar(nome, valor)
+                self._lidas[nome] = lidas
+                self.recalculadas.append(nome)
+            return self._valores[nome]
+
+
+def grafo_da_sessao(nome, construtor):
+    """Grafo da sessão do Streamlit, criado por ``construtor`` na primeira vez."""
+    import streamlit as st
+
+    chave = f"grafo_{nome}"
+    salvo = st.session_state.get(chave)
+    if salvo is None or salvo[0] is not construtor:
+        # Construtor novo (módulo recarregado): memórias antigas não valem mais
+        salvo = st.session_state[chave] = (construtor, construtor())
+    return salvo[1]
+
+
+# ========================
+# Grafos das páginas
+# ========================
+def grafo_iso7173():
+    """cargas → seção → tensão → (admissível) → veredito → gráfico (página ISO 7173).
+
+    Entradas: tipo_tubo, largura, espessura, N, espessuras. Trocar N só
+    refaz admissível e veredito; trocar a geometria só seção, tensão e
+    veredito. As etapas são fórmulas fechadas, baratas perto de uma
+    consulta ao armazém de resultados, então a memória do grafo basta;
+    o armazém fica para a análise modal (``grafo_mdof``).
+    """
+    from nucleo import iso7173
+    from nucleo.graficos import grafico_espessuras
+    from nucleo.otimizador import otimizar_tubo
+    from nucleo.secoes import propriedades
+
+    grafo = Grafo()
+
+    @grafo.etapa
+    def cargas():
+        M_fixo_horizontal, M_encosto = iso7173.momentos_iso7173()
+        return M_fixo_horizontal, M_encosto, iso7173.momento_total_iso7173()
+
+    @grafo.etapa
+    def secao(tipo_tubo, largura, espessura):
+        return propriedades(tipo_tubo, largura, espessura)
+
+    @grafo.etapa
+    def tensao(cargas, secao):
+        return float(cargas[2] / secao.W_solda)
+
+    @grafo.etapa
+    def admissivel(N):
+        return float(iso7173.tensao_fadiga_admissivel(N))
+
+    @grafo.etapa
+    def veredito(tensao, admissivel):
+        return iso7173.ResultadoISO7173(tensao, admissivel,
+                                        int(iso7173.classificar_estatico(tensao)),
+                                        bool(iso7173.resiste_fadiga(tensao, admissivel)))
+
+    @grafo.etapa
+    def mensagens(veredito, N):
+        return iso7173.mensagens_iso7173(veredito.estatico, veredito.sigma_total, veredito.sigma_adm, N)
+
+    @grafo.etapa
+    def tensoes_espessuras(cargas, tipo_tubo, largura, espessuras):
+        return iso7173.tensao_garganta(cargas[2], largura, np.array(espessuras), tipo_tubo)
+
+    @grafo.etapa
+    def grafico(tensoes_espessuras, espessuras, espessura, admissivel, N):
+        return grafico_espessuras(espessuras, tensoes_espessuras, espessura, iso7173.SUT,
+                                  iso7173.SY, admissivel, N)
+
+    @grafo.etapa
+    def otimo(tipo_tubo, N):
+        return otimizar_tubo(tipo_tubo, N)
+
+    return grafo
+
+
+def grafo_mdof():
+    """matrizes → modos → resposta → gráfico (página de vibração MDOF).
+
+    Entradas: parametros (dict de ``PARAMETROS``), t_final, n_amostras,
+    f_max_frf, n_freq, entrada (GDL da força, ou None para a pista),
+    saidas_frf, zeta_frf. Matrizes e modos vêm do armazém de resultados
+    (``analise_modal``) antes de serem calculados.
+    """
+    from nucleo import graficos, mdof
+    from nucleo.resultados import analise_modal
+    from nucleo.frf import (ELEMENTOS_MAX, decimar_log_fatias, frf_modal, participacao,
+                            transmissibilidade_pista)
+    from nucleo.resposta import coeficientes_modais, resposta_livre_decimada
+
+    grafo = Grafo()
+
+    @grafo.etapa
+    def analise(parametros):
+        return analise_modal(**parametros)
+
+    @grafo.etapa
+    def matrizes(analise):
+        return analise[:2]
+
+    @grafo.etapa
+    def modos(analise):
+        return analise[2:]
+
+    @grafo.etapa
+    def coeficientes(matrizes, modos):
+        wn, VET = modos
+        X0 = np.linspace(0.01, 0.05, VET.shape[0]).reshape(-1, 1)
+        V0 = np.linspace(1, 5, VET.shape[0]).reshape(-1, 1)
+        return coeficientes_modais(matrizes[0], VET, wn, X0, V0)
+
+    @grafo.etapa
+    def resposta(modos, coeficientes, t_final, n_amostras):
+        VETn, MAT1, MAT2 = coeficientes
+        return resposta_livre_decimada(VETn, modos[0], MAT1, MAT2, t_final, n_amostras)
+
+    @grafo.etapa
+    def grafico_livre(resposta):
+        return graficos.grafico_resposta(*resposta)
+
+    @grafo.etapa
+    def frequencias(f_max_frf, n_freq):
+        return np.linspace(0.0, f_max_frf, n_freq)
+
+    @grafo.etapa
+    def frf(matrizes, modos, coeficientes, frequencias, parametros, entrada, saidas_frf,
+            zeta_frf):
+        Mnum, Knum = matrizes
+        VETn = coeficientes[0]
+        saidas = [mdof.GDL.index(n) for n in saidas_frf]
+        psi = participacao(Mnum, Knum, VETn)
+        if entrada is None:
+            def magnitude(f):
+                H = frf_modal(VETn, modos[0], psi, f, mdof.GDL_PNEUS, saidas, zeta_frf)
+                return np.abs(transmissibilidade_pista(H, f, parametros["k5"], parametros["k7"])).T
+            unidade = "m/m"
+        else:
+            def magnitude(f):
+                return np.abs(frf_modal(VETn, modos[0], psi, f, (mdof.GDL.index(entrada),),
+                                        saidas, zeta_frf)[..., 0]).T
+            unidade = "m/N"
+        # Grade avaliada em fatias: (frequências × modos) por fatia fica em ELEMENTOS_MAX
+        fatia = max(1, ELEMENTOS_MAX // VETn.shape[-1])
+        return (*decimar_log_fatias(frequencias, magnitude, fatia=fatia), unidade)
+
+    @grafo.etapa
+    def grafico_frf(frf, saidas_frf):
+        f, magnitudes, unidade = frf
+        return graficos.grafico_frf(f, magnitudes, list(saidas_frf), unidade)
+
+    return grafo
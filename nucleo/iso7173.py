@@ -0,0 +1,188 @@
+"""Checagem vetorizada da solda de cadeiras conforme a ISO 7173.
+
+As mesmas fórmulas de ``Veiga-FatigueCheck.py``, avaliadas em lote sobre
+toda a grade largura × espessura × tipo de tubo × número de ciclos. As
+propriedades da solda vêm de ``nucleo.secoes``.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from nucleo.perfil import medir_fase
+from nucleo.secoes import ESPESSURAS_CATALOGO, propriedades
+
+# ========================
+# Catálogo e constantes padrão
+# ========================
+TIPOS_TUBO = ("Quadrado", "Redondo")
+ESPESSURAS_LISTA = ESPESSURAS_CATALOGO                            # mm
+N_LISTA = (5_000, 12_500, 25_000, 50_000, 100_000, 200_000)
+
+SUT = 310                     # MPa
+SY = 0.65 * SUT               # MPa
+SE = 0.5 * SUT                # MPa
+A_CICLO = 1e6
+B_CICLO = 5
+
+# Cargas do ensaio ISO 7173
+F_VERTICAL_PER_FOOT = 237.5   # N
+F_HORIZONTAL = 165.0          # N
+Q = 950.0                     # N/m, carga distribuída no tubo horizontal
+L = 0.5                       # m, vão do tubo horizontal
+ALTURA_ENCOSTO = 750.0        # mm
+ALTURA_ASSENTO = 450.0        # mm
+
+# Códigos do veredito estático
+APROVADO = 0                  # sigma < Sy
+DEFORMA = 1                   # Sy <= sigma < Sut
+ROMPE = 2                     # sigma >= Sut
+
+# Tamanho da varredura
+ELEMENTOS_MAX = 1 << 19       # células avaliadas de uma vez
+GRADE_MAX = 1 << 28           # células tipo × largura × espessura × N aceitas
+
+# Ícones dos alertas do Streamlit, por nível
+ICONES = {"success": "✅", "warning": "⚠️", "error": "❌"}
+
+
+class ResultadoISO7173(NamedTuple):
+    """Checagem ponto a ponto; os campos seguem o broadcasting das entradas."""
+    sigma_total: np.ndarray       # MPa
+    sigma_adm: np.ndarray         # MPa
+    estatico: np.ndarray          # APROVADO/DEFORMA/ROMPE
+    fadiga: np.ndarray            # resiste aos ciclos
+
+
+class ResultadoVarredura(NamedTuple):
+    """Resultado da varredura; eixos (tipo, largura, espessura[, N])."""
+    sigma: np.ndarray             # (T, W, E) float64, MPa
+    sigma_adm: np.ndarray         # (N,) float64, MPa
+    estatico: np.ndarray          # (T, W, E) int8, APROVADO/DEFORMA/ROMPE
+    fadiga: np.ndarray            # (T, W, E, N) bool, resiste aos ciclos
+
+
+def momentos_iso7173(q=Q, L=L, F_horizontal=F_HORIZONTAL,
+                     altura_encosto=ALTURA_ENCOSTO, altura_assento=ALTURA_ASSENTO):
+    """Momentos (N·m) do tubo horizontal engastado e da força do encosto."""
+    M_fixo_horizontal = (q * L ** 2) / 12
+    M_encosto = F_horizontal * (altura_encosto - altura_assento) / 1_000
+    return M_fixo_horizontal, M_encosto
+
+
+def momento_total_iso7173(q=Q, L=L, F_horizontal=F_HORIZONTAL,
+                          altura_encosto=ALTURA_ENCOSTO, altura_assento=ALTURA_ASSENTO):
+    """Momento na junta (N·mm): tubo horizontal engastado + encosto."""
+    M_fixo_horizontal, M_encosto = momentos_iso7173(q, L, F_horizontal,
+                                                    altura_encosto, altura_assento)
+    return (M_fixo_horizontal + M_encosto) * 1_000
+
+
+M_TOTAL = momento_total_iso7173()
+
+
+def inercia_solda(tipo_tubo, largura, espessura, altura=None):
+    """Inércia da linha de solda por unidade de garganta (mm³)."""
+    return propriedades(tipo_tubo, largura, espessura, altura).I_solda
+
+
+def tensao_garganta(M_total, largura, espessura, tipo_tubo, altura=None):
+    """Tensão na garganta da solda (MPa), com broadcasting entre argumentos."""
+    return M_total / propriedades(tipo_tubo, largura, espessura, altura).W_solda
+
+
+def tensao_fadiga_admissivel(N, Se=SE, a_ciclo=A_CICLO, b_ciclo=B_CICLO):
+    """Tensão admissível de Basquin para N ciclos (MPa)."""
+    return Se * (a_ciclo / np.asarray(N, dtype=float)) ** (1 / b_ciclo)
+
+
+def classificar_estatico(sigma, Sy=SY, Sut=SUT):
+    """Veredito estático: APROVADO (< Sy), DEFORMA (< Sut) ou ROMPE."""
+    sigma = np.asarray(sigma)
+    return ((sigma >= Sy).astype(np.int8) + (sigma >= Sut)).astype(np.int8)
+
+
+def resiste_fadiga(sigma, sigma_adm, Sut=SUT):
+    """True se a tensão aplicada resiste aos ciclos.
+
+    Quando a admissível de Basquin passa de Sut, o limite passa a ser a
+    própria ruptura, como na análise do app.
+    """
+    return np.asarray(sigma) < np.minimum(sigma_adm, Sut)
+
+
+@medir_fase("iso7173: checagem")
+def checar_iso7173(tipo_tubo, largura, espessura, N, M_total=M_TOTAL, Sut=SUT,
+                   Sy=SY, Se=SE, a_ciclo=A_CICLO, b_ciclo=B_CICLO, altura=None):
+    """Checagem do app para um ou vários pontos (entradas com broadcasting)."""
+    sigma = tensao_garganta(M_total, largura, espessura, tipo_tubo, altura)
+    sigma_adm = tensao_fadiga_admissivel(N, Se, a_ciclo, b_ciclo)
+    return ResultadoISO7173(sigma, sigma_adm, classificar_estatico(sigma, Sy, Sut),
+                            resiste_fadiga(sigma, sigma_adm, Sut))
+
+
+@medir_fase("iso7173: varredura")
+def varrer_iso7173(larguras, espessuras=ESPESSURAS_LISTA, N_lista=N_LISTA,
+                   tipos=TIPOS_TUBO, M_total=M_TOTAL, Sut=SUT, Sy=SY, Se=SE,
+                   a_ciclo=A_CICLO, b_ciclo=B_CICLO):
+    """Avalia toda a grade tipo × largura × espessura × N numa só chamada.
+
+    As larguras são avaliadas em fatias de até ``ELEMENTOS_MAX`` células,
+    direto nos arrays de saída; grades com mais de ``GRADE_MAX`` células
+    tipo × largura × espessura × N são recusadas.
+    """
+    T = np.asarray(tipos)
+    W = np.asarray(larguras, dtype=float)
+    E = np.asarray(espessuras, dtype=float)
+    sigma_adm = tensao_fadiga_admissivel(N_lista, Se, a_ciclo, b_ciclo)
+    forma = (T.size, W.size, E.size)
+    celulas = T.size * W.size * E.size * max(np.size(sigma_adm), 1)
+    if celulas > GRADE_MAX:
+        raise ValueError(f"Grade de {celulas:,} células passa do limite de {GRADE_MAX:,}; "
+                         f"divida a varredura")
+
+    sigma = np.empty(forma)
+    estatico = np.empty(forma, dtype=np.int8)
+    fadiga = np.empty(np.broadcast_shapes((*forma, 1), np.shape(sigma_adm)), dtype=bool)
+    fatia = max(1, ELEMENTOS_MAX // max(1, T.size * E.size * np.size(sigma_adm)))
+    for i in range(0, W.size, fatia):
+        s = slice(i, i + fatia)
+        sigma[:, s] = tensao_garganta(M_total, W[None, s, None], E[None, None, :], T[:, None, None])
+        estatico[:, s] = classificar_estatico(sigma[:, s], Sy, Sut)
+        fadiga[:, s] = resiste_fadiga(sigma[:, s, :, None], sigma_adm, Sut)
+    return ResultadoVarredura(sigma, sigma_adm, estatico, fadiga)
+
+
+# ========================
+# Textos dos vereditos
+# ========================
+def mensagens_iso7173(estatico, sigma_total, sigma_adm, N, Sut=SUT):
+    """Vereditos da página ISO 7173 como (nível, texto em markdown).
+
+    O nível é o nome do alerta do Streamlit (``success``, ``warning``,
+    ``error``); o ícone correspondente fica em ``ICONES``.
+    """
+    if estatico == APROVADO:
+        mensagens = [("success", "**APROVADO**: Não ocorre deformação permanente (Sy).")]
+    elif estatico == DEFORMA:
+        mensagens = [("warning", "**ATENÇÃO**: Pode ocorrer deformação permanente, mas não "
+                                 "ruptura imediata (entre Sy e Sut).")]
+    else:
+        mensagens = [("error", "**FALHA**: Pode ocorrer ruptura sob carga estática (acima de Sut).")]
+
+    if sigma_adm > Sut:
+        if sigma_total < Sut:
+            mensagens.append(("success", (
+                f"A tensão de fadiga admissível calculada ({sigma_adm:.2f} MPa) excede o limite de "
+                f"ruptura ({Sut} MPa), mas como a tensão aplicada ({sigma_total:.2f} MPa) está abaixo "
+                f"de {Sut} MPa, o componente **NÃO ROMPE e RESISTE** ao ensaio de {N:,} ciclos.")))
+        else:
+            mensagens.append(("error", (
+                f"A tensão de fadiga admissível calculada ({sigma_adm:.2f} MPa) excede o limite de "
+                f"ruptura ({Sut} MPa), e a tensão aplicada ({sigma_total:.2f} MPa) também excede, "
+                f"indicando ROMPIMENTO sob carga estática antes de {N:,} ciclos.")))
+    elif sigma_total < sigma_adm:
+        mensagens.append(("success", f"Resiste ao ensaio de fadiga de {N:,} ciclos."))
+    else:
+        mensagens.append(("error", f"Pode falhar antes de {N:,} ciclos no ensaio de fadiga."))
+    return mensagens
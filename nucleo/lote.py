@@ -0,0 +1,205 @@
+"""Validação em lote de projetos lidos de CSV/Parquet, sem interface.
+
+Cada linha é um projeto; as linhas são divididas em blocos e avaliadas de
+forma vetorizada em processos separados. Os vereditos são gravados ao lado
+das colunas de entrada::
+
+    python -m nucleo.lote projetos.csv resultados.csv --verificacao iso7173
+
+Colunas por verificação (as opcionais assumem os valores dos apps):
+
+- ``iso7173``: tipo_tubo, largura, espessura, N
+  [altura, M_total, Sut, Sy, Se, a_ciclo, b_ciclo]
+- ``goodman``: tipo_tubo, dimensao, esp, M [altura, Sut, Se, n]
+- ``modal``: a..g, k1..k7, m1..m5
+- ``otimizador``: tipo_tubo, N [F_horizontal, q, altura_encosto]
+- ``sequencia``: tipo_tubo, largura, espessura
+  [altura, largura_encosto, espessura_encosto, Sut, Sy, Se]
+"""
+
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from nucleo import iso7173
+from nucleo.goodman import verificar_goodman
+from nucleo.mdof import N_GDL, PARAMETROS, frequencias_naturais_lote
+from nucleo.otimizador import otimizar_tubo
+from nucleo.sequencia import ENSAIOS, JUNTAS, PERNAS, momentos_cadeira, simular_sequencia
+
+TAMANHO_BLOCO = 2_000
+VEREDITO_ESTATICO = np.array(["APROVADO", "DEFORMA", "ROMPE"])
+
+
+def colunas(bloco, obrigatorias, opcionais=()):
+    """Extrai colunas numéricas do bloco; ``tipo_tubo`` fica como texto."""
+    faltando = [c for c in obrigatorias if c not in bloco]
+    if faltando:
+        raise KeyError(f"Colunas ausentes: {faltando}")
+    saida = {}
+    for nome in (*obrigatorias, *(c for c in opcionais if c in bloco)):
+        valores = np.asarray(bloco[nome])
+        saida[nome] = valores if nome == "tipo_tubo" else valores.astype(float)
+    return saida
+
+
+def avaliar_iso7173(bloco):
+    c = colunas(bloco, ("tipo_tubo", "largura", "espessura", "N"),
+                 ("altura", "M_total", "Sut", "Sy", "Se", "a_ciclo", "b_ciclo"))
+    r = iso7173.checar_iso7173(
+        c["tipo_tubo"], c["largura"], c["espessura"], c["N"],
+        c.get("M_total", iso7173.M_TOTAL), c.get("Sut", iso7173.SUT),
+        c.get("Sy", iso7173.SY), c.get("Se", iso7173.SE),
+        c.get("a_ciclo", iso7173.A_CICLO), c.get("b_ciclo", iso7173.B_CICLO),
+        c.get("altura"))
+    return {
+        "sigma_total": r.sigma_total,
+        "sigma_adm": r.sigma_adm,
+        "estatico": VEREDITO_ESTATICO[r.estatico],
+        "fadiga": np.where(r.fadiga, "RESISTE", "FALHA"),
+    }
+
+
+def avaliar_goodman(bloco):
+    c = colunas(bloco, ("tipo_tubo", "dimensao", "esp", "M"), ("altura", "Sut", "Se", "n"))
+    Sut = c.get("Sut", 310.0)
+    r = verificar_goodman(c["M"], c["tipo_tubo"], c["dimensao"], c["esp"],
+                          Sut, c.get("Se", 0.5 * Sut), c.get("n", 1.0), c.get("altura"))
+    return {
+        "sigma_n": r.sigma_n,
+        "sigma_adm": np.broadcast_to(r.sigma_adm, r.sigma_n.shape),
+        "veredito": np.where(r.aprovado, "APROVADO", "REPROVADO"),
+    }
+
+
+def avaliar_modal(bloco):
+    c = colunas(bloco, PARAMETROS)
+    fn = frequencias_naturais_lote(**c)
+    return {f"fn{i + 1}": fn[:, i] for i in range(N_GDL)}
+
+
+def avaliar_otimizador(bloco):
+    c = colunas(bloco, ("tipo_tubo", "N"), ("F_horizontal", "q", "altura_encosto"))
+    r = otimizar_tubo(c["tipo_tubo"], c["N"], c.get("F_horizontal", iso7173.F_HORIZONTAL),
+                      c.get("q", iso7173.Q), c.get("altura_encosto", iso7173.ALTURA_ENCOSTO))
+    return {
+        "largura_otima": r.largura,
+        "altura_otima": r.altura,
+        "espessura_otima": r.espessura,
+        "area": r.area,
+        "sigma_total": r.sigma_total,
+    }
+
+
+def avaliar_sequencia(bloco):
+    c = colunas(bloco, ("tipo_tubo", "largura", "espessura"),
+                 ("altura", "largura_encosto", "espessura_encosto", "Sut", "Sy", "Se"))
+    # Uma linha por cadeira, uma coluna por junta
+    largura = np.where(PERNAS, c["largura"][:, None],
+                       c.get("largura_encosto", c["largura"])[:, None])
+    espessura = np.where(PERNAS, c["espessura"][:, None],
+                         c.get("espessura_encosto", c["espessura"])[:, None])
+    altura = c["altura"][:, None] if "altura" in c else None
+    material = {nome: c[nome][:, None] for nome in ("Sut", "Sy", "Se") if nome in c}
+    r = simular_sequencia(momentos_cadeira(), c["tipo_tubo"][:, None], largura, espessura,
+                          altura, **material)
+    linhas = np.arange(r.junta_critica.size)
+    ensaio = r.ensaio_falha[linhas, r.junta_critica]
+    return {
+        "veredito": np.where(r.aprovado, "APROVADO", "FALHA"),
+        "junta_critica": np.array(JUNTAS)[r.junta_critica],
+        "ensaio_falha": np.where(ensaio >= 0, np.array(ENSAIOS)[ensaio], ""),
+        "ciclo_falha": r.ciclo_falha[linhas, r.junta_critica],
+        "dano_max": r.dano_total.max(axis=-1),
+    }
+
+
+VERIFICACOES = {
+    "iso7173": avaliar_iso7173,
+    "goodman": avaliar_goodman,
+    "modal": avaliar_modal,
+    "otimizador": avaliar_otimizador,
+    "sequencia": avaliar_sequencia,
+}
+
+
+# ========================
+# Entrada e saída
+# ========================
+def ler_tabela(caminho):
+    """Lê CSV ou Parquet como dict coluna -> lista de valores."""
+    caminho = Path(caminho)
+    if caminho.suffix.lower() == ".parquet":
+        try:
+            import pandas as pd
+        except ImportError as erro:
+            raise SystemExit("Leitura de Parquet requer pandas e pyarrow.") from erro
+        return {nome: serie.tolist() for nome, serie in pd.read_parquet(caminho).items()}
+    with open(caminho, newline="") as arquivo:
+        linhas = list(csv.DictReader(arquivo))
+    return {nome: [linha[nome] for linha in linhas] for nome in (linhas[0] if linhas else ())}
+
+
+def gravar_tabela(caminho, tabela):
+    """Grava dict coluna -> valores em CSV ou Parquet."""
+    caminho = Path(caminho)
+    if caminho.suffix.lower() == ".parquet":
+        try:
+            import pandas as pd
+        except ImportError as erro:
+            raise SystemExit("Gravação de Parquet requer pandas e pyarrow.") from erro
+        pd.DataFrame(tabela).to_parquet(caminho, index=False)
+        return
+    with open(caminho, "w", newline="") as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(tabela)
+        escritor.writerows(zip(*tabela.values()))
+
+
+def _avaliar_bloco(verificacao, bloco):
+    return {nome: np.asarray(v).tolist() for nome, v in VERIFICACOES[verificacao](bloco).items()}
+
+
+def avaliar_tabela(tabela, verificacao, processos=None, tamanho_bloco=TAMANHO_BLOCO):
+    """Avalia todas as linhas em blocos distribuídos por um pool de processos.
+
+    Devolve a tabela de entrada acrescida das colunas de resultado.
+    """
+    n = len(next(iter(tabela.values()), []))
+    blocos = [{nome: valores[i:i + tamanho_bloco] for nome, valores in tabela.items()}
+              for i in range(0, n, tamanho_bloco)]
+    if processos == 1 or len(blocos) <= 1:
+        resultados = [_avaliar_bloco(verificacao, b) for b in blocos]
+    else:
+        with ProcessPoolExecutor(processos) as pool:
+            resultados = list(pool.map(partial(_avaliar_bloco, verificacao), blocos))
+
+    saida = dict(tabela)
+    for nome in (resultados[0] if resultados else ()):
+        saida[nome] = [v for r in resultados for v in r[nome]]
+    return saida
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validação em lote de projetos (CSV/Parquet).")
+    parser.add_argument("entrada")
+    parser.add_argument("saida")
+    parser.add_argument("--verificacao", choices=VERIFICACOES, default="iso7173")
+    parser.add_argument("--processos", type=int, default=os.cpu_count())
+    parser.add_argument("--tamanho-bloco", type=int, default=TAMANHO_BLOCO)
+    args = parser.parse_args(argv)
+
+    tabela = avaliar_tabela(ler_tabela(args.entrada), args.verificacao,
+                            args.processos, args.tamanho_bloco)
+    gravar_tabela(args.saida, tabela)
+    n = len(next(iter(tabela.values()), []))
+    print(f"{n:,} projetos avaliados ({args.verificacao}) -> {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Modelo veicular MDOF (7 GDL) de ``Trabalho_Vibrações_Veiga.py``.
+
+M e K são montadas por ``nucleo.montagem`` a partir dos corpos, massas e
+molas do veículo; parâmetros em array geram lotes de matrizes de uma vez.
+"""
+
+import numpy as np
+
+from nucleo.montagem import CorpoRigido, Massa, Mola, montar
+from nucleo.perfil import medir_fase
+
+PARAMETROS = ("a", "b", "c", "d", "e", "f", "g",
+              "k1", "k2", "k3", "k4", "k5", "k6", "k7",
+              "m1", "m2", "m3", "m4", "m5")
+N_GDL = 7
+GDL = ("xg2", "θ2", "xg1", "θ1", "x3", "x4", "x5")
+GDL_PNEUS = (5, 6)            # x4 (pneu dianteiro, k5) e x5 (pneu traseiro, k7)
+
+
+def elementos_veiculo(a, b, c, d, e, f, g, k1, k2, k3, k4, k5, k6, k7,
+                      m1, m2, m3, m4, m5):
+    """Massas, corpos e molas do veículo, com os GDL na ordem de ``GDL``.
+
+    Forças da dedução original: o chassi (m2, corpo 2) recebe o assento k3
+    e as suspensões k4 e k6 em xe, xb, xa = xg2 + (−g, d, c)·θ2; a carga
+    (m1, corpo 1) só se apoia no chassi, por k1 e k2, de xf = xg2 − a·θ2 e
+    xh = xg2 + b·θ2 a xc, xd = xg1 + (e, f)·θ1. Os pneus (k5, k7) ligam os
+    eixos à pista (canais 0 e 1).
+    """
+    return [
+        CorpoRigido("xg2", "θ2", m2, m2 * b ** 2 / 3),
+        CorpoRigido("xg1", "θ1", m1, m1 * a ** 2 / 3),
+        Massa("x3", m3),
+        Massa("x4", m4),
+        Massa("x5", m5),
+        Mola(("xg2", -a), ("xg1", e), k1),
+        Mola(("xg2", b), ("xg1", f), k2),
+        Mola(("xg2", -g), "x3", k3),
+        Mola(("xg2", d), "x4", k4),
+        Mola("x4", None, k5, entrada=0),
+        Mola(("xg2", c), "x5", k6),
+        Mola("x5", None, k7, entrada=1),
+    ]
+
+
+def distancia_entre_eixos(c, d):
+    """Distância entre os eixos no modelo: |d − c|.
+
+    As suspensões dianteira (k4) e traseira (k6) ficam no chassi a d e c
+    do centro, do mesmo lado. Com c = d os dois eixos caem no mesmo ponto
+    e a pista chegaria a ambos sem atraso; essa geometria é recusada.
+    """
+    distancia = abs(d - c)
+    if not distancia > 0:
+        raise ValueError(f"c = d = {c:g} põe os eixos dianteiro e traseiro no mesmo ponto "
+                         f"do chassi (entre-eixos nulo)")
+    return distancia
+
+
+@medir_fase("matrizes M/K")
+def matrizes_mk(a, b, c, d, e, f, g, k1, k2, k3, k4, k5, k6, k7,
+                m1, m2, m3, m4, m5):
+    """Matrizes numéricas de massa e rigidez (7×7) para um conjunto de parâmetros."""
+    modelo = montar(elementos_veiculo(a, b, c, d, e, f, g, k1, k2, k3, k4, k5, k6, k7,
+                                      m1, m2, m3, m4, m5), esparsa=False)
+    return modelo.M, modelo.K
+
+
+@medir_fase("matrizes M/K (lote)")
+def matrizes_mk_lote(**params):
+    """Empilha M e K (lote, 7, 7) para parâmetros escalares ou arrays.
+
+    Todos os parâmetros de ``PARAMETROS`` são obrigatórios; arrays são
+    combinados por broadcasting e achatados num único eixo de lote.
+    """
+    faltando = [p for p in PARAMETROS if p not in params]
+    if faltando:
+        raise TypeError(f"Parâmetros ausentes: {faltando}")
+    vals = np.broadcast_arrays(*(np.asarray(params[p], dtype=float) for p in PARAMETROS))
+    modelo = montar(elementos_veiculo(*(v.ravel() for v in vals)), esparsa=False)
+    return modelo.M, modelo.K
+
+
+def grade_parametros(base, faixas):
+    """Produto cartesiano das faixas sobre os valores base.
+
+    ``base`` mapeia cada parâmetro ao valor fixo e ``faixas`` mapeia os
+    parâmetros varridos aos seus valores. Devolve um dict de arrays 1-D
+    de mesmo tamanho, pronto para ``matrizes_mk_lote``.
+    """
+    nomes = list(faixas)
+    malhas = np.meshgrid(*(np.asarray(faixas[n], dtype=float) for n in nomes),
+                         indexing="ij")
+    lote = malhas[0].size if malhas else 1
+    grade = {p: np.full(lote, float(base[p])) for p in PARAMETROS if p not in faixas}
+    grade.update({n: m.ravel() for n, m in zip(nomes, malhas)})
+    return grade
+
+
+@medir_fase("autovalores")
+def modos_lote(M, K, tol=1e-5):
+    """Autoproblema generalizado K φ = ω² M φ para um lote de matrizes.
+
+    Sem pseudo-inversa: com M diagonal a inversa é exata; caso contrário
+    resolve-se M⁻¹K por ``solve``. Se todas as K forem simétricas, usa-se
+    ``eigh`` sobre M^-½ K M^-½. Devolve ``wn`` (lote, n), ordenado, com
+    NaN nos modos de corpo rígido (ω <= tol), e os vetores ``VET``
+    (lote, n, n) nas colunas correspondentes.
+    """
+    M = np.asarray(M, dtype=float)
+    K = np.asarray(K, dtype=float)
+    diag = np.diagonal(M, axis1=-2, axis2=-1)
+    M_diagonal = np.allclose(M, diag[..., :, None] * np.eye(M.shape[-1]))
+
+    if M_diagonal and np.allclose(K, np.swapaxes(K, -1, -2)):
+        raiz = 1 / np.sqrt(diag)
+        VAL, Q = np.linalg.eigh(raiz[..., :, None] * K * raiz[..., None, :])
+        VET = raiz[..., :, None] * Q
+    else:
+        A = K / diag[..., :, None] if M_diagonal else np.linalg.solve(M, K)
+        VAL, VET = np.linalg.eig(A)
+
+    wn = np.sqrt(np.abs(VAL))
+    ordem = np.argsort(wn, axis=-1)
+    wn = np.take_along_axis(wn, ordem, axis=-1)
+    VET = np.take_along_axis(VET, ordem[..., None, :], axis=-1)
+    wn[wn <= tol] = np.nan
+    return wn, VET
+
+
+def modos(Mnum, Knum, tol=1e-5):
+    """Modos de uma configuração, só com as frequências não nulas.
+
+    Devolve ``wn`` (rad/s) e ``VET`` com uma coluna por modo.
+    """
+    wn, VET = modos_lote(Mnum[np.newaxis], Knum[np.newaxis], tol)
+    valid = ~np.isnan(wn[0])
+    return wn[0][valid], VET[0][:, valid]
+
+
+def analise_modal(a, b, c, d, e, f, g, k1, k2, k3, k4, k5, k6, k7,
+                  m1, m2, m3, m4, m5):
+    """Matrizes e modos de uma configuração: (Mnum, Knum, wn, VET)."""
+    Mnum, Knum = matrizes_mk(a, b, c, d, e, f, g, k1, k2, k3, k4, k5, k6, k7,
+                             m1, m2, m3, m4, m5)
+    wn, VET = modos(Mnum, Knum)
+    return Mnum, Knum, wn, VET
+
+
+def frequencias_naturais_lote(**params):
+    """Frequências naturais (Hz) de cada configuração, forma (lote, 7)."""
+    wn, _ = modos_lote(*matrizes_mk_lote(**params))
+    return wn / (2 * np.pi)
@@ -0,0 +1,178 @@
+"""Montagem de modelos N-GDL a partir de massas, corpos rígidos e molas.
+
+M e K saem direto da energia de cada elemento, sem álgebra simbólica: uma
+mola entre os pontos p e q soma k·g·gᵀ, com g o vetor que leva os GDL ao
+alongamento u_p − u_q. Um ponto é o GDL de uma massa, um ponto de um corpo
+rígido a um braço da origem (u = z + braço·θ) ou o solo, fixo ou excitado
+por um canal de entrada (perfil da pista).
+
+Com parâmetros escalares, modelos grandes saem como ``scipy.sparse`` e os
+modos mais baixos vêm de ``eigsh``; parâmetros em array geram lotes densos
+(lote, n, n) por broadcasting, como ``matrizes_mk_lote``.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from nucleo.perfil import medir_fase
+
+LIMITE_DENSO = 100            # acima disso (GDL), matrizes escalares saem esparsas
+
+
+class Massa(NamedTuple):
+    nome: str                     # GDL de translação
+    m: float
+
+
+class CorpoRigido(NamedTuple):
+    nome: str                     # GDL de translação da origem
+    nome_rotacao: str             # GDL de rotação (arfagem)
+    m: float
+    J: float                      # inércia em torno da origem (kg·m²)
+
+
+class Mola(NamedTuple):
+    p: object                     # "massa", ("corpo", braço) ou None (solo)
+    q: object
+    k: float
+    c: float = 0.0                # amortecedor em paralelo (N·s/m)
+    entrada: Optional[int] = None # canal que excita a ponta ``q`` no solo
+
+
+class Montagem(NamedTuple):
+    M: object
+    K: object
+    C: object
+    Kr: np.ndarray                # (..., n, entradas): F = Kr·u + Cr·u̇
+    Cr: np.ndarray
+    gdl: tuple
+
+
+def _indices(elementos):
+    """Nome de cada GDL -> índice, na ordem em que os elementos aparecem."""
+    gdl = {}
+    for el in elementos:
+        if isinstance(el, CorpoRigido):
+            nomes = (el.nome, el.nome_rotacao)
+        elif isinstance(el, Massa):
+            nomes = (el.nome,)
+        else:
+            continue
+        for nome in nomes:
+            if nome in gdl:
+                raise ValueError(f"GDL repetido: {nome}")
+            gdl[nome] = len(gdl)
+    return gdl
+
+
+def _ponto(ponto, gdl, corpos):
+    """Lista de (índice, coeficiente) do deslocamento de um ponto."""
+    if ponto is None:
+        return []
+    if isinstance(ponto, str):
+        if ponto in corpos:
+            raise ValueError(f"{ponto} é corpo rígido: informe (nome, braço)")
+        return [(gdl[ponto], 1.0)]
+    nome, braco = ponto
+    if nome not in corpos:
+        raise ValueError(f"{nome} não é corpo rígido")
+    return [(gdl[nome], 1.0), (gdl[corpos[nome]], braco)]
+
+
+@medir_fase("montagem M/K")
+def montar(elementos, esparsa=None):
+    """Monta M, K, C e as matrizes de entrada do solo excitado.
+
+    ``esparsa=None`` escolhe CSR acima de ``LIMITE_DENSO`` GDL (só com
+    parâmetros escalares); com arrays, tudo sai em lote denso.
+    """
+    elementos = list(elementos)
+    try:
+        gdl = _indices(elementos)
+        corpos = {el.nome: el.nome_rotacao for el in elementos if isinstance(el, CorpoRigido)}
+        molas = [(el, _ponto(el.p, gdl, corpos), _ponto(el.q, gdl, corpos))
+                 for el in elementos if isinstance(el, Mola)]
+    except KeyError as erro:
+        raise ValueError(f"GDL inexistente: {erro.args[0]}") from None
+    n = len(gdl)
+    n_entradas = 1 + max((el.entrada for el, _, _ in molas if el.entrada is not None),
+                         default=-1)
+
+    # Triplas (linha, coluna, valor) de M, K e C; valores podem ser arrays
+    tm, tk, tc = [], [], []
+    entradas = []                 # (gdl, canal, k·g, c·g)
+    for el in elementos:
+        if isinstance(el, Massa):
+            tm.append((gdl[el.nome], gdl[el.nome], el.m))
+        elif isinstance(el, CorpoRigido):
+            tm.append((gdl[el.nome], gdl[el.nome], el.m))
+            tm.append((gdl[el.nome_rotacao], gdl[el.nome_rotacao], el.J))
+    for el, pp, pq in molas:
+        g = pp + [(i, -coef) for i, coef in pq]
+        for i, gi in g:
+            for j, gj in g:
+                tk.append((i, j, el.k * gi * gj))
+                if np.any(el.c):
+                    tc.append((i, j, el.c * gi * gj))
+            if el.entrada is not None and el.q is None:
+                entradas.append((i, el.entrada, el.k * gi, el.c * gi))
+
+    valores = [v for *_, v in tm + tk + tc] + [v for e in entradas for v in e[2:]]
+    lote = np.broadcast_shapes(*(np.shape(v) for v in valores))
+    if esparsa is None:
+        esparsa = n > LIMITE_DENSO and lote == ()
+    if esparsa and lote != ():
+        raise ValueError("matrizes esparsas exigem parâmetros escalares")
+
+    Kr = np.zeros((*lote, n, n_entradas))
+    Cr = np.zeros((*lote, n, n_entradas))
+    for i, canal, kg, cg in entradas:
+        Kr[..., i, canal] += kg
+        Cr[..., i, canal] += cg
+
+    if esparsa:
+        from scipy import sparse
+
+        def _matriz(triplas):
+            if not triplas:
+                return sparse.csr_matrix((n, n))
+            linhas, colunas, vals = (np.array(x, dtype=float) for x in zip(*triplas))
+            return sparse.coo_matrix((vals, (linhas.astype(int), colunas.astype(int))),
+                                     shape=(n, n)).tocsr()
+    else:
+        def _matriz(triplas):
+            saida = np.zeros((*lote, n, n))
+            for i, j, v in triplas:
+                saida[..., i, j] += v
+            return saida
+
+    return Montagem(_matriz(tm), _matriz(tk), _matriz(tc), Kr, Cr, tuple(gdl))
+
+
+@medir_fase("autovalores (montagem)")
+def modos_montagem(M, K, n_modos=None, tol=1e-5):
+    """Os ``n_modos`` modos mais baixos: (wn, VET) com φᵀ M φ = 1.
+
+    Matrizes esparsas usam ``eigsh`` em shift-invert com um deslocamento
+    ligeiramente negativo, que tolera K singular (corpos livres). Densas
+    usam ``eigh``. Como em ``modos_lote``, ω <= tol vira NaN.
+    """
+    from scipy import linalg, sparse
+    from scipy.sparse.linalg import eigsh
+
+    n = K.shape[0]
+    if sparse.issparse(K) and n_modos is not None and n_modos < n - 1:
+        escala = abs(K.diagonal()).max() / abs(M.diagonal()).max()
+        VAL, VET = eigsh(K.tocsc(), k=n_modos, M=M.tocsc(), sigma=-1e-6 * escala,
+                         which="LM")
+        ordem = np.argsort(VAL)
+        VAL, VET = VAL[ordem], VET[:, ordem]
+    else:
+        if sparse.issparse(K):
+            M, K = M.toarray(), K.toarray()
+        VAL, VET = linalg.eigh(K, M, subset_by_index=None if n_modos is None
+                               else [0, min(n_modos, n) - 1])
+    wn = np.sqrt(np.abs(VAL))
+    wn[wn <= tol] = np.nan
+    return wn, VET
@@ -0,0 +1,79 @@
+"""Projeto inverso: tubo de menor massa que passa na ISO 7173.
+
+Para cada modelo de cadeira (cargas e número de ciclos), procura no
+catálogo de ``nucleo.secoes`` o tubo de menor área de parede que fica
+abaixo de Sy e da tensão de fadiga admissível. A busca é uma bisseção
+vetorizada sobre os tubos ordenados por módulo da garganta.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from nucleo import iso7173
+from nucleo.perfil import medir_fase
+from nucleo.secoes import catalogo
+
+
+class TuboOtimo(NamedTuple):
+    """Tubo escolhido por modelo; NaN quando nenhum tubo do catálogo passa."""
+    largura: np.ndarray           # mm
+    altura: np.ndarray            # mm
+    espessura: np.ndarray         # mm
+    area: np.ndarray              # mm²
+    sigma_total: np.ndarray       # MPa
+    sigma_limite: np.ndarray      # MPa, min(Sy, admissível de fadiga)
+
+
+@lru_cache(maxsize=None)
+def _tabela_busca(tipo_tubo):
+    """Catálogo ordenado por W_solda com o mínimo de área de cada sufixo.
+
+    O tubo mais leve com W_solda >= W é ``ordem_min[searchsorted(W)]``.
+    """
+    b, h, t, props = catalogo(tipo_tubo)
+    ordem = np.argsort(props.W_solda, kind="stable")
+    W, A = props.W_solda[ordem], props.A[ordem]
+    # Mínimo de área (e seu índice) de cada posição até o fim
+    ordem_min = np.empty(W.size, dtype=np.intp)
+    melhor = W.size - 1
+    for i in range(W.size - 1, -1, -1):
+        if A[i] < A[melhor]:
+            melhor = i
+        ordem_min[i] = melhor
+    return W, ordem[ordem_min], b, h, t, props
+
+
+@medir_fase("otimizador")
+def otimizar_tubo(tipo_tubo, N, F_horizontal=iso7173.F_HORIZONTAL, q=iso7173.Q,
+                  altura_encosto=iso7173.ALTURA_ENCOSTO, L=iso7173.L,
+                  altura_assento=iso7173.ALTURA_ASSENTO, Sut=iso7173.SUT,
+                  Sy=iso7173.SY, Se=iso7173.SE, a_ciclo=iso7173.A_CICLO,
+                  b_ciclo=iso7173.B_CICLO):
+    """Tubo de catálogo mais leve que passa, para um ou vários modelos.
+
+    Todos os argumentos aceitam arrays (um elemento por modelo) e são
+    combinados por broadcasting.
+    """
+    tipos, N, F_horizontal, q, altura_encosto, L, altura_assento = np.broadcast_arrays(
+        np.asarray(tipo_tubo), N, F_horizontal, q, altura_encosto, L, altura_assento)
+    M_total = iso7173.momento_total_iso7173(q, L, F_horizontal, altura_encosto, altura_assento)
+    sigma_adm = iso7173.tensao_fadiga_admissivel(N, Se, a_ciclo, b_ciclo)
+    sigma_limite = np.minimum(np.minimum(sigma_adm, Sut), Sy)
+    # Passa se M/W_solda < limite; o "<" estrito vira W_solda > W_min
+    W_min = M_total / sigma_limite
+
+    campos = ("largura", "altura", "espessura", "area", "W_solda")
+    saida = {nome: np.full(tipos.shape, np.nan) for nome in campos}
+    for tipo in np.unique(tipos):
+        modelos = tipos == tipo
+        W, escolha, b, h, t, props = _tabela_busca(str(tipo))
+        pos = np.searchsorted(W, W_min[modelos], side="right")
+        achou = pos < W.size
+        linha = escolha[np.minimum(pos, W.size - 1)]
+        for nome, valores in zip(campos, (b, h, t, props.A, props.W_solda)):
+            saida[nome][modelos] = np.where(achou, valores[linha], np.nan)
+
+    return TuboOtimo(saida["largura"], saida["altura"], saida["espessura"], saida["area"],
+                     M_total / saida["W_solda"], sigma_limite)
@@ -0,0 +1,166 @@
+"""Instrumentação opcional por fase dos cálculos e das páginas.
+
+``fase(nome)`` e ``medir_fase(nome)`` marcam trechos do núcleo; só custa algo quando há um
+``Perfil`` ativo na thread (cada rerun do Streamlit roda numa thread).
+Ao finalizar, o perfil grava as fases como uma linha JSON no logger
+``veiga.perfil`` (e em ``VEIGA_PERFIL_ARQUIVO``, se definido) e,
+opcionalmente, um dump do cProfile por rerun em ``VEIGA_PERFIL_DIR``.
+"""
+
+import contextlib
+import contextvars
+import cProfile
+import json
+import logging
+import os
+import tempfile
+import time
+from functools import wraps
+from pathlib import Path
+
+logger = logging.getLogger("veiga.perfil")
+
+_ATIVO = contextvars.ContextVar("perfil_ativo", default=None)
+_NULO = contextlib.nullcontext()
+
+
+class Perfil:
+    """Tempos das fases de um rerun; ``etapa`` mede trechos sequenciais da página."""
+
+    def __init__(self, pagina, cprofile=False):
+        self.pagina = pagina
+        self.fases = []
+        self._nivel = 0
+        self._inicio = self._ultima = time.perf_counter()
+        self._cprofile = None
+        self.arquivo_cprofile = None
+        if cprofile:
+            self._cprofile = cProfile.Profile()
+            try:
+                self._cprofile.enable()
+            except ValueError:        # outro profiler ativo no processo
+                self._cprofile = None
+        _ATIVO.set(self)
+
+    def _registrar(self, nome, inicio, fim, nivel):
+        self.fases.append({
+            "fase": nome,
+            "inicio_ms": (inicio - self._inicio) * 1e3,
+            "duracao_ms": (fim - inicio) * 1e3,
+            "nivel": nivel,
+        })
+
+    @contextlib.contextmanager
+    def fase(self, nome):
+        inicio = time.perf_counter()
+        self._nivel += 1
+        try:
+            yield
+        finally:
+            self._nivel -= 1
+            self._registrar(nome, inicio, time.perf_counter(), self._nivel + 1)
+
+    def etapa(self, nome):
+        """Atribui a ``nome`` o tempo desde a etapa anterior da página."""
+        agora = time.perf_counter()
+        self._registrar(nome, self._ultima, agora, 0)
+        self._ultima = agora
+
+    def descartar(self):
+        """Desliga o cProfile e sai do contexto sem gravar nada."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if _ATIVO.get() is self:
+            _ATIVO.set(None)
+
+    def finalizar(self):
+        """Encerra o perfil, grava o log estruturado e devolve o registro."""
+        self.descartar()
+        total_ms = (time.perf_counter() - self._inicio) * 1e3
+        if self._cprofile is not None:
+            pasta = Path(os.environ.get("VEIGA_PERFIL_DIR") or Path(tempfile.gettempdir()) / "veiga-perfil")
+            pasta.mkdir(parents=True, exist_ok=True)
+            self.arquivo_cprofile = pasta / f"{self.pagina}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.prof"
+            self._cprofile.dump_stats(self.arquivo_cprofile)
+
+        registro = {
+            "pagina": self.pagina,
+            "horario": time.time(),
+            "pid": os.getpid(),
+            "total_ms": total_ms,
+            "fases": sorted(self.fases, key=lambda f: f["inicio_ms"]),
+        }
+        if self.arquivo_cprofile:
+            registro["cprofile"] = str(self.arquivo_cprofile)
+        linha = json.dumps(registro, ensure_ascii=False)
+        logger.info(linha)
+        arquivo_log = os.environ.get("VEIGA_PERFIL_ARQUIVO")
+        if arquivo_log:
+            with open(arquivo_log, "a", encoding="utf-8") as saida:
+                saida.write(linha + "\n")
+        return registro
+
+
+def fase(nome):
+    """Marca uma fase no perfil ativo; sem perfil, não faz nada."""
+    perfil = _ATIVO.get()
+    return _NULO if perfil is None else perfil.fase(nome)
+
+
+def etapa(nome):
+    """Fecha a etapa ``nome`` da página no perfil ativo; sem perfil, não faz nada."""
+    perfil = _ATIVO.get()
+    if perfil is not None:
+        perfil.etapa(nome)
+
+
+def medir_fase(nome):
+    """Decorador: cada chamada da função vira uma fase ``nome``."""
+    def decorar(funcao):
+        @wraps(funcao)
+        def wrapper(*args, **kwargs):
+            perfil = _ATIVO.get()
+            if perfil is None:
+                return funcao(*args, **kwargs)
+            with perfil.fase(nome):
+                return funcao(*args, **kwargs)
+        return wrapper
+    return decorar
+
+
+# ========================
+# Painel no Streamlit
+# ========================
+def perfil_da_pagina(pagina):
+    """Controles da barra lateral; devolve um ``Perfil`` ou None se desligado.
+
+    Um rerun interrompido (exceção na página, ou o Streamlit parando o
+    script para outro rerun) não chega ao ``painel_perfil``; o perfil que
+    ele deixou ativo na thread é descartado aqui, antes de abrir o novo.
+    """
+    import streamlit as st
+
+    anterior = _ATIVO.get()
+    if anterior is not None:
+        anterior.descartar()
+    if not st.sidebar.toggle("⏱️ Perfil de desempenho", key="perfil_ativo"):
+        return None
+    cprofile = st.sidebar.checkbox("Gravar cProfile deste rerun", key="perfil_cprofile")
+    return Perfil(pagina, cprofile)
+
+
+def painel_perfil(perfil):
+    """Finaliza o perfil e mostra as fases num painel recolhível da barra lateral."""
+    if perfil is None:
+        return
+    import streamlit as st
+
+    registro = perfil.finalizar()
+    with st.sidebar.expander(f"⏱️ Rerun em {registro['total_ms']:.1f} ms", expanded=True):
+        st.table({
+            "Fase": [" " * f["nivel"] + f["fase"] for f in registro["fases"]],
+            "ms": [round(f["duracao_ms"], 2) for f in registro["fases"]],
+        })
+        if perfil.arquivo_cprofile:
+            st.download_button("Baixar cProfile (.prof)", perfil.arquivo_cprofile.read_bytes(),
+                               file_name=perfil.arquivo_cprofile.name)
@@ -0,0 +1,281 @@
+"""Relatórios de certificação em lote: um PDF ou HTML por projeto.
+
+Cada documento traz os resultados do ensaio ISO 7173, os vereditos da
+página (estático, fadiga, sequência completa e Goodman), o gráfico de
+tensão por espessura e o envelope de Goodman. Os números de todos os
+projetos saem de uma só avaliação vetorizada; a renderização é dividida
+entre processos, e cada processo monta a página (Agg, sem pyplot) uma
+única vez e só troca dados, textos e limites entre um projeto e outro::
+
+    python -m nucleo.relatorios projetos.csv relatorios/ --formato pdf
+
+Colunas: tipo_tubo, largura, espessura, N
+[nome, altura, M_total, Sut, Sy, Se, n]
+"""
+
+import argparse
+import base64
+import html
+import io
+import os
+import re
+import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from nucleo import iso7173
+from nucleo.goodman import envelope_goodman, verificar_goodman
+from nucleo.lote import colunas, ler_tabela
+from nucleo.perfil import medir_fase
+from nucleo.sequencia import momentos_cadeira, relatorio_sequencia, simular_sequencia
+
+FORMATOS = ("pdf", "html")
+A4 = (8.27, 11.69)            # polegadas
+ALTURA_GRAFICOS = 0.62        # fração inferior da página ocupada pelos gráficos
+LARGURA_TEXTO = 100           # caracteres por linha no PDF
+
+
+# ========================
+# Dados de todos os projetos (vetorizado)
+# ========================
+@medir_fase("relatórios: cálculo")
+def dados_relatorios(tabela):
+    """Uma lista de dicts (só tipos simples, prontos para outro processo)."""
+    c = colunas(tabela, ("tipo_tubo", "largura", "espessura", "N"),
+                 ("altura", "M_total", "Sut", "Sy", "Se", "n"))
+    n_projetos = c["largura"].size
+    nomes = tabela.get("nome") or [f"projeto_{i + 1:05d}" for i in range(n_projetos)]
+    M_total = c.get("M_total", np.full(n_projetos, iso7173.M_TOTAL))
+    Sut = c.get("Sut", np.full(n_projetos, float(iso7173.SUT)))
+    Sy = c.get("Sy", 0.65 * Sut)
+    Se = c.get("Se", 0.5 * Sut)
+    altura = c.get("altura")
+
+    r = iso7173.checar_iso7173(c["tipo_tubo"], c["largura"], c["espessura"], c["N"], M_total,
+                               Sut, Sy, Se, altura=altura)
+    espessuras = np.array(iso7173.ESPESSURAS_LISTA)
+    sigmas = iso7173.tensao_garganta(
+        M_total[:, None], c["largura"][:, None], espessuras,
+        c["tipo_tubo"][:, None], None if altura is None else altura[:, None])
+    inercia = iso7173.inercia_solda(c["tipo_tubo"], c["largura"], c["espessura"], altura)
+    g = verificar_goodman(M_total, c["tipo_tubo"], c["largura"], c["espessura"], Sut, Se,
+                          c.get("n", 1.0), altura)
+    seq = simular_sequencia(momentos_cadeira(), c["tipo_tubo"][:, None], c["largura"][:, None],
+                            c["espessura"][:, None], None if altura is None else altura[:, None],
+                            Sut=Sut[:, None], Sy=Sy[:, None], Se=Se[:, None])
+    M_horizontal, M_encosto = iso7173.momentos_iso7173()
+    sigma_adm_goodman = np.broadcast_to(g.sigma_adm, (n_projetos,))
+
+    dados = []
+    for i in range(n_projetos):
+        N = int(c["N"][i])
+        if "M_total" in c:
+            momentos = (f"Momento total informado na junta: {M_total[i]:.0f} N·mm",)
+        else:
+            momentos = (f"Momento do tubo horizontal: {M_horizontal:.2f} Nm",
+                        f"Momento da força do encosto: {M_encosto:.2f} Nm",
+                        f"Momento total na junta: {M_total[i]:.0f} N·mm")
+        resumo = (
+            f"Tubo {c['tipo_tubo'][i].lower()} {c['largura'][i]:g} mm × {c['espessura'][i]:g} mm",
+            *momentos,
+            f"Tensão na garganta da solda: {r.sigma_total[i]:.2f} MPa",
+            f"Inércia da linha de solda: {inercia[i]:.2f} mm³",
+            f"**Ciclos desejados:** {N:,}",
+            f"Tensão de fadiga admissível para os ciclos: {r.sigma_adm[i]:.2f} MPa",
+        )
+        mensagens = iso7173.mensagens_iso7173(r.estatico[i], r.sigma_total[i], r.sigma_adm[i], N, Sut[i])
+        linha_seq = relatorio_sequencia(type(seq)(*(campo[i] for campo in seq)))
+        mensagens.append(("success" if seq.aprovado[i] else "error",
+                          linha_seq.split(" ", 1)[1]))
+        mensagens.append(("success" if g.aprovado[i] else "error", (
+            f"Goodman: tensão normal {g.sigma_n[i]:.2f} MPa, admissível "
+            f"{sigma_adm_goodman[i]:.2f} MPa — projeto "
+            f"{'aprovado' if g.aprovado[i] else 'reprovado'}.")))
+        dados.append({
+            "nome": str(nomes[i]),
+            "resumo": resumo,
+            "mensagens": mensagens,
+            "sigmas": sigmas[i].tolist(),
+            "espessura": float(c["espessura"][i]),
+            "N": N,
+            "Sut": float(Sut[i]),
+            "Sy": float(Sy[i]),
+            "Se": float(Se[i]),
+            "sigma_adm": float(r.sigma_adm[i]),
+            "sigma_n": float(g.sigma_n[i]),
+        })
+    return dados
+
+
+# ========================
+# Modelo de página reaproveitado entre projetos
+# ========================
+def _sem_markdown(texto):
+    return texto.replace("**", "")
+
+
+def _markdown_html(texto):
+    return re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", html.escape(texto))
+
+
+class ModeloRelatorio:
+    """Página A4 com texto, barras por espessura e envelope de Goodman.
+
+    Os artistas são criados uma vez; ``preencher`` só atualiza alturas,
+    cores, linhas, rótulos e limites, o que evita refazer layout e eixos
+    a cada documento.
+    """
+
+    def __init__(self, espessuras=iso7173.ESPESSURAS_LISTA):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.espessuras = list(espessuras)
+        self.fig = fig = Figure(figsize=A4)
+        FigureCanvasAgg(fig)
+        self.titulo = fig.text(0.5, 0.97, "", ha="center", va="top", fontsize=14,
+                               fontweight="bold")
+        self.texto = fig.text(0.07, 0.935, "", va="top", fontsize=8.5, linespacing=1.5)
+
+        ax = self.ax_espessuras = fig.add_axes([0.1, 0.38, 0.85, 0.22])
+        self.barras = ax.bar([str(e) for e in self.espessuras], np.zeros(len(self.espessuras)),
+                             color="skyblue")
+        self.linha_sut = ax.axhline(0, color="red", linestyle="--")
+        self.linha_sy = ax.axhline(0, color="orange", linestyle="--")
+        self.linha_adm = ax.axhline(0, color="green", linestyle="--")
+        self.rotulos = [ax.annotate("", xy=(b.get_x() + b.get_width() / 2, 0), xytext=(0, 5),
+                                    textcoords="offset points", ha="center", va="bottom",
+                                    fontsize=7)
+                        for b in self.barras]
+        ax.set_xlabel("Espessura da Parede do Tubo (mm)")
+        ax.set_ylabel("Tensão Total (MPa)")
+        ax.set_title("Tensão Total x Espessura - Ensaio ISO 7173")
+        ax.grid(True, axis="y")
+        self.legenda = ax.legend([self.linha_sut, self.linha_sy, self.linha_adm], ["", "", ""],
+                                 loc="upper center", bbox_to_anchor=(0.5, -0.2), ncol=3,
+                                 fontsize=7)
+
+        ax = self.ax_goodman = fig.add_axes([0.1, 0.05, 0.85, 0.2])
+        self.envelope, = ax.plot([], [], label="Envelope Goodman")
+        self.linha_n = ax.axhline(0, color="r", linestyle="--", label="Tensão Normal")
+        ax.set_xlabel("Tensão Alternada (MPa)")
+        ax.set_ylabel("Tensão Média (MPa)")
+        ax.legend(fontsize=7)
+
+    def preencher(self, d, com_texto=True):
+        self.titulo.set_text(f"Relatório de ensaio ISO 7173 — {d['nome']}")
+        linhas = [_sem_markdown(t) for t in d["resumo"]] + [""]
+        for nivel, msg in d["mensagens"]:
+            marcador = {"success": "[OK]", "warning": "[!]", "error": "[X]"}[nivel]
+            linhas += textwrap.wrap(f"{marcador} {_sem_markdown(msg)}", LARGURA_TEXTO,
+                                    subsequent_indent="     ")
+        self.texto.set_text("\n".join(linhas))
+        self.titulo.set_visible(com_texto)
+        self.texto.set_visible(com_texto)
+
+        sigmas = d["sigmas"]
+        for barra, rotulo, esp, sigma in zip(self.barras, self.rotulos, self.espessuras, sigmas):
+            barra.set_height(sigma)
+            barra.set_color("orange" if esp == d["espessura"] else "skyblue")
+            rotulo.set_text(f"{sigma:.0f}")
+            rotulo.xy = (rotulo.xy[0], sigma)
+        self.linha_sut.set_ydata([d["Sut"]] * 2)
+        self.linha_sy.set_ydata([d["Sy"]] * 2)
+        self.linha_adm.set_ydata([d["sigma_adm"]] * 2)
+        for texto, rotulo in zip(self.legenda.get_texts(), (
+                f"Sut = {d['Sut']:g} MPa (Ruptura)", f"Sy = {d['Sy']:.0f} MPa (Deformação)",
+                f"Se ({d['N']:,} ciclos) = {d['sigma_adm']:.0f} MPa (Fadiga)")):
+            texto.set_text(rotulo)
+        topo = max(max(sigmas), d["Sut"], min(d["sigma_adm"], 3 * d["Sut"]))
+        self.ax_espessuras.set_ylim(0, 1.15 * topo)
+
+        sigma_a, sigma_m = envelope_goodman(d["Se"], d["Sut"])
+        self.envelope.set_data(sigma_a, sigma_m)
+        self.linha_n.set_ydata([d["sigma_n"]] * 2)
+        self.ax_goodman.set_xlim(-0.05 * d["Sut"], 1.05 * d["Sut"])
+        self.ax_goodman.set_ylim(min(0, d["sigma_n"]) - 0.05 * d["Se"],
+                                 1.1 * max(d["Se"], d["sigma_n"]))
+
+    def pdf(self, d):
+        self.preencher(d)
+        buffer = io.BytesIO()
+        self.fig.savefig(buffer, format="pdf")
+        return buffer.getvalue()
+
+    def html(self, d, dpi=100):
+        from matplotlib.transforms import Bbox
+
+        self.preencher(d, com_texto=False)
+        buffer = io.BytesIO()
+        self.fig.savefig(buffer, format="png", dpi=dpi,
+                         bbox_inches=Bbox([[0, 0], [A4[0], ALTURA_GRAFICOS * A4[1]]]))
+        png = base64.b64encode(buffer.getvalue()).decode("ascii")
+        resumo = "".join(f"<li>{_markdown_html(t)}</li>" for t in d["resumo"])
+        alertas = "".join(f'<p class="{nivel}">{iso7173.ICONES[nivel]} {_markdown_html(msg)}</p>'
+                          for nivel, msg in d["mensagens"])
+        nome = html.escape(d["nome"])
+        return (
+            f'<!DOCTYPE html><html lang="pt-BR"><head><meta charset="utf-8">'
+            f"<title>{nome}</title><style>"
+            "body{font-family:sans-serif;max-width:50em;margin:2em auto}"
+            "p{padding:.5em;border-radius:.3em}.success{background:#e6f4ea}"
+            ".warning{background:#fff4e5}.error{background:#fdecea}"
+            f"</style></head><body><h1>Relatório de ensaio ISO 7173 — {nome}</h1>"
+            f"<ul>{resumo}</ul>{alertas}"
+            f'<img alt="Gráficos" style="width:100%" src="data:image/png;base64,{png}">'
+            "</body></html>"
+        ).encode("utf-8")
+
+
+_MODELO = None
+
+
+def _renderizar(tarefa):
+    """Renderiza e grava um documento no processo atual (modelo reaproveitado)."""
+    global _MODELO
+    d, caminho, formato = tarefa
+    if _MODELO is None:
+        _MODELO = ModeloRelatorio()
+    Path(caminho).write_bytes(getattr(_MODELO, formato)(d))
+    return caminho
+
+
+def gerar_relatorios(tabela, pasta, formato="pdf", processos=None):
+    """Gera um documento por linha de ``tabela``; devolve os caminhos gravados."""
+    if formato not in FORMATOS:
+        raise ValueError(f"formato deve ser um de {FORMATOS}")
+    pasta = Path(pasta)
+    pasta.mkdir(parents=True, exist_ok=True)
+    dados = dados_relatorios(tabela)
+    nomes = [re.sub(r"[^\w.-]+", "_", d["nome"]) for d in dados]
+    if len(set(nomes)) < len(nomes):
+        raise ValueError("nomes de projeto repetidos")
+    tarefas = [(d, str(pasta / f"{nome}.{formato}"), formato) for d, nome in zip(dados, nomes)]
+    if processos == 1 or len(tarefas) <= 1:
+        return [_renderizar(t) for t in tarefas]
+    processos = processos or os.cpu_count()
+    with ProcessPoolExecutor(processos) as pool:
+        return list(pool.map(_renderizar, tarefas,
+                             chunksize=max(1, len(tarefas) // (4 * processos))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Relatórios de certificação em lote (PDF/HTML).")
+    parser.add_argument("entrada")
+    parser.add_argument("pasta")
+    parser.add_argument("--formato", choices=FORMATOS, default="pdf")
+    parser.add_argument("--processos", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    caminhos = gerar_relatorios(ler_tabela(args.entrada), args.pasta, args.formato,
+                                args.processos)
+    print(f"{len(caminhos):,} relatórios {args.formato.upper()} em "
+          f"{time.perf_counter() - inicio:.1f} s -> {args.pasta}")
+
+
+if __name__ == "__main__":
+    main()
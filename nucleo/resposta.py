@@ -0,0 +1,83 @@
+"""Resposta em vibração livre avaliada em blocos de tamanho fixo.
+
+A memória fica limitada a modos × bloco, independente da duração da
+simulação, e a decimação min/máx reduz cada GDL a poucos milhares de
+pontos para o gráfico.
+"""
+
+import numpy as np
+
+from nucleo.perfil import medir_fase
+
+BLOCO = 65_536
+
+
+def coeficientes_modais(Mnum, VET, wn, X0, V0):
+    """Normaliza os modos pela massa e projeta as condições iniciais.
+
+    Devolve ``VETn``, ``MAT1`` (deslocamento) e ``MAT2`` (velocidade / ω)
+    como no app de vibração.
+    """
+    freq_inv = np.diag(np.where(wn != 0, 1 / wn, 0))
+    Mdiag = VET.T @ Mnum @ VET
+    VETn = VET / np.sqrt(np.diag(Mdiag))[np.newaxis, :]
+    MAT1 = VETn.T @ Mnum @ X0
+    MAT2 = freq_inv @ VETn.T @ Mnum @ V0
+    return VETn, MAT1, MAT2
+
+
+def resposta_livre_blocos(VETn, wn, MAT1, MAT2, t_final, n_amostras, bloco=BLOCO):
+    """Gera ``(t, resposta)`` em blocos de até ``bloco`` amostras.
+
+    A grade de tempo é a mesma de ``np.linspace(0, t_final, n_amostras)``;
+    cada bloco de resposta tem forma (GDL, amostras do bloco).
+    """
+    dt = t_final / (n_amostras - 1) if n_amostras > 1 else 0.0
+    wn = np.asarray(wn)[:, np.newaxis]
+    for inicio in range(0, n_amostras, bloco):
+        t = np.arange(inicio, min(inicio + bloco, n_amostras)) * dt
+        fase = wn * t
+        yield t, np.real(VETn @ (np.cos(fase) * MAT1 + np.sin(fase) * MAT2))
+
+
+def _minmax_baldes(t, y, tamanho):
+    """Min e máx (com seus instantes) de cada balde de ``tamanho`` amostras."""
+    n_baldes = -(-t.size // tamanho)
+    falta = n_baldes * tamanho - t.size
+    if falta:
+        t = np.concatenate([t, np.full(falta, t[-1])])
+        y = np.concatenate([y, np.repeat(y[:, -1:], falta, axis=1)], axis=1)
+    t = t.reshape(n_baldes, tamanho)
+    y = y.reshape(y.shape[0], n_baldes, tamanho)
+    i_min = y.argmin(axis=-1)[..., np.newaxis]
+    i_max = y.argmax(axis=-1)[..., np.newaxis]
+    t_min = np.take_along_axis(np.broadcast_to(t, y.shape), i_min, -1)[..., 0]
+    t_max = np.take_along_axis(np.broadcast_to(t, y.shape), i_max, -1)[..., 0]
+    y_min = np.take_along_axis(y, i_min, -1)[..., 0]
+    y_max = np.take_along_axis(y, i_max, -1)[..., 0]
+
+    # Intercala min e máx de cada balde na ordem em que ocorrem
+    primeiro_min = t_min <= t_max
+    t_par = np.stack([np.where(primeiro_min, t_min, t_max),
+                      np.where(primeiro_min, t_max, t_min)], axis=-1)
+    y_par = np.stack([np.where(primeiro_min, y_min, y_max),
+                      np.where(primeiro_min, y_max, y_min)], axis=-1)
+    return t_par.reshape(y.shape[0], -1), y_par.reshape(y.shape[0], -1)
+
+
+@medir_fase("resposta livre")
+def resposta_livre_decimada(VETn, wn, MAT1, MAT2, t_final, n_amostras,
+                            pontos=4_000, bloco=BLOCO):
+    """Resposta completa reduzida a ~``pontos`` pontos por GDL (min/máx).
+
+    Devolve ``t`` e ``resposta`` de forma (GDL, pontos); cada GDL tem seus
+    próprios instantes, pois min e máx caem em amostras diferentes.
+    """
+    tamanho = max(1, -(-2 * n_amostras // pontos))
+    # Blocos múltiplos do balde: nenhum balde fica dividido entre dois blocos
+    bloco = max(tamanho, bloco // tamanho * tamanho)
+    partes = [_minmax_baldes(t, y, tamanho)
+              for t, y in resposta_livre_blocos(VETn, wn, MAT1, MAT2,
+                                                t_final, n_amostras, bloco)]
+    return (np.concatenate([p[0] for p in partes], axis=1),
+            np.concatenate([p[1] for p in partes], axis=1))
@@ -0,0 +1,187 @@
+"""Armazém persistente de resultados, compartilhado entre sessões e processos.
+
+Cada resultado é gravado num SQLite local sob o hash canônico de todas as
+entradas da função (tipo de tubo, medidas, N, constantes do material,
+cargas...). Um pedido repetido vira uma consulta. O banco usa WAL para
+leitores e escritores concorrentes de vários processos, e descarta as
+entradas acessadas há mais tempo (LRU) quando passa do limite.
+
+O caminho vem de ``VEIGA_RESULTADOS_DB``; uma string vazia desliga o
+armazém.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+
+import numpy as np
+
+from nucleo.perfil import medir_fase
+
+VERSAO = 4                    # mude quando as fórmulas mudarem
+MAX_ENTRADAS = 100_000
+RESOLUCAO_ACESSO = 60.0       # s; consultas mais próximas que isso não regravam ``acessado``
+CAMINHO_PADRAO = Path.home() / ".cache" / "veiga" / "resultados.sqlite3"
+
+
+def _canonico(valor):
+    """Forma JSON estável de um argumento.
+
+    Números (exceto bool) viram float antes do hash: ``largura=20`` e
+    ``largura=20.0`` (o ``number_input`` devolve um ou outro conforme o
+    ``value=``) caem na mesma chave.
+    """
+    if isinstance(valor, np.ndarray):
+        if valor.dtype.kind in "iuf":
+            return {"ndarray": valor.astype(float).tolist()}
+        return {"ndarray": valor.tolist(), "dtype": valor.dtype.str}
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        return repr(float(valor))
+    if isinstance(valor, (list, tuple)):
+        return [_canonico(v) for v in valor]
+    if isinstance(valor, dict):
+        return {str(k): _canonico(v) for k, v in valor.items()}
+    return valor
+
+
+def chave_entradas(tipo, entradas):
+    """Hash SHA-256 canônico de ``entradas`` para o tipo de resultado."""
+    texto = json.dumps([VERSAO, tipo, _canonico(entradas)], sort_keys=True,
+                       separators=(",", ":"))
+    return hashlib.sha256(texto.encode()).hexdigest()
+
+
+class ArmazemResultados:
+    """Resultados em SQLite, com LRU limitado a ``max_entradas``."""
+
+    def __init__(self, caminho=CAMINHO_PADRAO, max_entradas=MAX_ENTRADAS):
+        self.caminho = Path(caminho)
+        self.max_entradas = max_entradas
+        self._local = threading.local()
+        self._gravacoes = 0
+
+    def _conexao(self):
+        # Uma conexão por thread e por processo (não sobrevive a fork)
+        con = getattr(self._local, "con", None)
+        if con is None or self._local.pid != os.getpid():
+            self.caminho.parent.mkdir(parents=True, exist_ok=True)
+            con = sqlite3.connect(self.caminho, timeout=30, isolation_level=None)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.execute("""CREATE TABLE IF NOT EXISTS resultados (
+                               chave TEXT PRIMARY KEY,
+                               tipo TEXT NOT NULL,
+                               valor BLOB NOT NULL,
+                               criado REAL NOT NULL,
+                               acessado REAL NOT NULL)""")
+            con.execute("CREATE INDEX IF NOT EXISTS resultados_acessado ON resultados (acessado)")
+            self._local.con, self._local.pid = con, os.getpid()
+        return con
+
+    @medir_fase("armazém: consulta")
+    def obter(self, chave):
+        """Resultado gravado sob ``chave``, ou None.
+
+        O horário de acesso (para o LRU) só é regravado quando tem mais de
+        ``RESOLUCAO_ACESSO`` s: consultas repetidas ficam só leitura e não
+        disputam a trava de escrita do WAL entre processos.
+        """
+        con = self._conexao()
+        linha = con.execute("SELECT valor, acessado FROM resultados WHERE chave = ?",
+                            (chave,)).fetchone()
+        if linha is None:
+            return None
+        agora = time.time()
+        if agora - linha[1] > RESOLUCAO_ACESSO:
+            con.execute("UPDATE resultados SET acessado = ? WHERE chave = ? AND acessado < ?",
+                        (agora, chave, agora - RESOLUCAO_ACESSO))
+        return pickle.loads(linha[0])
+
+    @medir_fase("armazém: gravação")
+    def gravar(self, chave, tipo, valor):
+        agora = time.time()
+        self._conexao().execute(
+            "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?, ?)",
+            (chave, tipo, pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL), agora, agora))
+        self._gravacoes += 1
+        if self._gravacoes % 256 == 0:
+            self.despejar()
+
+    def despejar(self):
+        """Remove as entradas menos recentemente acessadas acima do limite."""
+        con = self._conexao()
+        (total,) = con.execute("SELECT COUNT(*) FROM resultados").fetchone()
+        excesso = total - self.max_entradas
+        if excesso > 0:
+            con.execute("""DELETE FROM resultados WHERE chave IN (
+                               SELECT chave FROM resultados ORDER BY acessado LIMIT ?)""",
+                        (excesso,))
+
+    def limpar(self):
+        self._conexao().execute("DELETE FROM resultados")
+
+    def obter_ou_calcular(self, tipo, entradas, calcular):
+        """Consulta o armazém; se faltar, calcula e grava.
+
+        Erros do SQLite (banco travado, disco cheio...) não derrubam o
+        cálculo: o resultado é só recalculado.
+        """
+        chave = chave_entradas(tipo, entradas)
+        try:
+            valor = self.obter(chave)
+        except sqlite3.Error:
+            return calcular()
+        if valor is not None:
+            return valor
+        valor = calcular()
+        try:
+            self.gravar(chave, tipo, valor)
+        except sqlite3.Error:
+            pass
+        return valor
+
+
+def _armazem_padrao():
+    caminho = os.environ.get("VEIGA_RESULTADOS_DB", str(CAMINHO_PADRAO))
+    return ArmazemResultados(caminho) if caminho else None
+
+
+ARMAZEM = _armazem_padrao()
+
+
+def em_armazem(tipo, funcao, armazem=None):
+    """Versão de ``funcao`` que consulta o armazém antes de calcular.
+
+    A chave inclui todos os argumentos, inclusive os valores padrão.
+    """
+    assinatura = inspect.signature(funcao)
+
+    @wraps(funcao)
+    def wrapper(*args, **kwargs):
+        alvo = armazem or ARMAZEM
+        if alvo is None:
+            return funcao(*args, **kwargs)
+        ligados = assinatura.bind(*args, **kwargs)
+        ligados.apply_defaults()
+        return alvo.obter_ou_calcular(tipo, dict(ligados.arguments),
+                                      lambda: funcao(*args, **kwargs))
+    return wrapper
+
+
+# ========================
+# Cálculos dos apps com armazém
+# ========================
+from nucleo import goodman, iso7173, mdof  # noqa: E402
+
+checar_iso7173 = em_armazem("iso7173", iso7173.checar_iso7173)
+verificar_goodman = em_armazem("goodman", goodman.verificar_goodman)
+analise_modal = em_armazem("modal", mdof.analise_modal)
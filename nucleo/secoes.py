@@ -0,0 +1,141 @@
+"""Biblioteca de propriedades de seção dos tubos vazados.
+
+Tubos quadrados, redondos e retangulares, com as propriedades de flexão
+do tubo (I, c) e da solda de filete em volta dele (inércia da linha de
+solda e módulo da garganta, Shigley tab. 9-2). O catálogo padrão é
+pré-calculado numa tabela indexada; medidas fora dele caem nas fórmulas
+fechadas, avaliadas de forma vetorizada.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+TIPOS_SECAO = ("Quadrado", "Redondo", "Retangular")
+_CODIGO = {nome: i for i, nome in enumerate(TIPOS_SECAO)}
+
+GARGANTA = 0.707              # garganta efetiva da solda de filete
+
+# ========================
+# Catálogo padrão
+# ========================
+ESPESSURAS_CATALOGO = (0.60, 0.75, 0.90, 1.06, 1.20, 1.50, 1.90)                  # mm
+LARGURAS_CATALOGO = (12.0, 15.0, 16.0, 19.0, 20.0, 22.0, 25.0, 30.0, 32.0, 38.0, 40.0, 50.0)
+RETANGULARES_CATALOGO = ((20.0, 30.0), (20.0, 40.0), (20.0, 50.0), (30.0, 40.0),
+                         (30.0, 50.0), (30.0, 60.0), (40.0, 60.0), (40.0, 80.0))  # largura × altura
+
+
+class PropriedadesSecao(NamedTuple):
+    """Propriedades de seção; a altura é a dimensão no plano de flexão."""
+    I: np.ndarray                 # mm⁴, inércia do tubo
+    c: np.ndarray                 # mm, distância à fibra externa
+    I_solda: np.ndarray           # mm³, inércia da linha de solda (por mm de garganta)
+    W_solda: np.ndarray           # mm³, módulo da garganta: GARGANTA·t·I_solda/c
+    A: np.ndarray                 # mm², área da parede (massa por metro)
+
+
+def codigo_tipo(tipo_tubo):
+    """Converte nomes de tipo de tubo em códigos inteiros (aceita arrays)."""
+    tipos = np.asarray(tipo_tubo)
+    desconhecidos = set(np.unique(tipos).tolist()) - _CODIGO.keys()
+    if desconhecidos:
+        raise ValueError(f"Tipo de tubo desconhecido: {sorted(desconhecidos)}")
+    codigo = np.zeros(tipos.shape, dtype=np.int8)
+    for nome, valor in _CODIGO.items():
+        codigo[tipos == nome] = valor
+    return codigo
+
+
+def _alturas(codigo, largura, altura):
+    """Altura efetiva: só o tubo retangular usa ``altura``."""
+    if altura is None:
+        return np.broadcast_to(largura, np.broadcast_shapes(np.shape(codigo), np.shape(largura)))
+    return np.where(codigo == _CODIGO["Retangular"], altura, largura)
+
+
+def calcular_propriedades(tipo_tubo, largura, espessura, altura=None):
+    """Propriedades pelas fórmulas fechadas, com broadcasting entre argumentos."""
+    codigo = codigo_tipo(tipo_tubo)
+    b = np.asarray(largura, dtype=float)
+    t = np.asarray(espessura, dtype=float)
+    h = np.asarray(_alturas(codigo, b, altura), dtype=float)
+    redondo = codigo == _CODIGO["Redondo"]
+
+    I = np.where(redondo,
+                 (np.pi / 64) * (b ** 4 - (b - 2 * t) ** 4),
+                 (b * h ** 3 - (b - 2 * t) * (h - 2 * t) ** 3) / 12)
+    c = h / 2
+    # Quadrado/retangular: só as duas linhas de solda das abas, b·h²/2 (b³/2 no
+    # quadrado, como no app original)
+    I_solda = np.where(redondo, np.pi * (b / 2) ** 3, b * h ** 2 / 2)
+    W_solda = GARGANTA * t * I_solda / c
+    A = np.where(redondo,
+                 (np.pi / 4) * (b ** 2 - (b - 2 * t) ** 2),
+                 b * h - (b - 2 * t) * (h - 2 * t))
+    return PropriedadesSecao(I, c, I_solda, W_solda, A)
+
+
+def _chave(codigo, largura, altura, espessura):
+    """Chave inteira da tabela (medidas em centésimos de mm)."""
+    return (((np.int64(codigo) * 100_000 + np.rint(np.asarray(largura) * 100).astype(np.int64))
+             * 100_000 + np.rint(np.asarray(altura) * 100).astype(np.int64))
+            * 10_000 + np.rint(np.asarray(espessura) * 100).astype(np.int64))
+
+
+def _montar_catalogo():
+    linhas = [(_CODIGO[tipo], b, b, t)
+              for tipo in ("Quadrado", "Redondo")
+              for b in LARGURAS_CATALOGO for t in ESPESSURAS_CATALOGO]
+    linhas += [(_CODIGO["Retangular"], b, h, t)
+               for b, h in RETANGULARES_CATALOGO for t in ESPESSURAS_CATALOGO]
+    codigo, b, h, t = (np.array(col) for col in zip(*linhas))
+    chaves = _chave(codigo, b, h, t)
+    ordem = np.argsort(chaves)
+    codigo, b, h, t, chaves = codigo[ordem], b[ordem], h[ordem], t[ordem], chaves[ordem]
+    props = calcular_propriedades(np.array(TIPOS_SECAO)[codigo], b, t, h)
+    indice = {int(k): i for i, k in enumerate(chaves)}
+    return chaves, np.stack([b, h, t]), props, indice
+
+
+_CHAVES, _MEDIDAS, CATALOGO, _INDICE = _montar_catalogo()
+
+
+def catalogo(tipo_tubo):
+    """Tubos de catálogo de um tipo: (largura, altura, espessura, propriedades)."""
+    linhas = (_CHAVES // (100_000 * 100_000 * 10_000)) == _CODIGO[tipo_tubo]
+    b, h, t = _MEDIDAS[:, linhas]
+    return b, h, t, PropriedadesSecao(*(p[linhas] for p in CATALOGO))
+
+
+def propriedades(tipo_tubo, largura, espessura, altura=None):
+    """Propriedades de seção, do catálogo quando possível.
+
+    Escalares são resolvidos por dicionário; arrays são casados com a
+    tabela por busca ordenada, e só as medidas fora do catálogo passam
+    pelas fórmulas fechadas.
+    """
+    codigo = codigo_tipo(tipo_tubo)
+    b = np.asarray(largura, dtype=float)
+    t = np.asarray(espessura, dtype=float)
+    h = np.asarray(_alturas(codigo, b, altura), dtype=float)
+    codigo, b, h, t = np.broadcast_arrays(codigo, b, h, t)
+
+    if codigo.ndim == 0:
+        i = _INDICE.get(int(_chave(codigo, b, h, t)))
+        if i is not None and (_MEDIDAS[:, i] == (b, h, t)).all():
+            return PropriedadesSecao(*(float(p[i]) for p in CATALOGO))
+        return PropriedadesSecao(*(float(p) for p in calcular_propriedades(
+            np.array(TIPOS_SECAO)[codigo], b, t, h)))
+
+    chaves = _chave(codigo, b, h, t)
+    i = np.minimum(np.searchsorted(_CHAVES, chaves), _CHAVES.size - 1)
+    no_catalogo = ((_CHAVES[i] == chaves) & (_MEDIDAS[0, i] == b)
+                   & (_MEDIDAS[1, i] == h) & (_MEDIDAS[2, i] == t))
+    saida = [p[i] for p in CATALOGO]
+    fora = ~no_catalogo
+    if fora.any():
+        calculadas = calcular_propriedades(np.array(TIPOS_SECAO)[codigo[fora]],
+                                           b[fora], t[fora], h[fora])
+        for s, p in zip(saida, calculadas):
+            s[fora] = p
+    return PropriedadesSecao(*saida)
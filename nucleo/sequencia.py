@@ -0,0 +1,139 @@
+"""Sequência completa de ensaios ISO 7173 sobre todas as juntas soldadas.
+
+Cada ensaio (assento, encosto, perna para frente, perna para o lado,
+queda) aplica um momento em cada junta por um número de ciclos. O dano de
+Miner na curva de Basquin do app é somado ao longo da sequência, junta a
+junta, e a primeira junta a chegar a 1 (ou a romper estaticamente) é a
+falha da cadeira. Tudo é avaliado em arrays (..., ensaios, juntas), então
+uma linha de produtos inteira entra numa só chamada.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from nucleo import iso7173
+from nucleo.dano import ciclos_admissiveis
+from nucleo.perfil import medir_fase
+from nucleo.secoes import propriedades
+
+ENSAIOS = ("assento", "encosto", "perna para frente", "perna para o lado", "queda")
+CICLOS_PADRAO = (50_000, 50_000, 10, 10, 10)
+LATERAL = np.array([False, False, False, True, False])   # flexão no outro plano
+
+JUNTAS = ("perna dianteira esq.", "perna dianteira dir.",
+          "perna traseira esq.", "perna traseira dir.",
+          "encosto esq.", "encosto dir.")
+PERNAS = np.array([True, True, True, True, False, False])
+
+# Cargas dos ensaios sem equivalente no app (valores padrão ajustáveis)
+F_PERNA_FRENTE = 500.0        # N, na altura do assento
+F_PERNA_LADO = 390.0          # N, na altura do assento
+FATOR_QUEDA = 2.0             # carga aplicada subitamente sobre o caso do assento
+
+
+class ResultadoSequencia(NamedTuple):
+    sigma: np.ndarray             # (..., ensaios, juntas) MPa
+    estatico: np.ndarray          # (..., ensaios, juntas) APROVADO/DEFORMA/ROMPE
+    dano: np.ndarray              # (..., ensaios, juntas) parcela de Miner de cada ensaio
+    dano_total: np.ndarray        # (..., juntas)
+    ensaio_falha: np.ndarray      # (..., juntas) índice do ensaio da falha, -1 se resiste
+    ciclo_falha: np.ndarray       # (..., juntas) ciclo acumulado da falha, inf se resiste
+    junta_critica: np.ndarray     # (...,) primeira a falhar, ou a de maior dano
+    aprovado: np.ndarray          # (...,) nenhuma junta falha na sequência
+
+
+def momentos_cadeira(q=iso7173.Q, L=iso7173.L, F_encosto=iso7173.F_HORIZONTAL,
+                     F_perna_frente=F_PERNA_FRENTE, F_perna_lado=F_PERNA_LADO,
+                     fator_queda=FATOR_QUEDA, altura_encosto=iso7173.ALTURA_ENCOSTO,
+                     altura_assento=iso7173.ALTURA_ASSENTO):
+    """Momentos (N·mm) de cada ensaio em cada junta, forma (..., ensaios, juntas).
+
+    - assento: engaste do tubo horizontal, q·L²/12, em todas as juntas;
+    - encosto: F·(altura do encosto − assento) nas juntas do encosto e a
+      reação horizontal F/4 de cada pé × altura do assento nas pernas;
+    - pernas: força na altura do assento dividida pelos quatro pés;
+    - queda: o caso do assento multiplicado pelo fator de impacto.
+    """
+    M_assento, M_encosto = iso7173.momentos_iso7173(q, L, F_encosto, altura_encosto,
+                                                    altura_assento)
+    braco = np.asarray(altura_assento, dtype=float) / 1_000
+    pernas, encosto = PERNAS, ~PERNAS
+    linhas = [
+        np.multiply.outer(M_assento, np.ones(len(JUNTAS))),
+        np.multiply.outer(M_encosto, encosto) + np.multiply.outer(F_encosto / 4 * braco, pernas),
+        np.multiply.outer(F_perna_frente / 4 * braco, pernas),
+        np.multiply.outer(F_perna_lado / 4 * braco, pernas),
+        np.multiply.outer(fator_queda * M_assento, np.ones(len(JUNTAS))),
+    ]
+    return np.stack(np.broadcast_arrays(*linhas), axis=-2) * 1_000
+
+
+@medir_fase("iso7173: sequência")
+def simular_sequencia(momentos, tipo_tubo, largura, espessura, altura=None,
+                      ciclos=CICLOS_PADRAO, Sut=iso7173.SUT, Sy=iso7173.SY,
+                      Se=iso7173.SE, a_ciclo=iso7173.A_CICLO, b_ciclo=iso7173.B_CICLO):
+    """Roda a sequência de ensaios sobre todas as juntas de uma ou várias cadeiras.
+
+    ``momentos`` tem forma (..., ensaios, juntas); seção e material têm
+    forma (..., juntas) ou escalar; ``ciclos`` tem um valor por ensaio. A
+    carga vai de zero ao pico, então a tensão entra direto na curva S-N.
+    Romper (σ >= Sut) é falha no primeiro ciclo do ensaio.
+    """
+    momentos = np.asarray(momentos, dtype=float)
+    ciclos = np.asarray(ciclos, dtype=float)
+    tipo_tubo = np.asarray(tipo_tubo)
+    W = propriedades(tipo_tubo, largura, espessura, altura).W_solda
+    if altura is None:
+        W_lateral = W
+    else:
+        retangular = tipo_tubo == "Retangular"
+        W_lateral = propriedades(tipo_tubo, np.where(retangular, altura, largura), espessura,
+                                 np.where(retangular, largura, altura)).W_solda
+    forma = np.broadcast_shapes(momentos.shape[:-2] + momentos.shape[-1:], np.shape(W))
+    W = np.where(LATERAL[:, None], np.broadcast_to(W_lateral, forma)[..., None, :],
+                 np.broadcast_to(W, forma)[..., None, :])
+    Sut, Sy, Se = (np.expand_dims(np.asarray(v, dtype=float), -2) if np.ndim(v) else v
+                   for v in (Sut, Sy, Se))
+
+    sigma = np.abs(momentos) / W
+    estatico = iso7173.classificar_estatico(sigma, Sy, Sut)
+    N = ciclos_admissiveis(sigma, Se, a_ciclo, b_ciclo)
+    rompe = estatico == iso7173.ROMPE
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dano = np.where(rompe, np.inf, ciclos[:, None] / N)
+
+    # Dano antes de cada ensaio e ciclo (dentro dele) em que a junta chega a 1
+    acumulado = np.cumsum(dano, axis=-2)
+    dano_antes = np.concatenate([np.zeros_like(acumulado[..., :1, :]), acumulado[..., :-1, :]],
+                                axis=-2)
+    falha = (dano_antes < 1) & (dano_antes + dano >= 1)
+    with np.errstate(invalid="ignore"):
+        dentro = np.where(rompe, 1.0, np.clip(np.ceil((1 - dano_antes) * N), 1, ciclos[:, None]))
+    ciclos_antes = (np.cumsum(ciclos) - ciclos)[:, None]
+
+    falhou = falha.any(axis=-2)
+    ensaio_falha = np.where(falhou, falha.argmax(axis=-2), -1)
+    ciclo = np.take_along_axis(ciclos_antes + dentro, np.maximum(ensaio_falha, 0)[..., None, :],
+                               axis=-2)[..., 0, :]
+    ciclo_falha = np.where(falhou, ciclo, np.inf)
+    dano_total = dano.sum(axis=-2)
+    junta_critica = np.where(falhou.any(axis=-1), ciclo_falha.argmin(axis=-1),
+                             dano_total.argmax(axis=-1))
+    return ResultadoSequencia(sigma, estatico, dano, dano_total, ensaio_falha, ciclo_falha,
+                              junta_critica, ~falhou.any(axis=-1))
+
+
+def relatorio_sequencia(resultado, ciclos=CICLOS_PADRAO, juntas=JUNTAS, ensaios=ENSAIOS):
+    """Resumo em texto de uma cadeira (resultado sem eixos de lote)."""
+    j = int(resultado.junta_critica)
+    if resultado.aprovado:
+        return (f"✅ Passa na sequência completa ({int(sum(ciclos)):,} ciclos). "
+                f"Junta mais solicitada: {juntas[j]}, dano de Miner {resultado.dano_total[j]:.3g}.")
+    e = int(resultado.ensaio_falha[j])
+    ciclo = int(resultado.ciclo_falha[j])
+    dentro = ciclo - int(sum(ciclos[:e]))
+    modo = ("ruptura estática" if resultado.estatico[e, j] == iso7173.ROMPE
+            else "fadiga")
+    return (f"❌ Primeira falha: {juntas[j]}, no ensaio de {ensaios[e]} ({modo}), "
+            f"ciclo {dentro:,} de {int(ciclos[e]):,} — ciclo {ciclo:,} da sequência.")
@@ -0,0 +1,235 @@
+"""Serviço HTTP/JSON local com as verificações dos apps, para uso por código.
+
+Cada verificação de ``nucleo.lote`` vira uma rota ``POST /<verificacao>``
+que recebe um projeto (objeto JSON) ou vários (lista de objetos) com as
+mesmas colunas do lote, e devolve os mesmos campos de resultado::
+
+    python -m nucleo.servico --porta 8517
+    curl -d '{"tipo_tubo": "Quadrado", "largura": 20, "espessura": 0.9, "N": 25000}' \\
+        http://127.0.0.1:8517/iso7173
+
+O servidor é assíncrono (``asyncio``, sem dependências). Requisições que
+chegam dentro da mesma janela de alguns milissegundos são juntadas num
+só bloco e avaliadas de uma vez, de forma vetorizada, numa thread;
+requisições idênticas ainda em andamento compartilham a mesma avaliação.
+``GET /saude`` devolve as rotas e os contadores.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+from collections import defaultdict
+from http import HTTPStatus
+
+import numpy as np
+
+from nucleo.lote import VERIFICACOES
+
+PORTA = 8517
+JANELA = 0.002                # s, espera para juntar requisições num bloco
+LOTE_MAX = 4_096              # projetos por avaliação
+CORPO_MAX = 16 << 20          # bytes
+
+
+def _json(valor):
+    """Valor de numpy para JSON estrito (NaN e infinito viram null)."""
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    return valor
+
+
+def _avaliar(verificacao, linhas):
+    """Avalia projetos com as mesmas colunas; devolve um dict por projeto."""
+    bloco = {nome: [linha[nome] for linha in linhas] for nome in linhas[0]}
+    colunas = {nome: np.asarray(v).tolist()
+               for nome, v in VERIFICACOES[verificacao](bloco).items()}
+    return [{nome: _json(v[i]) for nome, v in colunas.items()} for i in range(len(linhas))]
+
+
+def _avaliar_requisicoes(verificacao, requisicoes):
+    """Avalia um bloco de requisições; cada uma recebe sua lista ou sua exceção.
+
+    Projetos com o mesmo conjunto de colunas vão juntos numa só chamada.
+    Se um grupo falhar, ele é refeito projeto a projeto para que o erro
+    fique só com a requisição que o causou.
+    """
+    grupos = defaultdict(list)
+    for r, linhas in enumerate(requisicoes):
+        for i, linha in enumerate(linhas):
+            grupos[tuple(sorted(linha))].append((r, i))
+
+    saidas = [[None] * len(linhas) for linhas in requisicoes]
+    erros = {}
+    for posicoes in grupos.values():
+        linhas = [requisicoes[r][i] for r, i in posicoes]
+        try:
+            resultados = _avaliar(verificacao, linhas)
+        except Exception:
+            resultados = []
+            for (r, _), linha in zip(posicoes, linhas):
+                try:
+                    resultados.extend(_avaliar(verificacao, [linha]))
+                except Exception as erro:
+                    erros.setdefault(r, erro)
+                    resultados.append(None)
+        for (r, i), resultado in zip(posicoes, resultados):
+            saidas[r][i] = resultado
+    return [erros.get(r, saida) for r, saida in enumerate(saidas)]
+
+
+class Avaliador:
+    """Fila de uma verificação: junta requisições e coalesce as idênticas."""
+
+    def __init__(self, verificacao, janela=JANELA, lote_max=LOTE_MAX):
+        self.verificacao = verificacao
+        self.janela = janela
+        self.lote_max = lote_max
+        self.fila = asyncio.Queue()
+        self.em_andamento = {}
+        self.requisicoes = self.coalescidas = self.avaliacoes = 0
+
+    async def avaliar(self, linhas):
+        self.requisicoes += 1
+        chave = json.dumps(linhas, sort_keys=True)
+        futuro = self.em_andamento.get(chave)
+        if futuro is None:
+            futuro = asyncio.get_running_loop().create_future()
+            self.em_andamento[chave] = futuro
+            futuro.add_done_callback(lambda _: self.em_andamento.pop(chave, None))
+            self.fila.put_nowait((linhas, futuro))
+        else:
+            self.coalescidas += 1
+        # shield: um cliente que desconecta não cancela a avaliação compartilhada
+        return await asyncio.shield(futuro)
+
+    async def executar(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            itens = [await self.fila.get()]
+            await asyncio.sleep(self.janela)
+            n = len(itens[0][0])
+            while n < self.lote_max and not self.fila.empty():
+                itens.append(self.fila.get_nowait())
+                n += len(itens[-1][0])
+            self.avaliacoes += 1
+            try:
+                resultados = await loop.run_in_executor(
+                    None, _avaliar_requisicoes, self.verificacao, [linhas for linhas, _ in itens])
+            except Exception as erro:
+                resultados = [erro] * len(itens)
+            for (_, futuro), resultado in zip(itens, resultados):
+                if futuro.done():
+                    continue
+                if isinstance(resultado, Exception):
+                    futuro.set_exception(resultado)
+                else:
+                    futuro.set_result(resultado)
+
+
+class Servico:
+    """Servidor HTTP/1.1 mínimo (keep-alive, corpo com Content-Length)."""
+
+    def __init__(self, janela=JANELA, lote_max=LOTE_MAX):
+        self.avaliadores = {nome: Avaliador(nome, janela, lote_max) for nome in VERIFICACOES}
+        self._tarefas = []
+
+    async def iniciar(self, host="127.0.0.1", porta=PORTA):
+        self._tarefas = [asyncio.create_task(a.executar()) for a in self.avaliadores.values()]
+        return await asyncio.start_server(self._atender, host, porta)
+
+    def saude(self):
+        return {nome: {"requisicoes": a.requisicoes, "coalescidas": a.coalescidas,
+                       "avaliacoes": a.avaliacoes}
+                for nome, a in self.avaliadores.items()}
+
+    async def responder(self, metodo, caminho, corpo):
+        rota = caminho.split("?", 1)[0].strip("/")
+        if rota == "saude":
+            if metodo != "GET":
+                return HTTPStatus.METHOD_NOT_ALLOWED, {"erro": "use GET"}
+            return HTTPStatus.OK, self.saude()
+        if rota not in self.avaliadores:
+            return HTTPStatus.NOT_FOUND, {"erro": f"rotas: {sorted(self.avaliadores)}"}
+        if metodo != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"erro": "use POST"}
+
+        try:
+            projetos = json.loads(corpo)
+        except ValueError as erro:
+            return HTTPStatus.BAD_REQUEST, {"erro": f"JSON inválido: {erro}"}
+        unico = isinstance(projetos, dict)
+        linhas = [projetos] if unico else projetos
+        if not (isinstance(linhas, list) and linhas and all(isinstance(p, dict) for p in linhas)):
+            return HTTPStatus.BAD_REQUEST, {"erro": "envie um objeto ou uma lista de objetos"}
+
+        try:
+            resultados = await self.avaliadores[rota].avaliar(linhas)
+        except (KeyError, ValueError, TypeError) as erro:
+            return HTTPStatus.BAD_REQUEST, {"erro": str(erro).strip("'\"")}
+        return HTTPStatus.OK, resultados[0] if unico else resultados
+
+    async def _atender(self, leitor, escritor):
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                metodo, caminho, versao = linha.decode("latin-1").split()
+                cabecalhos = {}
+                while (linha := await leitor.readline()) not in (b"\r\n", b"\n", b""):
+                    nome, _, valor = linha.decode("latin-1").partition(":")
+                    cabecalhos[nome.strip().lower()] = valor.strip()
+
+                tamanho = int(cabecalhos.get("content-length", 0))
+                if tamanho > CORPO_MAX:
+                    status = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+                    resposta = {"erro": "corpo grande demais"}
+                    fechar = True
+                else:
+                    corpo = await leitor.readexactly(tamanho)
+                    try:
+                        status, resposta = await self.responder(metodo, caminho, corpo)
+                    except Exception as erro:
+                        status, resposta = HTTPStatus.INTERNAL_SERVER_ERROR, {"erro": repr(erro)}
+                    fechar = (cabecalhos.get("connection", "").lower() == "close"
+                              or versao == "HTTP/1.0")
+
+                dados = json.dumps(resposta, ensure_ascii=False).encode("utf-8")
+                escritor.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(dados)}\r\n"
+                    f"Connection: {'close' if fechar else 'keep-alive'}\r\n\r\n".encode("latin-1")
+                    + dados)
+                await escritor.drain()
+                if fechar:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            escritor.close()
+
+
+async def servir(host="127.0.0.1", porta=PORTA, janela=JANELA, lote_max=LOTE_MAX):
+    servidor = await Servico(janela, lote_max).iniciar(host, porta)
+    print(f"Verificações em http://{host}:{porta}/ ({', '.join(VERIFICACOES)})")
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serviço HTTP/JSON local das verificações.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=PORTA)
+    parser.add_argument("--janela-ms", type=float, default=JANELA * 1_000)
+    parser.add_argument("--lote-max", type=int, default=LOTE_MAX)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(servir(args.host, args.porta, args.janela_ms / 1_000, args.lote_max))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
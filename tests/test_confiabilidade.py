@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from nucleo.confiabilidade import Normal, probabilidade_falha
+
+
+def test_normal_truncada_segue_truncnorm():
+    rng = np.random.default_rng(0)
+    x = Normal(1.0, 1.0).amostrar(rng, 200_000)
+    esperado = stats.truncnorm(-1.0, np.inf, loc=1.0, scale=1.0)
+    assert x.min() >= 0.0
+    assert x.mean() == pytest.approx(esperado.mean(), rel=5e-3)
+    assert x.std() == pytest.approx(esperado.std(), rel=5e-3)
+
+
+def test_normal_com_sinal_media_negativa():
+    x = Normal(-5000.0, 500.0, -np.inf).amostrar(np.random.default_rng(1), 100_000)
+    assert x.mean() == pytest.approx(-5000.0, rel=1e-2)
+    assert (x < 0).all()
+
+
+def test_normal_truncada_sem_massa_acima_do_corte():
+    with pytest.raises(ValueError, match="minimo"):
+        Normal(-5000.0, 500.0).amostrar(np.random.default_rng(2), 10)
+
+
+def test_normal_cauda_distante_do_corte():
+    # 4 desvios abaixo do corte: ainda amostrável, sem laço de rejeição
+    x = Normal(-4.0, 1.0).amostrar(np.random.default_rng(3), 10_000)
+    assert x.min() >= 0.0
+    assert x.mean() == pytest.approx(stats.truncnorm(4.0, np.inf, loc=-4.0).mean(), rel=2e-2)
+
+
+def test_momento_negativo_no_monte_carlo():
+    r = probabilidade_falha("goodman", dict(
+        tipo_tubo="Quadrado", dimensao=20.0, esp=Normal(0.9, 0.045),
+        M=Normal(-5000.0, 500.0, -np.inf), Sut=Normal(310.0, 15.5), Se=Normal(155.0, 12.4), n=1.0), amostras_max=50_000, semente=0)
+    assert r.amostras > 0
+
+
+def test_amostras_max_invalido():
+    with pytest.raises(ValueError):
+        probabilidade_falha("goodman", {}, amostras_max=0)
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from nucleo.forcada import PARAMETROS_PADRAO
+from nucleo.mdof import distancia_entre_eixos
+
+RAIZ = Path(__file__).resolve().parents[1]
+
+
+def test_distancia_entre_eixos():
+    assert distancia_entre_eixos(0.3, 0.1) == pytest.approx(0.2)
+    assert distancia_entre_eixos(0.1, 0.3) == pytest.approx(0.2)
+
+
+def test_geometria_degenerada_recusada():
+    with pytest.raises(ValueError, match="mesmo ponto"):
+        distancia_entre_eixos(0.1, 0.1)
+
+
+def test_padrao_da_linha_de_comando_nao_nulo():
+    assert distancia_entre_eixos(PARAMETROS_PADRAO["c"], PARAMETROS_PADRAO["d"]) > 0
+
+
+def test_padrao_da_pagina_nao_nulo():
+    at = AppTest.from_file(str(RAIZ / "Trabalho_Vibrações_Veiga.py"), default_timeout=60).run()
+    entre_eixos = next(n for n in at.number_input if n.label == "Entre-eixos (m)")
+    assert entre_eixos.value > 0
+    assert not at.warning
+
+
+def test_pagina_recusa_geometria_degenerada():
+    at = AppTest.from_file(str(RAIZ / "Trabalho_Vibrações_Veiga.py"), default_timeout=60).run()
+    next(n for n in at.sidebar.number_input if n.label == "Distância c").set_value(0.1).run()
+    assert any("Geometria degenerada" in w.value for w in at.warning)
+    next(b for b in at.button if b.label == "Simular Pista").click().run()
+    assert any("Informe o entre-eixos" in e.value for e in at.error)
+    assert not at.exception
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+RAIZ = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(params=["Tubo_Quadrado.py", "Tubo_Redondo.py"])
+def pagina(request):
+    at = AppTest.from_file(str(RAIZ / request.param), default_timeout=60)
+    at.run()
+    return at
+
+
+def _enviar(at, conteudo):
+    at.file_uploader[0].set_value(("cargas.csv", conteudo, "text/csv")).run()
+    assert not at.exception
+    return at
+
+
+def test_espectro_uma_coluna_avisa(pagina):
+    at = _enviar(pagina, b"1000\n2000\n3000\n")
+    assert any("nenhum ciclo válido" in w.value for w in at.warning)
+
+
+def test_espectro_linhas_irregulares_usa_as_validas(pagina):
+    at = _enviar(pagina, b"1000,500\n2000\n3000,100\n")
+    assert not at.warning
+    assert any(m.value.startswith("2 ciclos") for m in at.markdown)